@@ -0,0 +1,285 @@
+"""
+Synthetic inputs and benchmark cases for the properties and utilities of Path.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import shutil
+import typing
+from dataclasses import dataclass, field
+from typing import Any
+
+from superpathlib import Path
+
+if typing.TYPE_CHECKING:  # pragma: nocover
+    from collections.abc import Callable, Iterator
+
+
+@dataclass(frozen=True)
+class Scale:
+    """
+    :param file_size: size in bytes of files used by content benchmarks
+    :param number_of_files: number of files in generated trees
+    :param fanout: number of subdirectories per directory in generated trees
+    """
+
+    name: str
+    file_size: int
+    number_of_files: int
+    fanout: int = 8
+
+
+scales = {
+    scale.name: scale
+    for scale in (
+        Scale("tiny", file_size=1 << 12, number_of_files=20, fanout=2),
+        Scale("small", file_size=1 << 20, number_of_files=1_000),
+        Scale("medium", file_size=1 << 24, number_of_files=10_000),
+        Scale("large", file_size=1 << 28, number_of_files=100_000),
+    )
+}
+
+
+@dataclass
+class Operation:
+    """
+    :param run: operation to measure
+    :param setup: preparation before each run that is not measured
+    :param units: number of bytes or items processed by each run
+    """
+
+    run: Callable[[], Any]
+    setup: Callable[[], Any] | None = None
+    units: int = 1
+
+
+@dataclass(frozen=True)
+class Case:
+    """
+    :param prepare: create inputs in the given directory and return the operation
+    :param unit: unit of the processed amount to report throughput in
+    :param requires: modules or executables needed to run the case
+    """
+
+    name: str
+    prepare: Callable[[Path, Scale], Operation]
+    unit: str = "B"
+    requires: tuple[str, ...] = field(default=())
+
+    @property
+    def is_available(self) -> bool:
+        return all(
+            importlib.util.find_spec(requirement) is not None
+            or shutil.which(requirement) is not None
+            for requirement in self.requires
+        )
+
+
+def generate_bytes(size: int) -> bytes:
+    # repeated pseudo-random block to generate large inputs quickly
+    block = bytes((index * 7919) % 251 for index in range(min(size, 1 << 16)))
+    repetitions, remainder = divmod(size, len(block)) if block else (0, 0)
+    return block * repetitions + block[:remainder]
+
+
+def generate_lines(size: int) -> list[str]:
+    line = "superpathlib benchmark line with some content"
+    return [f"{index} {line}" for index in range(max(size // (len(line) + 8), 1))]
+
+
+def generate_records(size: int) -> list[dict[str, Any]]:
+    number_of_records = max(size // 64, 1)
+    return [
+        {"index": index, "name": f"record {index}", "values": [index, index / 2]}
+        for index in range(number_of_records)
+    ]
+
+
+def generate_tree(root: Path, scale: Scale) -> list[Path]:
+    """
+    Create tree with small files spread over nested directories.
+    """
+    files: list[Path] = []
+    directories = [root]
+    while len(files) < scale.number_of_files:
+        next_directories = []
+        for directory in directories:
+            directory.mkdir(parents=True, exist_ok=True)
+            for index in range(scale.fanout):
+                if len(files) < scale.number_of_files:
+                    path = directory / f"file_{index}.txt"
+                    path.byte_content = generate_bytes(64)
+                    files.append(path)
+                next_directories.append(directory / f"folder_{index}")
+        directories = next_directories
+    return files
+
+
+def read_property(name: str) -> Callable[[Path, Scale], Operation]:
+    def prepare(directory: Path, scale: Scale) -> Operation:
+        path = directory / "content"
+        write_content(path, name, scale)
+        return Operation(lambda: getattr(path, name), units=path.size)
+
+    return prepare
+
+
+def write_property(name: str) -> Callable[[Path, Scale], Operation]:
+    def prepare(directory: Path, scale: Scale) -> Operation:
+        path = directory / "content"
+        write_content(path, name, scale)
+        content = getattr(path, name)
+        return Operation(lambda: setattr(path, name, content), units=path.size)
+
+    return prepare
+
+
+def write_content(path: Path, name: str, scale: Scale) -> None:
+    if name in ("byte_content", "content_hash", "fingerprint"):
+        path.byte_content = generate_bytes(scale.file_size)
+    elif name in ("text", "lines"):
+        path.lines = generate_lines(scale.file_size)
+    elif name in ("json", "yaml"):
+        setattr(path, name, generate_records(scale.file_size))
+    else:
+        import numpy as np
+
+        path.numpy = np.frombuffer(generate_bytes(scale.file_size), dtype=np.uint8)
+
+
+def prepare_encrypted_read(directory: Path, scale: Scale) -> Operation:
+    path = (directory / "content").encrypted
+    path.byte_content = generate_bytes(scale.file_size)
+    return Operation(lambda: path.byte_content, units=scale.file_size)
+
+
+def prepare_encrypted_write(directory: Path, scale: Scale) -> Operation:
+    path = (directory / "content").encrypted
+    content = generate_bytes(scale.file_size)
+    return Operation(lambda: setattr(path, "byte_content", content), units=len(content))
+
+
+def prepare_tail(directory: Path, scale: Scale) -> Operation:
+    path = directory / "content"
+    write_content(path, "lines", scale)
+    return Operation(lambda: path.tail(10), units=10)
+
+
+def prepare_line(directory: Path, scale: Scale) -> Operation:
+    path = directory / "content"
+    write_content(path, "lines", scale)
+    with path.line_index() as index:
+        number_of_lines = len(index)
+    numbers = [index * 7919 % number_of_lines for index in range(100)]
+
+    def run() -> None:
+        for number in numbers:
+            path.line(number)
+
+    return Operation(run, units=len(numbers))
+
+
+def prepare_find(directory: Path, scale: Scale) -> Operation:
+    files = generate_tree(directory / "tree", scale)
+    root = directory / "tree"
+    return Operation(lambda: sum(1 for _ in root.find()), units=len(files))
+
+
+def prepare_tree_hash(directory: Path, scale: Scale) -> Operation:
+    files = generate_tree(directory / "tree", scale)
+    root = directory / "tree"
+    return Operation(lambda: root.content_hash, units=len(files))
+
+
+def prepare_tree_fingerprint(directory: Path, scale: Scale) -> Operation:
+    files = generate_tree(directory / "tree", scale)
+    root = directory / "tree"
+    return Operation(lambda: root.fingerprint, units=len(files))
+
+
+def prepare_read_many(directory: Path, scale: Scale) -> Operation:
+    files = generate_tree(directory / "tree", scale)
+
+    def run() -> None:
+        for _ in Path.read_many(files, "byte_content"):
+            pass
+
+    return Operation(run, units=len(files))
+
+
+def prepare_write_many(directory: Path, scale: Scale) -> Operation:
+    template = directory / "template"
+    files = generate_tree(template, scale)
+    root = directory / "tree"
+    contents = {root / path.relative_to(template): path.byte_content for path in files}
+    return Operation(
+        lambda: Path.write_many(contents),
+        setup=lambda: root.rmtree(missing_ok=True),
+        units=len(files),
+    )
+
+
+def prepare_rmtree(directory: Path, scale: Scale) -> Operation:
+    template = directory / "template"
+    files = generate_tree(template, scale)
+    root = directory / "tree"
+
+    def setup() -> None:
+        shutil.copytree(template, root)
+
+    return Operation(root.rmtree, setup=setup, units=len(files))
+
+
+def prepare_copy(directory: Path, scale: Scale) -> Operation:
+    source = directory / "source"
+    source.byte_content = generate_bytes(scale.file_size)
+    destination = directory / "destination"
+    return Operation(lambda: source.copy_to(destination), units=scale.file_size)
+
+
+def prepare_unpack(directory: Path, scale: Scale) -> Operation:
+    files = generate_tree(directory / "tree", scale)
+    archive_name = shutil.make_archive(
+        str(directory / "archive"),
+        "zip",
+        directory / "tree",
+    )
+    archive = Path(archive_name)
+    extraction_directory = directory / "extracted"
+
+    def run() -> None:
+        archive.unpack(extraction_directory, remove_original=False, recursive=False)
+
+    return Operation(run, units=len(files))
+
+
+def generate_cases() -> Iterator[Case]:
+    for name in ("byte_content", "text", "lines", "json", "yaml", "numpy"):
+        requires = (
+            ("yaml",) if name == "yaml" else ("numpy",) if name == "numpy" else ()
+        )
+        yield Case(f"read {name}", read_property(name), requires=requires)
+        yield Case(f"write {name}", write_property(name), requires=requires)
+    yield Case("content_hash file", read_property("content_hash"))
+    yield Case("fingerprint file", read_property("fingerprint"))
+    yield Case("tail", prepare_tail, unit="lines")
+    yield Case("line", prepare_line, unit="lines")
+    yield Case(
+        "content_hash tree",
+        prepare_tree_hash,
+        unit="files",
+        requires=("dirhash",),
+    )
+    yield Case("fingerprint tree", prepare_tree_fingerprint, unit="files")
+    yield Case("read_many", prepare_read_many, unit="files")
+    yield Case("write_many", prepare_write_many, unit="files")
+    yield Case("find", prepare_find, unit="files")
+    yield Case("rmtree", prepare_rmtree, unit="files")
+    yield Case("copy_to", prepare_copy)
+    yield Case("unpack", prepare_unpack, unit="files")
+    yield Case("read encrypted", prepare_encrypted_read, requires=("gpg",))
+    yield Case("write encrypted", prepare_encrypted_write, requires=("gpg",))
+
+
+cases = list(generate_cases())
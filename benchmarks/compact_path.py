@@ -0,0 +1,93 @@
+"""
+Compare construction, joining, attribute access and memory of Path variants.
+
+Usage: python -m benchmarks.compact_path [--number 100000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+import tracemalloc
+import typing
+
+from superpathlib import Path
+from superpathlib.compact import CompactPath
+
+if typing.TYPE_CHECKING:  # pragma: nocover
+    from collections.abc import Callable
+
+variants = {"Path": Path, "CompactPath": CompactPath}
+
+
+def generate_operations(cls: type[Path]) -> dict[str, Callable[[], object]]:
+    path = cls("/tmp/superpathlib/benchmark.txt")  # noqa: S108
+    path.archive_format  # noqa: B018
+    return {
+        "construct": lambda: cls("/tmp", "superpathlib", "benchmark.txt"),  # noqa: S108
+        "join": lambda: path / "child",
+        "property": lambda: path.name,
+        "cached property": lambda: path.archive_format,
+        "method": lambda: path.with_nonexistent_name,
+    }
+
+
+def measure_operation(
+    operation: Callable[[], object],
+    *,
+    number: int,
+    repeat: int,
+) -> float:
+    """
+    :return: best time per call in nanoseconds
+    """
+    timings = timeit.repeat(operation, number=number, repeat=repeat)
+    return min(timings) / number * 1e9
+
+
+def measure_memory(cls: type[Path], number: int) -> float:
+    """
+    :return: traced memory per instance in bytes including the parts list
+    """
+    names = [f"/tmp/superpathlib/{index}" for index in range(number)]  # noqa: S108
+    # warmup to exclude the parts that pathlib interns on first use
+    paths = [cls(name) for name in names]
+    tracemalloc.start()
+    try:
+        paths = [cls(name) for name in names]
+        memory, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(paths) == number  # noqa: S101
+    return memory / number
+
+
+def main(arguments: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(arguments)
+
+    operations = {name: generate_operations(cls) for name, cls in variants.items()}
+    names = " ".join(f"{name:>12}" for name in variants)
+    print(f"{'operation':<16} {names}")  # noqa: T201
+    for operation_name in operations["Path"]:
+        timings = (
+            measure_operation(
+                operations[name][operation_name],
+                number=args.number,
+                repeat=args.repeat,
+            )
+            for name in variants
+        )
+        values = " ".join(f"{timing:>9.1f} ns" for timing in timings)
+        print(f"{operation_name:<16} {values}")  # noqa: T201
+    memory = (measure_memory(cls, args.number) for cls in variants.values())
+    values = " ".join(f"{value:>10.1f} B" for value in memory)
+    print(f"{'memory':<16} {values}")  # noqa: T201
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":  # pragma: nocover
+    main()
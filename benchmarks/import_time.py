@@ -0,0 +1,50 @@
+"""
+Measure the cumulative import time of superpathlib in fresh interpreters.
+
+Usage: python benchmarks/import_time.py [--runs 20] [--max-ms 50]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+
+def measure_import_time(module: str = "superpathlib") -> float:
+    """
+    :return: cumulative import time of module in milliseconds
+    """
+    command = (sys.executable, "-X", "importtime", "-c", f"import {module}")
+    result = subprocess.run(command, capture_output=True, text=True, check=True)  # noqa: S603
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative) / 1000
+    message = f"No import time reported for {module}"
+    raise ValueError(message)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--module", default="superpathlib")
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        help="fail if the median import time exceeds this value",
+    )
+    args = parser.parse_args()
+
+    timings = [measure_import_time(args.module) for _ in range(args.runs)]
+    median = statistics.median(timings)
+    print(  # noqa: T201
+        f"import {args.module}: median {median:.1f} ms, "
+        f"min {min(timings):.1f} ms, max {max(timings):.1f} ms "
+        f"over {args.runs} runs",
+    )
+    if args.max_ms is not None and median > args.max_ms:
+        sys.exit(f"Median import time exceeds {args.max_ms} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Run benchmarks of Path properties and utilities on synthetic inputs.
+
+Usage: python -m benchmarks.suite [--scale small] [--filter read] [--runs 5]
+                                  [--save baseline.json] [--compare baseline.json]
+
+Results report latency, throughput and peak traced memory of each case. Results
+can be stored as baseline and compared against later runs to flag regressions.
+Baselines are only comparable on the same machine and scale.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+
+from superpathlib import Path
+
+from .cases import Case, Scale, cases, scales
+
+if TYPE_CHECKING:  # pragma: nocover
+    from collections.abc import Iterable, Iterator
+
+
+@dataclass(frozen=True)
+class Result:
+    name: str
+    scale: str
+    runs: int
+    median_ms: float
+    p95_ms: float
+    throughput: float
+    unit: str
+    peak_memory: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.scale}/{self.name}"
+
+    def format(self) -> str:
+        return (
+            f"{self.name:<24} {self.median_ms:>10.3f} ms {self.p95_ms:>10.3f} ms "
+            f"{format_amount(self.throughput)}{self.unit}/s "
+            f"{format_amount(self.peak_memory)}B peak"
+        )
+
+
+@dataclass(frozen=True)
+class Regression:
+    result: Result
+    baseline: Result
+    metric: str
+
+    def format(self) -> str:
+        value = getattr(self.result, self.metric)
+        baseline_value = getattr(self.baseline, self.metric)
+        return (
+            f"Regression in {self.result.key}: {self.metric} {value:.3f} "
+            f"vs baseline {baseline_value:.3f}"
+        )
+
+
+def format_amount(amount: float) -> str:
+    prefixes = ("", "K", "M", "G")
+    exponent = 0
+    while amount >= 1024 and exponent < len(prefixes) - 1:  # noqa: PLR2004
+        amount /= 1024
+        exponent += 1
+    return f"{amount:>8.1f} {prefixes[exponent]}"
+
+
+def run_case(case: Case, scale: Scale, runs: int) -> Result:
+    """
+    Measure latency over several runs and peak memory over an additional run.
+    """
+    with Path.tempdir() as directory:
+        operation = case.prepare(directory, scale)
+        timings = []
+        for _ in range(runs + 1):
+            if operation.setup is not None:
+                operation.setup()
+            start = time.perf_counter()
+            operation.run()
+            timings.append(time.perf_counter() - start)
+
+        if operation.setup is not None:
+            operation.setup()
+        tracemalloc.start()
+        try:
+            operation.run()
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    # first run is a warmup
+    timings = sorted(timings[1:])
+    median = statistics.median(timings)
+    p95 = timings[min(round(0.95 * (len(timings) - 1)), len(timings) - 1)]
+    return Result(
+        case.name,
+        scale.name,
+        runs,
+        median * 1000,
+        p95 * 1000,
+        operation.units / median if median else 0.0,
+        case.unit,
+        peak_memory,
+    )
+
+
+def run_suite(
+    scale: Scale,
+    *,
+    runs: int = 5,
+    selection: str | None = None,
+) -> Iterator[Result]:
+    """
+    :param selection: only run cases with a name that contains this value
+    """
+    os.environ.setdefault("FILE_ENCRYPTION_PASSWORD", "benchmark")
+    for case in cases:
+        if (selection is None or selection in case.name) and case.is_available:
+            yield run_case(case, scale, runs)
+
+
+def save_results(results: Iterable[Result], path: Path) -> None:
+    path.json = {result.key: asdict(result) for result in results}
+
+
+def load_results(path: Path) -> dict[str, Result]:
+    content = path.json
+    assert isinstance(content, dict)  # noqa: S101
+    return {key: Result(**values) for key, values in content.items()}
+
+
+def compare(
+    results: Iterable[Result],
+    baselines: dict[str, Result],
+    tolerance: float = 0.2,
+) -> Iterator[Regression]:
+    """
+    :param tolerance: relative increase of latency or memory that is accepted
+    """
+    for result in results:
+        baseline = baselines.get(result.key)
+        if baseline is not None:
+            for metric in ("median_ms", "peak_memory"):
+                limit = getattr(baseline, metric) * (1 + tolerance)
+                if getattr(result, metric) > limit:
+                    yield Regression(result, baseline, metric)
+
+
+def main(arguments: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--scale", choices=scales, default="small")
+    parser.add_argument("--filter", dest="selection")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--save", type=Path, help="store results as baseline")
+    parser.add_argument("--compare", type=Path, help="baseline to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(arguments)
+
+    results = []
+    for result in run_suite(
+        scales[args.scale],
+        runs=args.runs,
+        selection=args.selection,
+    ):
+        print(result.format())  # noqa: T201
+        results.append(result)
+    if args.save is not None:
+        save_results(results, args.save)
+    if args.compare is not None:
+        regressions = list(compare(results, load_results(args.compare), args.tolerance))
+        for regression in regressions:
+            print(regression.format())  # noqa: T201
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":  # pragma: nocover
+    main()
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import os
+import pathlib
+import typing
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property, partial
+from typing import Any, Generic, TypeVar
+
+if typing.TYPE_CHECKING:  # pragma: nocover
+    from collections.abc import AsyncIterator, Callable, Iterator
+
+PathT = TypeVar("PathT", bound=pathlib.Path)
+T = TypeVar("T")
+
+default_max_workers = 8
+default_batch_size = 16
+default_buffer_size = 256
+
+
+@dataclass
+class Settings:
+    max_workers: int = default_max_workers
+    batch_size: int = default_batch_size
+    buffer_size: int = default_buffer_size
+    executor: Executor | None = None
+    default_executor: ThreadPoolExecutor | None = field(default=None, init=False)
+
+    def get_executor(self) -> Executor:
+        if self.executor is not None:
+            return self.executor
+        if self.default_executor is None:
+            self.default_executor = ThreadPoolExecutor(
+                self.max_workers,
+                thread_name_prefix="superpathlib",
+            )
+        return self.default_executor
+
+    def close(self) -> None:
+        """
+        Shut down the default executor after running calls complete.
+
+        Executors that are passed in are owned by the caller and stay usable.
+        """
+        if self.default_executor is not None:
+            self.default_executor.shutdown(wait=False)
+
+
+settings = Settings()
+
+
+def configure(
+    *,
+    max_workers: int = default_max_workers,
+    batch_size: int = default_batch_size,
+    buffer_size: int = default_buffer_size,
+    executor: Executor | None = None,
+) -> None:
+    """
+    Configure the executor that runs blocking filesystem work for async calls.
+
+    :param max_workers: number of threads of the default executor and number of
+        jobs that concurrent calls are spread over
+    :param batch_size: maximum number of calls that are run in one executor job
+    :param buffer_size: maximum number of results buffered by streaming calls
+    :param executor: executor to use instead of the default thread pool
+    """
+    global settings  # noqa: PLW0603
+    settings.close()
+    settings = Settings(max_workers, batch_size, buffer_size, executor)
+    batchers.clear()
+
+
+Call = tuple["Callable[[], Any]", "asyncio.Future[Any]"]
+Key = tuple[str, str]
+
+
+@dataclass
+class Batcher:
+    """
+    Dispatch blocking calls to the executor in batches.
+
+    Calls submitted during the same event loop iteration are split in batches
+    that each run in a single executor job to reduce thread handoffs. Calls are
+    only combined when there are more calls than workers so that all workers
+    are used. Identical reads that are in flight are shared.
+    """
+
+    loop: asyncio.AbstractEventLoop
+    executor: Executor
+    batch_size: int
+    max_workers: int
+    pending: list[Call] = field(default_factory=list)
+    in_flight: dict[Key, asyncio.Future[Any]] = field(default_factory=dict)
+
+    async def run(self, function: Callable[[], T], key: Key | None = None) -> T:
+        """
+        :param key: path and property name to share results of concurrent reads
+        """
+        future = None if key is None else self.in_flight.get(key)
+        if future is None:
+            future = self.loop.create_future()
+            if not self.pending:
+                self.loop.call_soon(self.flush)
+            self.pending.append((function, future))
+            if key is not None:
+                self.in_flight[key] = future
+                future.add_done_callback(partial(self.remove_in_flight, key))
+        # cancelling one caller does not cancel the call shared by others
+        return typing.cast("T", await asyncio.shield(future))
+
+    def remove_in_flight(self, key: Key, future: asyncio.Future[Any]) -> None:
+        if self.in_flight.get(key) is future:
+            del self.in_flight[key]
+
+    def invalidate(self, path: str) -> None:
+        """
+        Stop sharing in-flight reads of path that started before a write.
+        """
+        for key in [key for key in self.in_flight if key[0] == path]:
+            del self.in_flight[key]
+
+    def flush(self) -> None:
+        calls, self.pending = self.pending, []
+        calls_per_worker = -(-len(calls) // self.max_workers)
+        size = min(self.batch_size, calls_per_worker)
+        for start in range(0, len(calls), size):
+            batch = calls[start : start + size]
+            self.executor.submit(self.run_batch, batch)
+
+    def run_batch(self, calls: list[Call]) -> None:
+        for function, future in calls:
+            self.run_call(function, future)
+
+    def run_call(
+        self,
+        function: Callable[[], Any],
+        future: asyncio.Future[Any],
+    ) -> None:
+        try:
+            result = function()
+        except Exception as exception:  # noqa: BLE001
+            self.loop.call_soon_threadsafe(set_exception, future, exception)
+        else:
+            self.loop.call_soon_threadsafe(set_result, future, result)
+
+
+def set_result(future: asyncio.Future[T], result: T) -> None:
+    if not future.done():
+        future.set_result(result)
+
+
+def set_exception(future: asyncio.Future[Any], exception: Exception) -> None:
+    if not future.done():
+        future.set_exception(exception)
+
+
+batchers: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Batcher] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_batcher() -> Batcher:
+    loop = asyncio.get_running_loop()
+    batcher = batchers.get(loop)
+    if batcher is None:
+        executor = settings.get_executor()
+        batcher = batchers[loop] = Batcher(
+            loop,
+            executor,
+            settings.batch_size,
+            settings.max_workers,
+        )
+    return batcher
+
+
+async def stream(items: Callable[[], Iterator[T]]) -> AsyncIterator[T]:
+    """
+    Iterate in executor jobs and yield items while the next chunk is produced.
+
+    Each job produces a bounded chunk and returns, so that streams never occupy
+    a worker while the consumer is waiting for other calls. Production stops
+    when the consumer stops iterating.
+    """
+    loop = asyncio.get_running_loop()
+    executor = settings.get_executor()
+    # the chunk that is consumed and the chunk that is produced fit the buffer
+    chunk_size = max(settings.buffer_size // 2, 1)
+    iterator: Iterator[T] | None = None
+
+    def produce() -> list[T]:
+        nonlocal iterator
+        if iterator is None:
+            iterator = items()
+        return list(itertools.islice(iterator, chunk_size))
+
+    future = loop.run_in_executor(executor, produce)
+    try:
+        while True:
+            chunk = await future
+            if len(chunk) == chunk_size:
+                future = loop.run_in_executor(executor, produce)
+            for item in chunk:
+                yield item
+            if len(chunk) < chunk_size:
+                return
+    finally:
+        future.cancel()
+
+
+@dataclass(frozen=True)
+class AsyncPath(Generic[PathT]):
+    """
+    Async facade that runs blocking filesystem work on a bounded executor.
+
+    Properties are awaited directly and set with write_<property>:
+    - await path.aio.text
+    - await path.aio.write_json(content)
+    Other methods of the path are exposed as coroutine functions and traversals
+    stream their results while the tree is scanned.
+    """
+
+    path: PathT
+
+    async def read(self, name: str) -> Any:
+        """
+        Read property of path in executor.
+        """
+        key = os.fspath(self.path), name
+        return await get_batcher().run(partial(getattr, self.path, name), key)
+
+    async def write(self, name: str, value: Any) -> None:
+        """
+        Set property of path in executor.
+        """
+        batcher = get_batcher()
+        batcher.invalidate(os.fspath(self.path))
+        await batcher.run(partial(setattr, self.path, name, value))
+
+    async def call(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Call method of path in executor.
+        """
+        batcher = get_batcher()
+        batcher.invalidate(os.fspath(self.path))
+        method = getattr(self.path, name)
+        return await batcher.run(partial(method, *args, **kwargs))
+
+    def find(self, *args: Any, **kwargs: Any) -> AsyncIterator[PathT]:
+        return stream(partial(self.path.find, *args, **kwargs))  # type: ignore[attr-defined]
+
+    def iterdir(self) -> AsyncIterator[PathT]:
+        return stream(self.path.iterdir)
+
+    def glob(self, pattern: str) -> AsyncIterator[PathT]:
+        return stream(partial(self.path.glob, pattern))
+
+    def rglob(self, pattern: str) -> AsyncIterator[PathT]:
+        return stream(partial(self.path.rglob, pattern))
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(type(self.path), name, None)
+        if isinstance(attribute, property | cached_property):
+            return self.read(name)
+        if attribute is not None and callable(attribute):
+            return partial(self.call, name)
+        property_name = name.removeprefix("write_")
+        attribute = getattr(type(self.path), property_name, None)
+        if name.startswith("write_") and isinstance(attribute, property):
+            return partial(self.write, property_name)
+        message = f"{type(self.path).__name__!r} has no attribute {name!r}"
+        raise AttributeError(message)
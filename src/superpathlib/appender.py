@@ -0,0 +1,163 @@
+"""
+Buffered appends to files with optional size-based rollover.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import threading
+import typing
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+
+if typing.TYPE_CHECKING:  # pragma: nocover
+    from collections.abc import Iterable
+    from types import TracebackType
+    from typing import IO, Any
+
+    from typing_extensions import Self
+
+    from .content_properties import Path
+
+
+@dataclass
+class Appender:
+    """
+    Long-lived writer that appends to a file without rewriting its content.
+
+    Writes are collected in a buffer that is appended to the file when it
+    exceeds buffer_size, on flush and on close. Content of compressed paths is
+    appended as additional compressed members.
+
+    :param max_size: size on disk after which the file is rolled over before
+        appending. The file is renamed to a numbered backup like name.1.log
+        and older backups are shifted up to backups.
+    :param backups: number of rolled over files to keep
+    """
+
+    path: Path
+    max_size: int | None = None
+    backups: int = 1
+    buffer_size: int = io.DEFAULT_BUFFER_SIZE
+    buffer: bytearray = field(default_factory=bytearray, init=False)
+    lock: threading.RLock = field(default_factory=threading.RLock, init=False)
+    stack: ExitStack | None = field(default=None, init=False)
+    stream: IO[Any] | None = field(default=None, init=False)
+    size: int = field(default=0, init=False)
+    # whether a newline is needed before the next line
+    separate_line: bool | None = field(default=None, init=False)
+    # whether the buffer starts with a newline that separates it from the file
+    leading_separator: bool = field(default=False, init=False)
+
+    def write_bytes(self, data: bytes) -> None:
+        with self.lock:
+            self.buffer += data
+            if data:
+                self.separate_line = not data.endswith(b"\n")
+            if len(self.buffer) >= self.buffer_size:
+                self.flush()
+
+    def write_text(self, text: str) -> None:
+        self.write_bytes(text.encode())
+
+    def write_lines(self, lines: Iterable[Any]) -> None:
+        """
+        Append lines that are separated by newlines from existing content.
+        """
+        with self.lock:
+            if self.separate_line is None:
+                self.separate_line = self.needs_separator()
+            for line in lines:
+                separator = "\n" if self.separate_line else ""
+                if separator and not self.buffer:
+                    self.leading_separator = True
+                self.write_text(f"{separator}{line}")
+                self.separate_line = True
+
+    def write_line(self, line: Any) -> None:
+        self.write_lines((line,))
+
+    def flush(self) -> None:
+        with self.lock:
+            if not self.buffer:
+                return
+            if self.should_roll_over(len(self.buffer)):
+                self.roll_over()
+            stream = self.open_stream()
+            stream.write(self.buffer)
+            stream.flush()
+            self.buffer.clear()
+            self.leading_separator = False
+            if self.max_size is not None:
+                self.size = get_size(self.path)
+
+    def close(self) -> None:
+        with self.lock:
+            self.flush()
+            self.close_stream()
+
+    def open_stream(self) -> IO[Any]:
+        if self.stream is None:
+            self.stack = ExitStack()
+            self.stream = self.stack.enter_context(self.path.open_content("ab"))
+            self.size = get_size(self.path)
+        return self.stream
+
+    def close_stream(self) -> None:
+        if self.stack is not None:
+            self.stack.close()
+        self.stack = self.stream = None
+
+    def needs_separator(self) -> bool:
+        if not get_size(self.path):
+            return False
+        if self.path.is_compressed:
+            # content written by lines and appenders does not end with newline
+            return True
+        with self.path.open("rb") as file:
+            file.seek(-1, os.SEEK_END)
+            return file.read(1) != b"\n"
+
+    def should_roll_over(self, amount: int) -> bool:
+        if self.max_size is None:
+            return False
+        if self.stream is None:
+            self.size = get_size(self.path)
+        return self.size > 0 and self.size + amount > self.max_size
+
+    def roll_over(self) -> None:
+        self.close_stream()
+        for index in reversed(range(1, self.backups)):
+            backup = self.backup_path(index)
+            if backup.exists():
+                backup.replace(self.backup_path(index + 1))
+        if self.backups:
+            self.path.replace(self.backup_path(1))
+        else:
+            self.path.unlink()
+        self.size = 0
+        if self.leading_separator:
+            del self.buffer[0]
+            self.leading_separator = False
+
+    def backup_path(self, index: int) -> Path:
+        return self.path.with_name(f"{self.path.stem}.{index}{self.path.suffix}")
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def get_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
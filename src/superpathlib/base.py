@@ -8,6 +8,9 @@ class Path(pathlib.Path):  # pragma: nocover
     Extend pathlib functionality and enable further extensions by inheriting.
     """
 
+    # subclasses can omit the instance dictionary by declaring slots
+    __slots__ = ()
+
     # _flavour attribute explicitly required to inherit from pathlib
     if sys.version_info < (3, 12):
         _flavour = (
@@ -0,0 +1,210 @@
+"""
+Read and write content of many paths concurrently.
+"""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import threading
+import typing
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Generic, TypeVar
+
+from .directory_cache import create_directory
+from .tag_index import update_indices
+from .tags import set_tags
+from .utils import map_concurrently
+
+if typing.TYPE_CHECKING:  # pragma: nocover
+    from collections.abc import Iterable, Iterator, Mapping
+
+    from .tags import Values
+
+PathT = TypeVar("PathT", bound=pathlib.Path)
+PathLikeT = TypeVar("PathLikeT", bound="str | os.PathLike[str]")
+
+content_formats = (
+    "byte_content",
+    "text",
+    "lines",
+    "content_lines",
+    "json",
+    "yaml",
+    "numpy",
+)
+# maximum number of paths sent to a worker process at once
+max_chunk_size = 64
+
+
+@dataclass(frozen=True)
+class ReadResult(Generic[PathT]):
+    """
+    :param content: decoded content or None if reading failed
+    :param error: exception raised while reading or decoding
+    """
+
+    path: PathT
+    content: Any = None
+    error: Exception | None = None
+
+    @property
+    def is_success(self) -> bool:
+        return self.error is None
+
+
+def read_many(  # noqa: PLR0913
+    path_class: type[PathT],
+    paths: Iterable[str | os.PathLike[str]],
+    content_format: str,
+    *,
+    workers: int | None = None,
+    processes: bool = False,
+    ordered: bool = True,
+) -> Iterator[ReadResult[PathT]]:
+    check_format(content_format)
+    path_objects = [as_path(path_class, path) for path in paths]
+    read = partial(read_chunk, content_format)
+    if workers == 1 and not processes:
+        yield from read(path_objects)
+        return
+    executor: Executor
+    if processes:
+        executor = ProcessPoolExecutor(workers)
+        number_of_workers = workers or os.cpu_count() or 1
+        # tasks are batched to limit interprocess communication
+        chunk_size = len(path_objects) // (4 * number_of_workers)
+        chunk_size = min(max(chunk_size, 1), max_chunk_size)
+    else:
+        executor = ThreadPoolExecutor(workers)
+        chunk_size = 1
+    try:
+        futures = [
+            executor.submit(read, path_objects[start : start + chunk_size])
+            for start in range(0, len(path_objects), chunk_size)
+        ]
+        results: Iterable[Future[list[ReadResult[PathT]]]] = (
+            futures if ordered else as_completed(futures)
+        )
+        for future in results:
+            yield from future.result()
+    finally:
+        # stop reading when the results are not consumed anymore
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def read_chunk(content_format: str, paths: list[PathT]) -> list[ReadResult[PathT]]:
+    return [read_content(path, content_format) for path in paths]
+
+
+def read_content(path: PathT, content_format: str) -> ReadResult[PathT]:
+    try:
+        content = getattr(path, content_format)
+    except Exception as exception:  # noqa: BLE001
+        return ReadResult(path, error=exception)
+    return ReadResult(path, content)
+
+
+def write_many(  # noqa: PLR0913
+    path_class: type[PathT],
+    contents: Mapping[PathLikeT, Any],
+    content_format: str,
+    *,
+    atomic: bool = False,
+    mtimes: Mapping[PathLikeT, float] | None = None,
+    tags: Mapping[PathLikeT, Values] | None = None,
+    workers: int | None = None,
+) -> None:
+    check_format(content_format)
+    items = [
+        (
+            as_path(path_class, path),
+            content,
+            mtimes.get(path) if mtimes else None,
+            tags.get(path) if tags else None,
+        )
+        for path, content in contents.items()
+    ]
+    # each directory is created once instead of after a failed open per file
+    for parent in {item[0].parent for item in items}:
+        create_directory(parent)
+
+    def write(item: tuple[PathT, Any, float | None, Values | None]) -> list[str] | None:
+        path, content, mtime, path_tags = item
+        return write_content(
+            path,
+            content,
+            content_format,
+            atomic=atomic,
+            mtime=mtime,
+            tags=path_tags,
+        )
+
+    stored_tags = map_concurrently(write, items, workers)
+    for item, path_tags in zip(items, stored_tags, strict=True):
+        if path_tags is not None:
+            update_indices(item[0], path_tags)
+
+
+def write_content(  # noqa: PLR0913
+    path: PathT,
+    content: Any,
+    content_format: str,
+    *,
+    atomic: bool,
+    mtime: float | None,
+    tags: Values | None,
+) -> list[str] | None:
+    """
+    Write content and metadata to a temporary file that replaces path if atomic.
+
+    :return: tags as they are stored
+    """
+    if not atomic:
+        return write_content_and_metadata(path, content, content_format, mtime, tags)
+    # keep the suffix because it determines compression
+    token = f"{os.getpid()}-{threading.get_ident()}"
+    temporary_path = path.with_name(f".{path.stem}.{token}.tmp{path.suffix}")
+    try:
+        stored_tags = write_content_and_metadata(
+            temporary_path,
+            content,
+            content_format,
+            mtime,
+            tags,
+        )
+        os.replace(temporary_path, path)  # noqa: PTH105
+    finally:
+        temporary_path.unlink(missing_ok=True)
+    return stored_tags
+
+
+def write_content_and_metadata(
+    path: PathT,
+    content: Any,
+    content_format: str,
+    mtime: float | None,
+    tags: Values | None,
+) -> list[str] | None:
+    setattr(path, content_format, content)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return None if tags is None else set_tags(path, tags)
+
+
+def as_path(path_class: type[PathT], path: str | os.PathLike[str]) -> PathT:
+    return path if isinstance(path, path_class) else path_class(path)
+
+
+def check_format(content_format: str) -> None:
+    if content_format not in content_formats:
+        message = f"Unsupported format {content_format!r}, use one of {content_formats}"
+        raise ValueError(message)
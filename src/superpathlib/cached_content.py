@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import typing
-from functools import cached_property
+from functools import cache, cached_property
 from typing import Any, TypeVar
 
 from . import metadata_properties
@@ -9,9 +9,38 @@ from . import metadata_properties
 if typing.TYPE_CHECKING:  # pragma: nocover
     from package_utils.storage import CachedFileContent
 
+    from .watch import Subscription
+
 T = TypeVar("T")
 
 
+@cache
+def watched_file_content_class() -> Any:
+    from dataclasses import dataclass
+
+    from package_utils.storage import CachedFileContent
+
+    @dataclass
+    class WatchedFileContent(CachedFileContent[T]):
+        """
+        Cached content invalidated by change events instead of mtime checks.
+
+        The mtime is checked again when the subscription to change events fails.
+        """
+
+        changed: bool = False
+        subscription: Subscription[Any] | None = None
+
+        @property
+        def file_content_changed(self) -> bool:
+            changed, self.changed = self.changed, False
+            if self.subscription is not None and self.subscription.failed:
+                changed |= super().file_content_changed
+            return changed
+
+    return WatchedFileContent
+
+
 class Path(metadata_properties.Path):
     """
     Properties for cached file content.
@@ -28,6 +57,32 @@ class Path(metadata_properties.Path):
 
         return CachedFileContent(self, default=default)  # type: ignore[arg-type]
 
+    @cached_property
+    def watched_content(self) -> CachedFileContent[dict[str, str]]:
+        return self.create_watched_content(default={})
+
+    def create_watched_content(self, default: T) -> CachedFileContent[T]:
+        """
+        Cached content that does not check the mtime on every access.
+
+        The content is reloaded after a change event of the path. The path is
+        not watched anymore once the content is garbage collected.
+        """
+        import weakref
+
+        content = watched_file_content_class()(self, default=default)
+        content_reference = weakref.ref(content)
+
+        def invalidate(_: Any) -> None:
+            watched_content = content_reference()
+            if watched_content is not None:
+                watched_content.changed = True
+
+        subscription = self.subscribe(invalidate, recursive=False)  # type: ignore[attr-defined]
+        content.subscription = subscription
+        weakref.finalize(content, subscription.cancel)
+        return typing.cast("CachedFileContent[T]", content)
+
     @cached_property
     def cached_text(self) -> CachedFileContent[str]:
         from package_utils.storage import CachedFileContent
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import sqlite3
+import stat
+import typing
+from typing import Any, Generic, Literal, TypeVar
+
+if typing.TYPE_CHECKING:  # pragma: nocover
+    from collections.abc import Iterator
+    from types import TracebackType
+
+PathT = TypeVar("PathT", bound=pathlib.Path)
+
+schema = """
+CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS directories (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    directory INTEGER NOT NULL REFERENCES directories(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    suffix TEXT NOT NULL,
+    is_directory INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    tag TEXT,
+    PRIMARY KEY (directory, name)
+);
+CREATE INDEX IF NOT EXISTS entries_suffix ON entries(suffix);
+CREATE INDEX IF NOT EXISTS entries_size ON entries(size);
+CREATE INDEX IF NOT EXISTS entries_mtime ON entries(mtime_ns);
+CREATE INDEX IF NOT EXISTS entries_tag ON entries(tag);
+"""
+
+
+class Catalog(Generic[PathT]):
+    """
+    Persistent index of all subpaths under a root stored in a SQLite database.
+
+    Refreshing only lists directories with a changed mtime. Changes that do
+    not modify the mtime of the parent directory, like content or tag changes
+    of existing files, are only picked up with a full refresh.
+    """
+
+    def __init__(
+        self,
+        root: PathT,
+        database: str | os.PathLike[str],
+        *,
+        include_tags: bool = False,
+    ) -> None:
+        self.root = root
+        self.include_tags = include_tags
+        self.connection = sqlite3.connect(database)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(schema)
+        self.verify_root()
+
+    def verify_root(self) -> None:
+        root = str(self.root)
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO metadata VALUES ('root', ?)",
+                (root,),
+            )
+        row = self.connection.execute(
+            "SELECT value FROM metadata WHERE key = 'root'",
+        ).fetchone()
+        if row[0] != root:
+            message = f"Catalog database was created for {row[0]}"
+            raise ValueError(message)
+
+    def refresh(self, *, full: bool = False) -> None:
+        """
+        Update the catalog with the current state of the filesystem.
+
+        :param full: list all directories instead of only the changed ones
+        """
+        stored = {
+            path: (directory_id, mtime_ns)
+            for directory_id, path, mtime_ns in self.connection.execute(
+                "SELECT id, path, mtime_ns FROM directories",
+            )
+        }
+        visited = set()
+        to_visit = [""]
+        with self.connection:
+            while to_visit:
+                relative_path = to_visit.pop()
+                try:
+                    mtime_ns = (self.root / relative_path).stat().st_mtime_ns
+                except (FileNotFoundError, NotADirectoryError):
+                    continue
+                visited.add(relative_path)
+                directory_id, stored_mtime_ns = stored.get(relative_path, (None, None))
+                if directory_id is None or full or mtime_ns != stored_mtime_ns:
+                    subdirectories = self.list_directory(relative_path, mtime_ns)
+                else:
+                    subdirectories = self.stored_subdirectories(directory_id)
+                to_visit.extend(
+                    os.path.join(relative_path, name)  # noqa: PTH118
+                    for name in subdirectories
+                )
+            self.connection.executemany(
+                "DELETE FROM directories WHERE id = ?",
+                [
+                    (directory_id,)
+                    for path, (directory_id, _) in stored.items()
+                    if path not in visited
+                ],
+            )
+
+    def list_directory(self, relative_path: str, mtime_ns: int) -> list[str]:
+        self.connection.execute(
+            "INSERT INTO directories (path, mtime_ns) VALUES (?, ?) "
+            "ON CONFLICT (path) DO UPDATE SET mtime_ns = excluded.mtime_ns",
+            (relative_path, mtime_ns),
+        )
+        # RETURNING requires SQLite 3.35 and lastrowid is not set by updates
+        directory_id = self.connection.execute(
+            "SELECT id FROM directories WHERE path = ?",
+            (relative_path,),
+        ).fetchone()[0]
+        rows = []
+        try:
+            with os.scandir(self.root / relative_path) as entries:
+                for entry in entries:
+                    rows.append(self.create_row(directory_id, entry))  # noqa: PERF401
+        except PermissionError:  # pragma: nocover
+            # skip folders that do not allow listing
+            pass
+        self.connection.execute(
+            "DELETE FROM entries WHERE directory = ?",
+            (directory_id,),
+        )
+        self.connection.executemany(
+            "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        return [row[1] for row in rows if row[3]]
+
+    def create_row(self, directory_id: int, entry: os.DirEntry[str]) -> tuple[Any, ...]:
+        stat_result = entry.stat(follow_symlinks=False)
+        tag = None
+        if self.include_tags:
+            from .tags import XDGTags
+
+            tags = XDGTags(entry.path).get()
+            tag = tags[0] if tags else None
+        return (
+            directory_id,
+            entry.name,
+            os.path.splitext(entry.name)[1],  # noqa: PTH122
+            stat.S_ISDIR(stat_result.st_mode),
+            stat_result.st_size,
+            stat_result.st_mtime_ns,
+            tag,
+        )
+
+    def stored_subdirectories(self, directory_id: int) -> list[str]:
+        rows = self.connection.execute(
+            "SELECT name FROM entries WHERE directory = ? AND is_directory",
+            (directory_id,),
+        )
+        return [name for (name,) in rows]
+
+    def find(  # noqa: PLR0913
+        self,
+        *,
+        suffix: str | None = None,
+        min_size: int | None = None,
+        max_size: int | None = None,
+        modified_after: float | None = None,
+        modified_before: float | None = None,
+        tag: str | None = None,
+        file_type: Literal["file", "directory"] | None = None,
+    ) -> Iterator[PathT]:
+        """
+        Find all cataloged subpaths that match all specified conditions.
+        """
+        if tag is not None and not self.include_tags:
+            message = "Catalog does not index tags, open it with include_tags=True"
+            raise ValueError(message)
+        conditions = {
+            "suffix = ?": suffix,
+            "size >= ?": min_size,
+            "size <= ?": max_size,
+            "entries.mtime_ns >= ?": None
+            if modified_after is None
+            else int(modified_after * 1e9),
+            "entries.mtime_ns <= ?": None
+            if modified_before is None
+            else int(modified_before * 1e9),
+            "tag = ?": tag,
+            "is_directory = ?": None if file_type is None else file_type == "directory",
+        }
+        specified_conditions = {
+            condition: value
+            for condition, value in conditions.items()
+            if value is not None
+        }
+        # only fixed condition strings are formatted into the query
+        where = " AND ".join(specified_conditions) or "1"
+        query = (
+            "SELECT directories.path, entries.name FROM entries "  # noqa: S608
+            "JOIN directories ON entries.directory = directories.id "
+            f"WHERE {where} ORDER BY directories.path, entries.name"
+        )
+        for directory, name in self.connection.execute(
+            query,
+            tuple(specified_conditions.values()),
+        ):
+            yield self.root / directory / name
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> Catalog[PathT]:
+        return self
+
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
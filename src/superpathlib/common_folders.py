@@ -1,13 +1,17 @@
+from __future__ import annotations
+
 import abc
 import sys
 import typing
 from typing import Any, TypeVar
 
 from simple_classproperty import classproperty
-from typing_extensions import Self
 
 from . import base
 
+if typing.TYPE_CHECKING:  # pragma: nocover
+    from typing_extensions import Self
+
 T = TypeVar("T", bound="Path")
 
 
@@ -20,18 +24,18 @@ def enable_classproperties(cls: type[T]) -> None:  # pragma: nocover
 
 
 class PropertyMeta(abc.ABCMeta):
-    def __new__(
-        cls: type["PropertyMeta"],
-        name: str,
-        bases: tuple[type, ...],
-        attributes: dict[str, Any],
-    ) -> "PropertyMeta":
-        meta_class = super().__new__(cls, name, bases, attributes)
-        if sys.version_info >= (3, 13):
-            enable_classproperties(
-                meta_class,  # type: ignore[arg-type]
-            )  # pragma: nocover
-        return meta_class
+    # only hook into class creation on versions that need it
+    if sys.version_info >= (3, 13):  # pragma: nocover
+
+        def __new__(
+            cls: type[PropertyMeta],
+            name: str,
+            bases: tuple[type, ...],
+            attributes: dict[str, Any],
+        ) -> PropertyMeta:
+            meta_class = super().__new__(cls, name, bases, attributes)
+            enable_classproperties(meta_class)  # type: ignore[arg-type]
+            return meta_class
 
 
 class Path(base.Path, metaclass=PropertyMeta):
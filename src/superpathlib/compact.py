@@ -0,0 +1,135 @@
+"""
+Path variant with a flattened class hierarchy and without instance dictionary.
+
+The attributes of all superpathlib mixins are merged into a single class that
+directly extends the pathlib base. Instances only store the pathlib slots and a
+slot for cached properties, which reduces memory usage and attribute resolution
+work for programs that keep many paths in memory.
+"""
+
+from __future__ import annotations
+
+import typing
+from functools import cached_property, wraps
+from types import CellType, FunctionType
+from typing import Any
+
+from . import base
+from .path import Path
+
+# class attributes that are specific to each class in the hierarchy
+excluded_attributes = {
+    "__abstractmethods__",
+    "__dict__",
+    "__doc__",
+    "__module__",
+    "__slots__",
+    "__weakref__",
+    "_abc_impl",
+}
+
+
+def slot_cached_property(function: Callable[[Any], Any]) -> property:
+    """
+    Cache property value in a slot instead of the instance dictionary.
+    """
+    name = function.__name__
+
+    @wraps(function)
+    def get_value(self: Any) -> Any:
+        try:
+            return self._cached_values[name]
+        except AttributeError:
+            self._cached_values = {}
+        except KeyError:
+            pass
+        value = self._cached_values[name] = function(self)
+        return value
+
+    return property(get_value)
+
+
+def rebind_class(value: Any, cls: type) -> Any:
+    """
+    Point zero-argument super calls of functions to the flattened class.
+
+    Decorated functions are rebound recursively through their closures.
+    """
+    if isinstance(value, property):
+        fget, fset = (
+            None if function is None else rebind_class(function, cls)
+            for function in (value.fget, value.fset)
+        )
+        return property(fget, fset, value.fdel, value.__doc__)
+    if not isinstance(value, FunctionType) or not value.__closure__:
+        return value
+    cells = []
+    for name, cell in zip(value.__code__.co_freevars, value.__closure__, strict=True):
+        if name == "__class__":
+            cell = CellType(cls)  # noqa: PLW2901
+        else:
+            contents = cell.cell_contents
+            rebound_contents = rebind_class(contents, cls)
+            if rebound_contents is not contents:
+                cell = CellType(rebound_contents)  # noqa: PLW2901
+        cells.append(cell)
+    if all(
+        cell is original
+        for cell, original in zip(cells, value.__closure__, strict=True)
+    ):
+        return value
+    function = FunctionType(
+        value.__code__,
+        value.__globals__,
+        value.__name__,
+        value.__defaults__,
+        tuple(cells),
+    )
+    function.__kwdefaults__ = value.__kwdefaults__
+    function.__qualname__ = value.__qualname__
+    function.__doc__ = value.__doc__
+    function.__annotations__ = value.__annotations__
+    function.__dict__.update(value.__dict__)
+    return function
+
+
+def create_compact_class(cls: type[Path]) -> type[Path]:
+    """
+    Merge the attributes of all mixins of cls into a single slotted class.
+    """
+    mixins = [
+        mixin
+        for mixin in reversed(cls.__mro__)
+        if issubclass(mixin, base.Path) and mixin is not base.Path
+    ]
+    namespace: dict[str, Any] = {
+        name: slot_cached_property(value.func)
+        if isinstance(value, cached_property)
+        else value
+        for mixin in mixins
+        for name, value in vars(mixin).items()
+        if name not in excluded_attributes
+    }
+    namespace["__slots__"] = ("_cached_values",)
+    namespace["__module__"] = __name__
+    namespace["__doc__"] = __doc__
+    namespace["__qualname__"] = "CompactPath"
+
+    metaclass: type[type] = type(cls)
+    compact_class = typing.cast(
+        "type[Path]",
+        metaclass("CompactPath", (base.Path,), namespace),
+    )
+    for name, value in namespace.items():
+        rebound_value = rebind_class(value, compact_class)
+        if rebound_value is not value:
+            setattr(compact_class, name, rebound_value)
+    return compact_class
+
+
+if typing.TYPE_CHECKING:  # pragma: nocover
+    from collections.abc import Callable
+
+    CompactPath = Path
+else:
+    CompactPath = create_compact_class(Path)
@@ -0,0 +1,125 @@
+"""
+Compression codecs used by content properties based on the path suffix.
+
+Codecs wrap an opened file in a stream that compresses on write and
+decompresses on read so content is never buffered in compressed form. Levels
+and zstd worker threads can be configured with configure(levels={".gz": 9}).
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import typing
+from typing import IO, Any, NamedTuple
+
+if typing.TYPE_CHECKING:  # pragma: nocover
+    from collections.abc import Callable, Mapping
+
+default_levels = {".gz": 6, ".bz2": 9, ".xz": 6, ".zst": 3, ".lz4": 0}
+# -1 uses all logical cores
+default_threads = -1
+
+
+class Settings(NamedTuple):
+    levels: dict[str, int]
+    threads: int
+
+
+settings = Settings(default_levels, default_threads)
+
+
+def configure(
+    *,
+    levels: Mapping[str, int] | None = None,
+    threads: int | None = None,
+) -> None:
+    """
+    Configure compression of content written through content properties.
+
+    Settings that are not specified keep their current value.
+
+    :param levels: compression level per suffix, other suffixes keep their level
+    :param threads: number of zstd worker threads, 0 compresses in calling thread
+    """
+    global settings  # noqa: PLW0603
+    settings = Settings(
+        {**settings.levels, **(levels or {})},
+        settings.threads if threads is None else threads,
+    )
+
+
+def open_gzip(file: IO[bytes], mode: str, level: int) -> IO[bytes]:
+    import gzip
+
+    stream = gzip.GzipFile(fileobj=file, mode=mode, compresslevel=level)
+    return typing.cast("IO[bytes]", stream)
+
+
+def open_bz2(file: IO[bytes], mode: str, level: int) -> IO[bytes]:
+    import bz2
+
+    stream = bz2.BZ2File(file, mode, compresslevel=level)  # type: ignore[call-overload]
+    return typing.cast("IO[bytes]", stream)
+
+
+def open_xz(file: IO[bytes], mode: str, level: int) -> IO[bytes]:
+    import lzma
+
+    # preset can only be specified for writing
+    preset = None if "r" in mode else level
+    return lzma.LZMAFile(file, mode, preset=preset)
+
+
+def open_zstd(file: IO[bytes], mode: str, level: int) -> IO[bytes]:
+    import zstandard
+
+    stream: Any
+    if "r" in mode:
+        decompressor = zstandard.ZstdDecompressor()
+        stream = decompressor.stream_reader(
+            file,
+            read_across_frames=True,
+            closefd=False,
+        )
+    else:
+        compressor = zstandard.ZstdCompressor(level=level, threads=settings.threads)
+        stream = compressor.stream_writer(file, closefd=False)
+    return typing.cast("IO[bytes]", stream)
+
+
+def open_lz4(file: IO[bytes], mode: str, level: int) -> IO[bytes]:
+    import lz4.frame
+
+    stream = lz4.frame.LZ4FrameFile(file, mode, compression_level=level)
+    return typing.cast("IO[bytes]", stream)
+
+
+openers: dict[str, Callable[[IO[bytes], str, int], IO[bytes]]] = {
+    ".gz": open_gzip,
+    ".bz2": open_bz2,
+    ".xz": open_xz,
+    ".zst": open_zstd,
+    ".lz4": open_lz4,
+}
+
+
+def open_stream(file: IO[bytes], suffix: str, mode: str) -> IO[bytes]:
+    """
+    Wrap file in a compressing or decompressing stream that leaves file open.
+
+    :param mode: binary mode in which file is opened
+    """
+    if "r" in mode and is_empty(file):
+        # missing files are opened as empty buffers and have no valid header
+        return io.BytesIO()
+    return openers[suffix](file, mode, settings.levels[suffix])
+
+
+def is_empty(file: IO[bytes]) -> bool:
+    if not file.seekable():
+        return False  # pragma: nocover
+    position = file.tell()
+    end = file.seek(0, os.SEEK_END)
+    file.seek(position)
+    return end == position
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
-import json
+import io
+import itertools
 import typing
-from typing import Any
+from contextlib import contextmanager
+from typing import IO, Any
 
-from . import base
+from . import base, compression
+from .utils import map_concurrently
 
 if typing.TYPE_CHECKING:  # pragma: nocover
-    from collections.abc import Iterable
+    import os
+    from collections.abc import Iterable, Iterator
 
     from numpy.typing import NDArray
+    from typing_extensions import Self
+
+    from .appender import Appender
+    from .bulk import ReadResult
+    from .line_index import LineIndex
 
 
 # Lazy imports for:
@@ -20,23 +29,63 @@ if typing.TYPE_CHECKING:  # pragma: nocover
 class Path(base.Path):
     """
     Properties to read & write content in different formats.
+
+    Content of paths with a compression suffix (.gz, .bz2, .xz, .zst, .lz4) is
+    compressed and decompressed transparently.
     """
 
+    @property
+    def is_compressed(self) -> bool:
+        return self.suffix in compression.openers
+
+    @contextmanager
+    def open_content(self, mode: str = "r", **kwargs: Any) -> Iterator[IO[Any]]:
+        """
+        Open content stream that is compressed or decompressed based on suffix.
+
+        :param kwargs: text stream options like encoding in text mode
+        """
+        if not self.is_compressed:
+            with self.open(mode, **kwargs) as file:
+                yield file
+            return
+        binary_mode = mode.replace("t", "").replace("b", "") + "b"
+        with self.open(binary_mode) as file:
+            stream: IO[Any] = compression.open_stream(file, self.suffix, binary_mode)
+            if "b" not in mode:
+                stream = io.TextIOWrapper(stream, **kwargs)
+            with stream:
+                yield stream
+
     @property
     def byte_content(self) -> bytes:
+        if self.is_compressed:
+            with self.open_content("rb") as file:
+                return typing.cast("bytes", file.read())
         return self.read_bytes()
 
     @byte_content.setter
     def byte_content(self, value: bytes) -> None:
-        self.write_bytes(value)
+        if self.is_compressed:
+            with self.open_content("wb") as file:
+                file.write(value)
+        else:
+            self.write_bytes(value)
 
     @property
     def text(self) -> str:
+        if self.is_compressed:
+            with self.open_content() as file:
+                return typing.cast("str", file.read())
         return self.read_text()
 
     @text.setter
     def text(self, value: str | Any) -> None:
-        self.write_text(str(value))
+        if self.is_compressed:
+            with self.open_content("w") as file:
+                file.write(str(value))
+        else:
+            self.write_text(str(value))
 
     @property
     def lines(self) -> list[str]:
@@ -44,7 +93,12 @@ class Path(base.Path):
 
     @lines.setter
     def lines(self, lines: Iterable[Any]) -> None:
-        self.text = "\n".join(str(line) for line in lines)
+        if self.is_compressed:
+            with self.open_content("w") as file:
+                for index, line in enumerate(lines):
+                    file.write(f"\n{line}" if index else str(line))
+        else:
+            self.text = "\n".join(str(line) for line in lines)
 
     @property
     def content_lines(self) -> list[str]:
@@ -55,14 +109,181 @@ class Path(base.Path):
         lines = (line for line in lines if line)
         self.lines = typing.cast("list[str]", lines)
 
+    def head(self, number: int = 10) -> list[str]:
+        """
+        First lines without reading the remaining content.
+        """
+        with self.open_content("rb") as file:
+            lines = list(itertools.islice(file, number))
+        return b"".join(lines).decode().splitlines()
+
+    def head_bytes(self, size: int) -> bytes:
+        with self.open_content("rb") as file:
+            return typing.cast("bytes", file.read(size))
+
+    def tail(self, number: int = 10) -> list[str]:
+        """
+        Last lines by reading blocks backwards from the end of the file.
+        """
+        from .tail import read_tail_lines
+
+        return read_tail_lines(self, number)
+
+    def tail_bytes(self, size: int) -> bytes:
+        from .tail import read_tail_bytes
+
+        return read_tail_bytes(self, size)
+
+    @classmethod
+    def tails_many(
+        cls,
+        paths: Iterable[str | os.PathLike[str]],
+        number: int = 10,
+        *,
+        workers: int | None = None,
+    ) -> list[list[str]]:
+        return map_concurrently(lambda path: cls(path).tail(number), paths, workers)
+
+    @classmethod
+    def read_many(
+        cls,
+        paths: Iterable[str | os.PathLike[str]],
+        format: str = "text",  # noqa: A002
+        *,
+        workers: int | None = None,
+        processes: bool = False,
+        ordered: bool = True,
+    ) -> Iterator[ReadResult[Self]]:
+        """
+        Read and decode content of many paths concurrently.
+
+        Errors are reported in the result of each path instead of aborting the
+        batch. Results are streamed while the remaining paths are read.
+        :param format: content property to read like text, json or yaml
+        :param processes: decode in worker processes for CPU-heavy formats
+        :param ordered: yield results in the order of the paths instead of
+            in the order in which they complete
+        """
+        from .bulk import read_many
+
+        return read_many(
+            cls,
+            paths,
+            format,
+            workers=workers,
+            processes=processes,
+            ordered=ordered,
+        )
+
+    def follow(
+        self,
+        number: int = 0,
+        *,
+        interval: float = 0.1,
+        leading_separators: bool = False,
+    ) -> Iterator[str]:
+        """
+        Yield the last number lines and all lines that are appended afterwards.
+
+        The file is reopened when it is rotated and awaited when it is missing.
+        :param leading_separators: follow content written by append_lines, which
+            writes the newline before each line instead of after it
+        """
+        from .tail import follow
+
+        return follow(
+            self,
+            number,
+            interval,
+            leading_separators=leading_separators,
+        )
+
+    def line_index(self, index_path: Path | None = None) -> LineIndex:
+        """
+        Index of line offsets for random access to lines of large files.
+
+        The index is stored in a sidecar file next to the path by default and is
+        extended incrementally when content is appended. The index is kept in
+        memory when the sidecar can not be created.
+        """
+        from .line_index import LineIndex
+
+        return LineIndex.open(self, index_path)
+
+    def line(self, number: int) -> str:
+        with self.line_index() as index:
+            return index.line(number)
+
+    def line_range(self, start: int = 0, stop: int | None = None) -> list[str]:
+        with self.line_index() as index:
+            return index.lines(start, stop)
+
+    def appender(
+        self,
+        *,
+        max_size: int | None = None,
+        backups: int = 1,
+        buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+    ) -> Appender:
+        """
+        Buffered writer for frequent appends that can be used as context manager.
+
+        :param max_size: roll file over to a numbered backup above this size
+        :param backups: number of rolled over files to keep
+        """
+        from .appender import Appender
+
+        return Appender(self, max_size, backups, buffer_size)
+
+    def append_bytes(
+        self,
+        data: bytes,
+        *,
+        max_size: int | None = None,
+        backups: int = 1,
+    ) -> None:
+        with self.appender(max_size=max_size, backups=backups) as appender:
+            appender.write_bytes(data)
+
+    def append_text(
+        self,
+        text: str,
+        *,
+        max_size: int | None = None,
+        backups: int = 1,
+    ) -> None:
+        with self.appender(max_size=max_size, backups=backups) as appender:
+            appender.write_text(text)
+
+    def append_lines(
+        self,
+        lines: Iterable[Any],
+        *,
+        max_size: int | None = None,
+        backups: int = 1,
+    ) -> None:
+        """
+        Append lines that are separated by newlines from existing content.
+        """
+        with self.appender(max_size=max_size, backups=backups) as appender:
+            appender.write_lines(lines)
+
     @property
     def json(self) -> dict[str, Any] | list[Any]:
+        import json
+
         value = json.loads(self.text or "{}")
         return typing.cast("dict[str, Any] | list[Any]", value)
 
     @json.setter
     def json(self, content: dict[Any, Any] | list[Any]) -> None:
-        self.text = json.dumps(content)
+        import json
+
+        if self.is_compressed:
+            with self.open_content("w") as file:
+                json.dump(content, file)
+        else:
+            self.text = json.dumps(content)
 
     @property
     def yaml(self) -> dict[str, Any] | list[Any]:
@@ -80,7 +301,11 @@ class Path(base.Path):
 
         # C implementation much faster but only supported on Linux
         Dumper = yaml.CDumper if hasattr(yaml, "CDumper") else yaml.Dumper  # noqa: N806
-        self.text = yaml.dump(value, Dumper=Dumper, width=1024)
+        if self.is_compressed:
+            with self.open_content("w") as file:
+                yaml.dump(value, file, Dumper=Dumper, width=1024)
+        else:
+            self.text = yaml.dump(value, Dumper=Dumper, width=1024)
 
     @property
     def numpy(self) -> NDArray[Any]:
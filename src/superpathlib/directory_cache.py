@@ -0,0 +1,153 @@
+"""
+Opt-in cache of directories that are known to exist.
+
+Creating parents of a path normally costs a mkdir call on every write. When
+the cache is enabled, directories that were created or found are remembered
+and not created again. Directories are forgotten when they are removed or
+renamed by this library. The parent of a path is forgotten when a write to it
+fails because of a missing directory, so that directories removed by other
+processes are created again like without cache.
+"""
+
+from __future__ import annotations
+
+import bisect
+import os
+import threading
+import typing
+from contextlib import contextmanager
+
+if typing.TYPE_CHECKING:  # pragma: nocover
+    import pathlib
+    from collections.abc import Iterator
+
+default_max_size = 4096
+
+
+class DirectoryCache:
+    """
+    Absolute paths of directories with least recently used eviction.
+
+    Paths are also kept sorted to forget all descendants of a directory with a
+    binary search.
+    """
+
+    __slots__ = ("directories", "lock", "max_size", "sorted_directories")
+
+    def __init__(self, max_size: int = default_max_size) -> None:
+        if max_size < 1:
+            message = f"Maximum size must be at least 1, got {max_size}"
+            raise ValueError(message)
+        self.max_size = max_size
+        # insertion order of a dict is used as recency order
+        self.directories: dict[str, None] = {}
+        self.sorted_directories: list[str] = []
+        self.lock = threading.Lock()
+
+    def __contains__(self, directory: str) -> bool:
+        with self.lock:
+            if directory not in self.directories:
+                return False
+            del self.directories[directory]
+            self.directories[directory] = None
+            return True
+
+    def __len__(self) -> int:
+        return len(self.directories)
+
+    def add(self, directory: str) -> None:
+        with self.lock:
+            if directory in self.directories:
+                return
+            if len(self.directories) >= self.max_size:
+                oldest = next(iter(self.directories))
+                del self.directories[oldest]
+                self.remove_sorted(oldest)
+            self.directories[directory] = None
+            bisect.insort(self.sorted_directories, directory)
+
+    def discard_tree(self, directory: str) -> None:
+        """
+        Forget directory and all its descendants.
+        """
+        prefix = os.path.join(directory, "")  # noqa: PTH118
+        # all descendants sort between the prefix and the prefix with the
+        # separator replaced by the next character
+        end = prefix[:-1] + chr(ord(os.sep) + 1)
+        with self.lock:
+            if directory in self.directories:
+                del self.directories[directory]
+                self.remove_sorted(directory)
+            start = bisect.bisect_left(self.sorted_directories, prefix)
+            stop = bisect.bisect_left(self.sorted_directories, end, lo=start)
+            for path in self.sorted_directories[start:stop]:
+                del self.directories[path]
+            del self.sorted_directories[start:stop]
+
+    def remove_sorted(self, directory: str) -> None:
+        index = bisect.bisect_left(self.sorted_directories, directory)
+        del self.sorted_directories[index]
+
+    def clear(self) -> None:
+        with self.lock:
+            self.directories.clear()
+            self.sorted_directories.clear()
+
+
+cache: DirectoryCache | None = None
+
+
+def enable(max_size: int = default_max_size) -> DirectoryCache:
+    """
+    :param max_size: maximum number of remembered directories
+    """
+    global cache  # noqa: PLW0603
+    cache = DirectoryCache(max_size)
+    return cache
+
+
+def disable() -> None:
+    global cache  # noqa: PLW0603
+    cache = None
+
+
+@contextmanager
+def caching(max_size: int = default_max_size) -> Iterator[DirectoryCache]:
+    """
+    Enable cache within context and restore the previous cache afterwards.
+    """
+    global cache  # noqa: PLW0603
+    previous_cache = cache
+    try:
+        yield enable(max_size)
+    finally:
+        cache = previous_cache
+
+
+def create_directory(directory: pathlib.Path) -> None:
+    """
+    Create directory and its parents unless it is known to exist.
+    """
+    known_directories = cache
+    if known_directories is None:
+        directory.mkdir(parents=True, exist_ok=True)
+        return
+    key = os.path.abspath(directory)  # noqa: PTH100
+    if key not in known_directories:
+        directory.mkdir(parents=True, exist_ok=True)
+        known_directories.add(key)
+
+
+def forget(directory: str | os.PathLike[str]) -> None:
+    """
+    Forget directory and its descendants after they are removed or moved.
+    """
+    known_directories = cache
+    if known_directories is not None:
+        known_directories.discard_tree(os.path.abspath(directory))  # noqa: PTH100
+
+
+def forget_all() -> None:
+    known_directories = cache
+    if known_directories is not None:
+        known_directories.clear()
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+
+# st_blocks is expressed in units of 512 bytes on all supported platforms
+block_size = 512
+
+
+@dataclass(frozen=True)
+class DiskUsage:
+    apparent_size: int = 0
+    allocated_size: int = 0
+
+    def __add__(self, other: DiskUsage) -> DiskUsage:
+        return DiskUsage(
+            self.apparent_size + other.apparent_size,
+            self.allocated_size + other.allocated_size,
+        )
+
+    @classmethod
+    def from_stat(cls, stat_result: os.stat_result) -> DiskUsage:
+        return cls(stat_result.st_size, stat_result.st_blocks * block_size)
+
+
+@dataclass
+class DirectoryUsage:
+    """
+    Disk usage of a directory and its direct children.
+
+    Files with multiple hardlinks are stored separately to count them only once.
+    """
+
+    mtime_ns: int
+    ctime_ns: int
+    usage: DiskUsage = DiskUsage()
+    linked_files: dict[tuple[int, int], DiskUsage] = field(default_factory=dict)
+    subdirectories: list[str] = field(default_factory=list)
+    # only stored to check the files of cached directories again
+    file_names: list[str] | None = None
+
+    def is_unchanged(self, directory_stat: os.stat_result) -> bool:
+        return (self.mtime_ns, self.ctime_ns) == (
+            directory_stat.st_mtime_ns,
+            directory_stat.st_ctime_ns,
+        )
+
+    def add_file(self, name: str, stat_result: os.stat_result) -> None:
+        if self.file_names is not None:
+            self.file_names.append(name)
+        if stat_result.st_nlink > 1:
+            key = stat_result.st_dev, stat_result.st_ino
+            self.linked_files[key] = DiskUsage.from_stat(stat_result)
+        else:
+            self.usage += DiskUsage.from_stat(stat_result)
+
+
+@dataclass
+class DiskUsageScanner:
+    """
+    Compute disk usage of trees by scanning directories of each level in parallel.
+
+    Subtotals are cached per directory and reused while the directory mtime and
+    ctime are unchanged. Each scan only keeps the directories that it visited.
+    Size changes of existing files do not modify their directory, so they are
+    only picked up when files are checked.
+    :param check_files: stat the files of cached directories again without
+                        listing the directories
+    """
+
+    workers: int | None = None
+    cache: dict[str, DirectoryUsage] = field(default_factory=dict)
+    check_files: bool = False
+
+    def scan(self, root: str | os.PathLike[str]) -> DiskUsage:
+        root = os.fspath(root)
+        root_stat = os.lstat(root)
+        if not stat.S_ISDIR(root_stat.st_mode):
+            return DiskUsage.from_stat(root_stat)
+
+        total = DiskUsage()
+        linked_files: dict[tuple[int, int], DiskUsage] = {}
+        visited: dict[str, DirectoryUsage] = {}
+        scan_directory = partial(self.scan_directory, visited=visited)
+        level = [root]
+        with ThreadPoolExecutor(self.workers) as executor:
+            while level:
+                next_level: list[str] = []
+                for directory, usage in zip(
+                    level,
+                    executor.map(scan_directory, level),
+                    strict=True,
+                ):
+                    if usage is not None:
+                        total += usage.usage
+                        linked_files |= usage.linked_files
+                        next_level.extend(
+                            os.path.join(directory, name)  # noqa: PTH118
+                            for name in usage.subdirectories
+                        )
+                level = next_level
+        # directories that were removed or are outside of root are dropped
+        self.cache = visited
+        for linked_file_usage in linked_files.values():
+            total += linked_file_usage
+        return total
+
+    def scan_directory(
+        self,
+        directory: str,
+        visited: dict[str, DirectoryUsage],
+    ) -> DirectoryUsage | None:
+        try:
+            directory_stat = os.lstat(directory)
+        except (FileNotFoundError, NotADirectoryError):  # pragma: nocover
+            # removed during scan
+            return None
+        cached_usage = self.cache.get(directory)
+        if cached_usage is None or not cached_usage.is_unchanged(directory_stat):
+            usage = self.create_usage(directory_stat)
+            self.add_entries(usage, directory)
+        elif self.check_files:
+            usage = self.check_cached_files(cached_usage, directory, directory_stat)
+        else:
+            usage = cached_usage
+        visited[directory] = usage
+        return usage
+
+    def create_usage(self, directory_stat: os.stat_result) -> DirectoryUsage:
+        return DirectoryUsage(
+            directory_stat.st_mtime_ns,
+            directory_stat.st_ctime_ns,
+            DiskUsage.from_stat(directory_stat),
+            file_names=[] if self.check_files else None,
+        )
+
+    def check_cached_files(
+        self,
+        cached_usage: DirectoryUsage,
+        directory: str,
+        directory_stat: os.stat_result,
+    ) -> DirectoryUsage:
+        usage = self.create_usage(directory_stat)
+        if cached_usage.file_names is None:
+            # file names are not stored when files were not checked before
+            self.add_entries(usage, directory)
+        else:
+            usage.subdirectories = cached_usage.subdirectories
+            for name in cached_usage.file_names:
+                path = os.path.join(directory, name)  # noqa: PTH118
+                self.add_cached_file(usage, name, path)
+        return usage
+
+    @classmethod
+    def add_entries(cls, usage: DirectoryUsage, directory: str) -> None:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    cls.add_entry(usage, entry)
+        except PermissionError:  # pragma: nocover
+            # skip folders that do not allow listing
+            pass
+
+    @classmethod
+    def add_entry(cls, usage: DirectoryUsage, entry: os.DirEntry[str]) -> None:
+        try:
+            stat_result = entry.stat(follow_symlinks=False)
+        except FileNotFoundError:  # pragma: nocover
+            # removed during scan
+            return
+        if stat.S_ISDIR(stat_result.st_mode):
+            usage.subdirectories.append(entry.name)
+        else:
+            usage.add_file(entry.name, stat_result)
+
+    @classmethod
+    def add_cached_file(cls, usage: DirectoryUsage, name: str, path: str) -> None:
+        try:
+            stat_result = os.lstat(path)
+        except FileNotFoundError:  # pragma: nocover
+            # removed during scan
+            return
+        usage.add_file(name, stat_result)
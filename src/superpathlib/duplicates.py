@@ -0,0 +1,214 @@
+"""
+Find files with identical content in stages of increasing cost.
+
+Files are grouped by size first. Files in groups with multiple inodes are
+compared by a digest of their first and last block, and the remaining
+candidates are compared by a digest of their complete content. Each inode is
+hashed at most once and every hashing stage runs in a thread pool.
+"""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import shutil
+import stat
+import sys
+import typing
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Generic, Literal, NamedTuple, TypeVar
+
+from .hashing import file_digest, partial_block_size, partial_digest
+from .utils import map_concurrently
+
+if typing.TYPE_CHECKING:  # pragma: nocover
+    from collections.abc import Callable, Iterable
+
+PathT = TypeVar("PathT", bound="str | os.PathLike[str]")
+LinkMethod = Literal["hardlink", "reflink"]
+# ioctl request to share the extents of a file on Linux
+FICLONE = 0x40049409
+
+
+class Signature(NamedTuple):
+    device: int
+    inode: int
+    mtime_ns: int
+
+    @classmethod
+    def from_stat(cls, stat_result: os.stat_result) -> Signature:
+        return cls(stat_result.st_dev, stat_result.st_ino, stat_result.st_mtime_ns)
+
+
+@dataclass
+class Inode(Generic[PathT]):
+    """
+    Paths that refer to the same file and are hashed once.
+    """
+
+    size: int
+    paths: list[PathT]
+    signatures: list[Signature]
+    digest: bytes = b""
+
+
+@dataclass
+class DuplicateGroup(Generic[PathT]):
+    """
+    Paths with identical content.
+
+    :param digest: blake2b digest of the content
+    :param signatures: device, inode and mtime of each path when it was hashed
+    """
+
+    size: int
+    digest: bytes
+    paths: list[PathT]
+    signatures: list[Signature]
+
+    @property
+    def wasted_size(self) -> int:
+        """
+        Size that is used by the copies of the content.
+        """
+        inodes = {(signature.device, signature.inode) for signature in self.signatures}
+        return self.size * (len(inodes) - 1)
+
+    def link(self, method: LinkMethod = "hardlink") -> int:
+        """
+        Replace copies by links to a single file per device.
+
+        Paths that changed since they were hashed are skipped.
+        :return: freed size
+        """
+        create_link = create_hardlink if method == "hardlink" else create_reflink
+        originals: dict[int, tuple[PathT, Signature]] = {}
+        # storage of an inode is freed once even if multiple paths link to it
+        replaced_inodes: set[tuple[int, int]] = set()
+        for path, signature in zip(self.paths, self.signatures, strict=True):
+            try:
+                current_signature = Signature.from_stat(os.lstat(path))
+            except FileNotFoundError:
+                continue
+            if current_signature != signature:
+                continue
+            original, original_signature = originals.setdefault(
+                signature.device,
+                (path, signature),
+            )
+            if original_signature.inode != signature.inode:
+                replace_with_link(original, path, create_link)
+                replaced_inodes.add((signature.device, signature.inode))
+        return self.size * len(replaced_inodes)
+
+
+def replace_with_link(
+    original: str | os.PathLike[str],
+    path: str | os.PathLike[str],
+    create_link: Callable[[pathlib.Path, pathlib.Path], None],
+) -> None:
+    """
+    Create link next to path and move it over path to replace it atomically.
+    """
+    path = pathlib.Path(path)
+    temporary_path = path.with_name(f".{path.name}.{os.getpid()}.link")
+    try:
+        create_link(pathlib.Path(original), temporary_path)
+        temporary_path.replace(path)
+    finally:
+        temporary_path.unlink(missing_ok=True)
+
+
+def create_hardlink(original: pathlib.Path, path: pathlib.Path) -> None:
+    path.hardlink_to(original)
+
+
+def create_reflink(original: pathlib.Path, path: pathlib.Path) -> None:
+    """
+    Create copy that shares storage with the original until either is modified.
+    """
+    if sys.platform != "linux":  # pragma: nocover
+        message = "Reflinks are only supported on Linux"
+        raise NotImplementedError(message)
+    import fcntl
+
+    with original.open("rb") as source, path.open("xb") as destination:
+        fcntl.ioctl(destination.fileno(), FICLONE, source.fileno())
+    shutil.copystat(original, path)
+
+
+def find_duplicates(
+    entries: Iterable[tuple[PathT, os.stat_result]],
+    *,
+    min_size: int = 1,
+    workers: int | None = None,
+) -> list[DuplicateGroup[PathT]]:
+    """
+    :param entries: paths with their stat result. Only regular files are used.
+    :param min_size: ignore files smaller than this size
+    :return: groups sorted by wasted size
+    """
+    sizes: defaultdict[int, dict[tuple[int, int], Inode[PathT]]] = defaultdict(dict)
+    for path, stat_result in entries:
+        if stat.S_ISREG(stat_result.st_mode) and stat_result.st_size >= min_size:
+            signature = Signature.from_stat(stat_result)
+            inodes = sizes[stat_result.st_size]
+            key = signature.device, signature.inode
+            inode = inodes.setdefault(key, Inode(stat_result.st_size, [], []))
+            inode.paths.append(path)
+            inode.signatures.append(signature)
+
+    candidates = [list(inodes.values()) for inodes in sizes.values() if len(inodes) > 1]
+    candidates = refine(candidates, hash_start_and_end, workers)
+    # partial digests cover the complete content of files up to two blocks
+    groups: list[list[Inode[PathT]]] = []
+    large_groups: list[list[Inode[PathT]]] = []
+    for group in candidates:
+        is_small = group[0].size <= 2 * partial_block_size
+        (groups if is_small else large_groups).append(group)
+    groups.extend(refine(large_groups, hash_content, workers))
+    duplicate_groups = [
+        DuplicateGroup(
+            group[0].size,
+            group[0].digest,
+            [path for inode in group for path in inode.paths],
+            [signature for inode in group for signature in inode.signatures],
+        )
+        for group in groups
+    ]
+    duplicate_groups.sort(key=lambda group: group.wasted_size, reverse=True)
+    return duplicate_groups
+
+
+def refine(
+    groups: list[list[Inode[PathT]]],
+    hash_function: Callable[[Inode[PathT]], bytes | None],
+    workers: int | None,
+) -> list[list[Inode[PathT]]]:
+    """
+    Split groups by digest and keep groups with multiple inodes.
+    """
+    inodes = [inode for group in groups for inode in group]
+    digests = map_concurrently(hash_function, inodes, workers)
+    refined_groups: defaultdict[tuple[int, bytes], list[Inode[PathT]]]
+    refined_groups = defaultdict(list)
+    for inode, digest in zip(inodes, digests, strict=True):
+        if digest is not None:
+            inode.digest = digest
+            refined_groups[inode.size, digest].append(inode)
+    return [group for group in refined_groups.values() if len(group) > 1]
+
+
+def hash_start_and_end(inode: Inode[PathT]) -> bytes | None:
+    try:
+        return partial_digest(inode.paths[0], inode.size)
+    except (FileNotFoundError, PermissionError):
+        return None
+
+
+def hash_content(inode: Inode[PathT]) -> bytes | None:
+    try:
+        return file_digest(inode.paths[0])
+    except (FileNotFoundError, PermissionError):
+        return None
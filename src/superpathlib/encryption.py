@@ -1,9 +1,6 @@
 from __future__ import annotations
 
-import getpass
 import os
-import shlex
-import subprocess
 from functools import cached_property
 from typing import Any
 
@@ -26,8 +23,13 @@ class EncryptedPath(Path):
         if password := os.environ.get("FILE_ENCRYPTION_PASSWORD"):
             return password
         if askpass := os.environ.get("FILE_ENCRYPTION_ASKPASS"):
+            import shlex
+            import subprocess
+
             command = shlex.split(askpass)
             return subprocess.check_output(command).decode().strip()  # noqa: S603
+        import getpass
+
         return getpass.getpass("Enter passphrase for file encryption: ")
 
     @property
@@ -41,6 +43,8 @@ class EncryptedPath(Path):
     def read_bytes(self) -> bytes:
         encrypted_bytes = super().read_bytes()
         if encrypted_bytes:
+            import subprocess
+
             process = subprocess.Popen(  # noqa: S603
                 self.decryption_command,
                 stdin=subprocess.PIPE,
@@ -52,6 +56,8 @@ class EncryptedPath(Path):
         return decrypted_bytes
 
     def write_bytes(self, data: bytes) -> int:  # type: ignore[override]
+        import subprocess
+
         process = subprocess.Popen(  # noqa: S603
             self.encryption_command,
             stdin=subprocess.PIPE,
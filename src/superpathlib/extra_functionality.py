@@ -1,21 +1,29 @@
+from __future__ import annotations
+
 import contextlib
 import os
-import shutil
-import tempfile
 import time
 import typing
-import urllib.parse
 from collections import deque
-from collections.abc import Callable, Iterator
 from functools import cached_property
-from types import TracebackType
 from typing import Any, cast
 
-from typing_extensions import Self
-
-from . import cached_content
+from . import cached_content, directory_cache, metadata_properties
 from .utils import find_first_match
 
+if typing.TYPE_CHECKING:  # pragma: nocover
+    from collections.abc import Callable, Iterable, Iterator
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from .aio import AsyncPath
+    from .catalog import Catalog
+    from .duplicates import DuplicateGroup, LinkMethod
+    from .snapshot import TreeSnapshot
+    from .tag_index import TagIndex
+    from .watch import Change, Subscription, Watcher
+
 
 class Path(cached_content.Path):
     """
@@ -23,7 +31,7 @@ class Path(cached_content.Path):
     """
 
     def create_parent(self) -> Self:
-        self.parent.mkdir(parents=True, exist_ok=True)
+        directory_cache.create_directory(self.parent)
         return self.parent
 
     def with_nonexistent_name(self) -> Self:
@@ -31,7 +39,7 @@ class Path(cached_content.Path):
         if path.exists():
             stem = path.stem
 
-            def with_number(i: int) -> "Path":
+            def with_number(i: int) -> Path:
                 return path.with_stem(f"{stem} ({i})")
 
             def nonexistent(i: int) -> bool:
@@ -57,17 +65,22 @@ class Path(cached_content.Path):
         only_if_newer: bool = False,
     ) -> None:
         if not only_if_newer or self.mtime > dest.mtime:
-            dest.byte_content = self.byte_content
+            # raw bytes keep the copy identical regardless of compression suffixes
+            dest.write_bytes(self.read_bytes())
             if include_properties:
                 self.copy_properties_to(dest)
 
     def copy_properties_to(self, dest: Self) -> None:
+        tag = self.tag
+        mtime = self.mtime
         for path in dest.find():
-            path.tag = self.tag
-            path.mtime = self.mtime
+            path.tag = tag
+            path.mtime = mtime
 
     @cached_property
     def archive_format(self) -> str:
+        import shutil
+
         # noinspection PyProtectedMember
         path_str = str(self)
         format_ = shutil._find_unpack_format(path_str)  # type: ignore[attr-defined] # noqa: SLF001
@@ -113,6 +126,8 @@ class Path(cached_content.Path):
             else:
                 extraction_directory.unlink(missing_ok=True)
 
+        import shutil
+
         shutil.unpack_archive(
             self,
             extract_dir=extraction_directory,
@@ -131,6 +146,8 @@ class Path(cached_content.Path):
                 path.unpack_if_archive()
 
     def create_extraction_directory(self, archive_format: str) -> Self:
+        import shutil
+
         extract_name = self.name
         # noinspection PyProtectedMember
         unpack_formats = shutil._UNPACK_FORMATS  # type: ignore[attr-defined] # noqa: SLF001
@@ -155,15 +172,13 @@ class Path(cached_content.Path):
             temp_dest.rename(dest)
         else:  # pragma: nocover
             # merge in existing folder
+            import shutil
+
             shutil.copytree(temp_dest, dest, dirs_exist_ok=True)
             temp_dest.rmtree()
 
     def is_empty(self) -> bool:
-        return (
-            not self.exists()
-            or (self.is_dir() and next(self.iterdir(), None) is None)
-            or (self.is_file() and self.size == 0)
-        )
+        return metadata_properties.is_empty(self)
 
     def load_yaml(self) -> dict[Any, Any] | list[Any]:
         """
@@ -231,6 +246,152 @@ class Path(cached_content.Path):
                 if should_recurse and should_recurse_folder:
                     to_traverse.extend(extract_children_to_recurse_on(path))
 
+    def snapshot(
+        self,
+        *,
+        follow_symlinks: bool = False,
+        include_tags: bool = False,
+        include_digests: bool = False,
+    ) -> TreeSnapshot[Self]:
+        """
+        Collect metadata of all subpaths in a single scan.
+
+        Use this instead of querying properties of each subpath for bulk queries.
+        Digests of file content are needed to detect moves by content in diffs.
+        """
+        from .snapshot import TreeSnapshot
+
+        return TreeSnapshot.from_scan(
+            self,
+            follow_symlinks=follow_symlinks,
+            include_tags=include_tags,
+            include_digests=include_digests,
+        )
+
+    def find_duplicates(
+        self,
+        *,
+        min_size: int = 1,
+        workers: int | None = None,
+    ) -> list[DuplicateGroup[Self]]:
+        """
+        Find groups of files in the tree with identical content.
+
+        Files are compared by size, then by a digest of their first and last
+        block and only then by a digest of their complete content.
+        :param min_size: ignore files smaller than this size
+        :return: groups sorted by wasted size
+        """
+        from .duplicates import DuplicateGroup, find_duplicates
+        from .snapshot import scan
+
+        entries = (
+            (entry.path, stat_result) for _, entry, stat_result in scan(str(self))
+        )
+        groups = find_duplicates(entries, min_size=min_size, workers=workers)
+        return [
+            DuplicateGroup(
+                group.size,
+                group.digest,
+                [self.__class__(path) for path in group.paths],
+                group.signatures,
+            )
+            for group in groups
+        ]
+
+    def deduplicate(
+        self,
+        method: LinkMethod = "hardlink",
+        *,
+        min_size: int = 1,
+        workers: int | None = None,
+    ) -> int:
+        """
+        Replace copies of files in the tree by hardlinks or reflinks.
+
+        Reflinks keep files independent when modified and require a filesystem
+        that supports them like btrfs or xfs.
+        :return: freed size
+        """
+        groups = self.find_duplicates(min_size=min_size, workers=workers)
+        return sum(group.link(method) for group in groups)
+
+    def catalog(
+        self,
+        database: str | os.PathLike[str],
+        *,
+        include_tags: bool = False,
+    ) -> Catalog[Self]:
+        """
+        Open persistent catalog of all subpaths and refresh changed directories.
+
+        Use this instead of find for repeated queries over large trees.
+        """
+        from .catalog import Catalog
+
+        catalog = Catalog(self, database, include_tags=include_tags)
+        catalog.refresh()
+        return catalog
+
+    def tag_index(self, *, workers: int | None = None) -> TagIndex[Self]:
+        """
+        Build index of the tags of all subpaths to find paths by tag.
+
+        The index is kept up to date while tags are set through path properties.
+        """
+        from .tag_index import TagIndex
+
+        return TagIndex.build(self, workers=workers)
+
+    @property
+    def aio(self) -> AsyncPath[Self]:
+        """
+        Async facade that runs blocking filesystem work on a bounded executor.
+        """
+        from .aio import AsyncPath
+
+        return AsyncPath(self)
+
+    def watch(
+        self,
+        *,
+        recursive: bool = True,
+        latency: float = 0.05,
+        polling: bool | None = None,
+    ) -> Watcher[Self]:
+        """
+        Watch path for changes.
+
+        Iterate over the returned watcher to receive batches of coalesced changes.
+        Inotify is used on Linux and polling is used as fallback.
+        """
+        from .watch import Watcher
+
+        watcher: Watcher[Self] = (
+            Watcher(latency=latency)
+            if polling is None
+            else Watcher(latency=latency, polling=polling)
+        )
+        watcher.add(self, recursive=recursive)
+        return watcher
+
+    def subscribe(
+        self,
+        callback: Callable[[list[Change[Self]]], Any],
+        *,
+        recursive: bool = True,
+    ) -> Subscription[Self]:
+        """
+        Call callback in a background thread with each batch of changes.
+
+        All subscriptions share a single watcher and thread.
+        """
+        from .watch import Subscription, dispatcher
+
+        subscription = Subscription(self, callback, recursive=recursive)
+        dispatcher.subscribe(subscription)
+        return subscription
+
     def rmtree(
         self,
         *,
@@ -238,15 +399,71 @@ class Path(cached_content.Path):
         remove_root: bool = True,
         ignore_errors: bool = False,
     ) -> None:
+        directory_cache.forget(self)
         context = (
             contextlib.suppress(FileNotFoundError)
             if missing_ok
             else contextlib.nullcontext()
         )
-        with context:
-            shutil.rmtree(self, ignore_errors=ignore_errors, onerror=self._on_error)  # type: ignore[arg-type]
-        if not remove_root:
-            self.mkdir()
+        if remove_root:
+            import shutil
+
+            with context:
+                shutil.rmtree(self, ignore_errors=ignore_errors, onerror=self._on_error)  # type: ignore[arg-type]
+        else:
+            try:
+                self.clear(ignore_errors=ignore_errors)
+            except FileNotFoundError:
+                if not missing_ok:
+                    raise
+                self.mkdir()
+
+    def clear(self, *, keep: Iterable[str] = (), ignore_errors: bool = False) -> None:
+        """
+        Remove all children of directory while preserving the directory itself.
+
+        The directory keeps its inode, permissions and metadata.
+        :param keep: paths relative to directory that should not be removed
+        :param ignore_errors: also create the directory if it is missing
+        """
+        directory_cache.forget(self)
+        protected: dict[str, list[str]] = {}
+        for relative_path in keep:
+            name, _, remainder = str(relative_path).partition(os.sep)
+            protected.setdefault(name, []).append(remainder)
+
+        import shutil
+
+        try:
+            with os.scandir(self) as entries:
+                children = list(entries)
+        except FileNotFoundError:
+            if not ignore_errors:
+                raise
+            self.mkdir(parents=True)
+            return
+        for child in children:
+            protected_children = protected.get(child.name)
+            if child.is_dir(follow_symlinks=False):
+                if protected_children is None:
+                    shutil.rmtree(
+                        child.path,
+                        ignore_errors=ignore_errors,
+                        onerror=self._on_error,  # type: ignore[arg-type]
+                    )
+                elif all(protected_children):
+                    self.__class__(child.path).clear(
+                        keep=protected_children,
+                        ignore_errors=ignore_errors,
+                    )
+            elif protected_children is None:
+                context = (
+                    contextlib.suppress(OSError)
+                    if ignore_errors
+                    else contextlib.nullcontext()
+                )
+                with context:
+                    os.unlink(child.path)  # noqa: PTH108
 
     @classmethod
     def _on_error(
@@ -273,6 +490,8 @@ class Path(cached_content.Path):
 
     @classmethod
     def from_uri(cls, uri: str) -> Self:
+        import urllib.parse
+
         path_str = urllib.parse.urlparse(uri).path
         return cls(path_str)
 
@@ -294,6 +513,8 @@ class Path(cached_content.Path):
             in_memory_folder = cls("/") / "dev" / "shm"
             if in_memory_folder.exists():  # pragma: nocover
                 kwargs["dir"] = in_memory_folder
+        import tempfile
+
         file_handle, path_str = tempfile.mkstemp(**kwargs)
         os.close(file_handle)
         path = cls(path_str)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import os
+import re
+import stat
+import threading
+import typing
+from collections import OrderedDict
+
+header_size = 512
+cache_size = 4096
+
+# common extensions resolved without initializing the mimetypes database
+extension_filetypes = {
+    **dict.fromkeys(
+        (".txt", ".md", ".csv", ".html", ".htm", ".css", ".js", ".py"),
+        "text",
+    ),
+    **dict.fromkeys(
+        (".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp", ".tif", ".tiff", ".svg"),
+        "image",
+    ),
+    **dict.fromkeys(
+        (".mp4", ".m4v", ".mkv", ".webm", ".mov", ".avi", ".mpeg", ".mpg"),
+        "video",
+    ),
+    **dict.fromkeys(
+        (".mp3", ".m4a", ".wav", ".flac", ".ogg", ".opus", ".aac"),
+        "audio",
+    ),
+    **dict.fromkeys(
+        (".json", ".xml", ".pdf", ".zip", ".tar", ".7z"),
+        "application",
+    ),
+}
+
+# (offset, signature, filetype) ordered from most to least specific
+magic_numbers = (
+    (0, b"\x89PNG\r\n\x1a\n", "image"),
+    (0, b"\xff\xd8\xff", "image"),
+    (0, b"GIF87a", "image"),
+    (0, b"GIF89a", "image"),
+    (0, b"II*\x00", "image"),
+    (0, b"MM\x00*", "image"),
+    (8, b"WEBP", "image"),
+    (4, b"ftypM4A", "audio"),
+    (4, b"ftyp", "video"),
+    (0, b"\x1a\x45\xdf\xa3", "video"),
+    (8, b"AVI ", "video"),
+    (8, b"WAVE", "audio"),
+    (0, b"ID3", "audio"),
+    (0, b"fLaC", "audio"),
+    (0, b"OggS", "audio"),
+    (0, b"%PDF-", "application"),
+    (0, b"PK\x03\x04", "application"),
+    (0, b"\x1f\x8b", "application"),
+    (0, b"BZh", "application"),
+    (0, b"\xfd7zXZ\x00", "application"),
+    (0, b"7z\xbc\xaf\x27\x1c", "application"),
+    (0, b"\x28\xb5\x2f\xfd", "application"),
+    (0, b"\x7fELF", "application"),
+    (0, b"SQLite format 3\x00", "application"),
+)
+
+
+def compile_magic_numbers() -> re.Pattern[bytes]:
+    """
+    Combine all signatures in a single pattern to match a header in one pass.
+    """
+    alternatives = (
+        b"(.{%d}%s)" % (offset, re.escape(signature))
+        for offset, signature, _ in magic_numbers
+    )
+    return re.compile(b"|".join(alternatives), flags=re.DOTALL)
+
+
+magic_pattern = compile_magic_numbers()
+detection_cache: OrderedDict[tuple[int, ...], str | None] = OrderedDict()
+detection_cache_lock = threading.Lock()
+
+
+def extension_filetype(name: str) -> str | None:
+    suffix = os.path.splitext(name)[1].lower()  # noqa: PTH122
+    filetype = extension_filetypes.get(suffix)
+    if filetype is None and suffix:
+        import mimetypes
+
+        mimetype = mimetypes.guess_type(name)[0]
+        if mimetype:
+            filetype = mimetype.split("/")[0]
+    return filetype
+
+
+def header_filetype(header: bytes) -> str | None:
+    match = magic_pattern.match(header)
+    if match is not None:
+        # each signature is captured in a group with the same index
+        index = typing.cast("int", match.lastindex) - 1
+        return magic_numbers[index][2]
+    return "text" if header and is_text(header) else None
+
+
+def is_text(header: bytes) -> bool:
+    if b"\x00" in header:
+        return False
+    try:
+        header.decode()
+    except UnicodeDecodeError as exception:
+        # multibyte character can be truncated where the header was cut off
+        return (
+            len(header) == header_size and exception.reason == "unexpected end of data"
+        )
+    return True
+
+
+def content_filetype(path: str | os.PathLike[str]) -> str | None:
+    """
+    Detect filetype from file header and cache result by inode and mtime.
+    """
+    try:
+        stat_result = os.stat(path)  # noqa: PTH116
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    if not stat.S_ISREG(stat_result.st_mode):
+        return None
+    key = (
+        stat_result.st_dev,
+        stat_result.st_ino,
+        stat_result.st_mtime_ns,
+        stat_result.st_size,
+    )
+    with detection_cache_lock:
+        if key in detection_cache:
+            detection_cache.move_to_end(key)
+            return detection_cache[key]
+
+    with open(path, "rb") as fp:  # noqa: PTH123
+        filetype = header_filetype(fp.read(header_size))
+    with detection_cache_lock:
+        detection_cache[key] = filetype
+        if len(detection_cache) > cache_size:
+            detection_cache.popitem(last=False)
+    return filetype
+
+
+def detect_filetype(path: str | os.PathLike[str]) -> str | None:
+    """
+    Use extension of path and fall back to file content for unknown extensions.
+    """
+    filetype = extension_filetype(os.fspath(path))
+    return content_filetype(path) if filetype is None else filetype
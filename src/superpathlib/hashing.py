@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import stat
+import typing
+
+if typing.TYPE_CHECKING:  # pragma: nocover
+    from collections.abc import Callable
+    from typing import IO, Protocol
+
+    class Hasher(Protocol):
+        def update(self, data: bytes, /) -> object: ...
+
+        def digest(self) -> bytes: ...
+
+        def hexdigest(self) -> str: ...
+
+
+block_size = 1 << 20
+partial_block_size = 1 << 16
+# number of blocks hashed in sampled mode
+number_of_samples = 3
+# fast non-cryptographic or parallel algorithms in order of preference
+fast_algorithms = ("xxh3", "blake3")
+
+
+def file_digest(path: str | os.PathLike[str], algorithm: str = "blake2b") -> bytes:
+    """
+    Hash file content in fixed-size blocks to support files of any size.
+    """
+    hasher = create_hasher(algorithm)
+    with open(path, "rb") as fp:  # noqa: PTH123
+        update_from_file(hasher, fp)
+    return hasher.digest()
+
+
+def update_from_file(hasher: Hasher, fp: IO[bytes]) -> None:
+    while block := fp.read(block_size):
+        hasher.update(block)
+
+
+def partial_digest(
+    path: str | os.PathLike[str],
+    size: int,
+    algorithm: str = "blake2b",
+) -> bytes:
+    """
+    Hash the first and last block of a file as cheap comparison of content.
+
+    The digest covers the complete content of files up to two blocks.
+    """
+    hasher = create_hasher(algorithm)
+    with open(path, "rb") as fp:  # noqa: PTH123
+        hasher.update(fp.read(partial_block_size))
+        if size > partial_block_size:
+            fp.seek(max(size - partial_block_size, partial_block_size))
+            hasher.update(fp.read(partial_block_size))
+    return hasher.digest()
+
+
+def sampled_digest(path: str | os.PathLike[str], algorithm: str = "blake2b") -> bytes:
+    """
+    Hash the size and evenly spread blocks of a file.
+
+    Changes that keep the size and fall between the blocks are not detected.
+    The digest covers the complete content of files up to the sampled size.
+    """
+    hasher = create_hasher(algorithm)
+    with open(path, "rb") as fp:  # noqa: PTH123
+        size = os.fstat(fp.fileno()).st_size
+        hasher.update(size.to_bytes(8, "little"))
+        if size <= number_of_samples * partial_block_size:
+            update_from_file(hasher, fp)
+        else:
+            step = (size - partial_block_size) // (number_of_samples - 1)
+            for index in range(number_of_samples):
+                fp.seek(index * step)
+                hasher.update(fp.read(partial_block_size))
+    return hasher.digest()
+
+
+def fingerprint(
+    path: str | os.PathLike[str],
+    algorithm: str = "auto",
+    *,
+    sampled: bool = False,
+    workers: int | None = None,
+) -> str:
+    """
+    Fast fingerprint of the content of a file or a tree for change detection.
+
+    Trees are fingerprinted by the relative paths, types and content of all
+    descendants. Files in trees are hashed concurrently.
+    :param algorithm: xxh3, blake3 or any algorithm of hashlib. The fastest
+        installed algorithm is used for auto.
+    :param sampled: only hash the size and a few blocks of each file
+    :return: algorithm name and hexadecimal digest separated by a colon
+    """
+    if algorithm == "auto":
+        algorithm = choose_fast_algorithm()
+    digest_file = sampled_digest if sampled else file_digest
+    if os.path.isdir(path):  # noqa: PTH112
+        hasher = create_hasher(algorithm)
+        update_from_tree(hasher, os.fspath(path), digest_file, algorithm, workers)
+        digest = hasher.hexdigest()
+    else:
+        digest = digest_file(path, algorithm).hex()
+    return f"{algorithm}:{digest}"
+
+
+def update_from_tree(
+    hasher: Hasher,
+    root: str,
+    digest_file: Callable[[str, str], bytes],
+    algorithm: str,
+    workers: int | None,
+) -> None:
+    from .snapshot import scan
+    from .utils import map_concurrently
+
+    entries = [(entry.path, info.st_mode) for _, entry, info in scan(root)]
+    files = [path for path, mode in entries if stat.S_ISREG(mode)]
+    digests = iter(
+        map_concurrently(lambda path: digest_file(path, algorithm), files, workers),
+    )
+    for path, mode in entries:
+        name = os.path.relpath(path, root)
+        hasher.update(os.fsencode(name) + b"\0")
+        if stat.S_ISREG(mode):
+            hasher.update(b"f" + next(digests))
+        elif stat.S_ISLNK(mode):
+            hasher.update(b"l" + os.fsencode(os.readlink(path)) + b"\0")  # noqa: PTH115
+        else:
+            hasher.update(b"d" if stat.S_ISDIR(mode) else b"o")
+
+
+@functools.cache
+def choose_fast_algorithm() -> str:
+    for algorithm in fast_algorithms:
+        try:
+            create_hasher(algorithm)
+        except ImportError:
+            continue
+        return algorithm
+    return "blake2b"
+
+
+def create_hasher(algorithm: str) -> Hasher:
+    if algorithm == "xxh3":
+        import xxhash
+
+        return xxhash.xxh3_128()
+    if algorithm == "blake3":
+        from blake3 import blake3
+
+        return blake3(max_threads=blake3.AUTO)
+    return hashlib.new(algorithm)
@@ -0,0 +1,343 @@
+"""
+Opt-in instrumentation of path operations.
+
+Hooks are only installed while a recorder is active so disabled instrumentation
+has no overhead. Usage:
+
+with instrumentation.recording() as recorder:
+    path.text = content
+stats = recorder.snapshot()["text.setter"]
+"""
+
+from __future__ import annotations
+
+import inspect
+import threading
+import time
+import typing
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from functools import wraps
+from typing import Any
+
+from . import (
+    base,
+    compact,
+    content_properties,
+    encryption,
+    extra_functionality,
+    metadata_properties,
+    override,
+)
+
+if typing.TYPE_CHECKING:  # pragma: nocover
+    from collections.abc import Callable, Iterable, Iterator
+
+# bucket i counts calls that took less than 2**i microseconds
+histogram_size = 32
+
+
+@dataclass
+class OperationStats:
+    """
+    Statistics of an operation including the work done by nested operations.
+
+    Stat calls are counted when they go through Path.stat or Path.lstat.
+    """
+
+    calls: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    stat_calls: int = 0
+    histogram: list[int] = field(default_factory=lambda: [0] * histogram_size)
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+    @property
+    def latency_histogram(self) -> dict[float, int]:
+        """
+        :return: number of calls per latency upper bound in seconds
+        """
+        return {
+            (1 << index) / 1e6: count
+            for index, count in enumerate(self.histogram)
+            if count
+        }
+
+    def add_call(self, duration: float, *, error: bool) -> None:
+        self.calls += 1
+        self.errors += error
+        self.total_time += duration
+        bucket = min(int(duration * 1e6).bit_length(), histogram_size - 1)
+        self.histogram[bucket] += 1
+
+    def copy(self) -> OperationStats:
+        return replace(self, histogram=self.histogram.copy())
+
+
+@dataclass
+class Recorder:
+    operations: dict[str, OperationStats] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def get_stats(self, name: str) -> OperationStats:
+        stats = self.operations.get(name)
+        if stats is None:
+            stats = self.operations[name] = OperationStats()
+        return stats
+
+    def record_call(self, name: str, duration: float, *, error: bool) -> None:
+        with self.lock:
+            self.get_stats(name).add_call(duration, error=error)
+
+    def add(self, names: Iterable[str], counter: str, amount: int) -> None:
+        with self.lock:
+            for name in names:
+                stats = self.get_stats(name)
+                setattr(stats, counter, getattr(stats, counter) + amount)
+
+    def snapshot(self) -> dict[str, OperationStats]:
+        with self.lock:
+            return {name: stats.copy() for name, stats in self.operations.items()}
+
+    def reset(self) -> None:
+        with self.lock:
+            self.operations.clear()
+
+
+recorders: tuple[Recorder, ...] = ()
+local = threading.local()
+# attribute owners and original values of installed hooks
+missing = object()
+installed_hooks: list[tuple[Any, str, Any]] = []
+hooks_lock = threading.Lock()
+
+
+def get_stack() -> list[str]:
+    stack: list[str] | None = getattr(local, "stack", None)
+    if stack is None:
+        stack = local.stack = []
+    return stack
+
+
+def add(counter: str, amount: int) -> None:
+    """
+    Attribute amount to all operations that are running in the current thread.
+    """
+    names = set(get_stack())
+    for recorder in recorders:
+        recorder.add(names, counter, amount)
+
+
+def measure(
+    name: str,
+    function: Callable[..., Any],
+    count: Callable[[tuple[Any, ...], Any], tuple[str, int]] | None = None,
+) -> Callable[..., Any]:
+    """
+    :param count: extract counter and amount to add from arguments and result
+    """
+
+    @wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        stack = get_stack()
+        stack.append(name)
+        error = False
+        start = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+            if count is not None:
+                add(*count(args, result))
+        except BaseException:
+            error = True
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            stack.pop()
+            for recorder in recorders:
+                recorder.record_call(name, duration, error=error)
+        return result
+
+    return wrapper
+
+
+def measure_generator(
+    name: str,
+    function: Callable[..., Iterator[Any]],
+) -> Callable[..., Iterator[Any]]:
+    """
+    Measure time spent producing items and exclude time spent by the consumer.
+    """
+
+    @wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Iterator[Any]:
+        stack = get_stack()
+        duration = 0.0
+        error = False
+        items = function(*args, **kwargs)
+        try:
+            while True:
+                stack.append(name)
+                start = time.perf_counter()
+                try:
+                    item = next(items)
+                except StopIteration:
+                    break
+                except BaseException:
+                    error = True
+                    raise
+                finally:
+                    duration += time.perf_counter() - start
+                    stack.pop()
+                yield item
+        finally:
+            for recorder in recorders:
+                recorder.record_call(name, duration, error=error)
+
+    return wrapper
+
+
+def count_read(_: tuple[Any, ...], result: Any) -> tuple[str, int]:
+    return "bytes_read", len(result)
+
+
+def count_written(args: tuple[Any, ...], _: Any) -> tuple[str, int]:
+    return "bytes_written", len(args[1])
+
+
+def measure_stat(name: str, function: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Count stat calls for the running operations including calls that fail.
+    """
+    measured_function = measure(name, function)
+
+    @wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        add("stat_calls", 1)
+        return measured_function(*args, **kwargs)
+
+    return wrapper
+
+
+def wrap(name: str, value: Any) -> Any:
+    if isinstance(value, property):
+        fset = value.fset and measure(f"{name}.setter", value.fset)
+        return property(measure(name, value.fget), fset, value.fdel, value.__doc__)  # type: ignore[arg-type]
+    if inspect.isgeneratorfunction(value):
+        return measure_generator(name, value)
+    return measure(name, value)
+
+
+def generate_targets() -> Iterator[tuple[Any, str, Any]]:
+    """
+    :return: attribute owner, attribute name and hook to install
+    """
+    # text is counted in characters
+    primitives = {
+        "read_bytes": count_read,
+        "read_text": count_read,
+        "write_bytes": count_written,
+        "write_text": count_written,
+    }
+    for name, count in primitives.items():
+        yield base.Path, name, measure(name, getattr(base.Path, name), count)
+    # lstat calls stat and os.stat is not hooked to leave other code unaffected
+    yield base.Path, "stat", measure_stat("stat", base.Path.stat)
+
+    operations = {
+        content_properties.Path: (
+            "byte_content",
+            "text",
+            "lines",
+            "content_lines",
+            "json",
+            "yaml",
+            "numpy",
+        ),
+        metadata_properties.Path: (
+            "mtime",
+            "size",
+            "tags",
+            "tag",
+            "filetype",
+            "content_hash",
+            "fingerprint",
+            "tree_size",
+            "disk_usage",
+            "has_children",
+            "number_of_children",
+            "owner",
+        ),
+        extra_functionality.Path: (
+            "find",
+            "copy_to",
+            "copy_properties_to",
+            "unpack",
+            "rmtree",
+            "clear",
+            "snapshot",
+        ),
+        override.Path: ("touch", "rename", "replace", "iterdir", "open", "rmdir"),
+    }
+    compact_class = compact.CompactPath
+    for owner, names in operations.items():
+        for name in names:
+            yield owner, name, wrap(name, owner.__dict__[name])
+            # the compact class holds copies of the attributes of all mixins
+            yield compact_class, name, wrap(name, compact_class.__dict__[name])
+    for name in ("read_bytes", "write_bytes"):
+        value = encryption.EncryptedPath.__dict__[name]
+        yield encryption.EncryptedPath, name, measure(f"EncryptedPath.{name}", value)
+
+
+def install_hooks() -> None:
+    for owner, name, hook in generate_targets():
+        installed_hooks.append((owner, name, vars(owner).get(name, missing)))
+        setattr(owner, name, hook)
+
+
+def uninstall_hooks() -> None:
+    while installed_hooks:
+        owner, name, original = installed_hooks.pop()
+        if original is missing:
+            delattr(owner, name)
+        else:
+            setattr(owner, name, original)
+
+
+def start(recorder: Recorder | None = None) -> Recorder:
+    """
+    Start recording operations and install hooks if needed.
+    """
+    global recorders  # noqa: PLW0603
+    if recorder is None:
+        recorder = Recorder()
+    with hooks_lock:
+        if not installed_hooks:
+            install_hooks()
+        recorders = (*recorders, recorder)
+    return recorder
+
+
+def stop(recorder: Recorder) -> None:
+    """
+    Stop recording and remove hooks when no recorders are left.
+    """
+    global recorders  # noqa: PLW0603
+    with hooks_lock:
+        recorders = tuple(active for active in recorders if active is not recorder)
+        if not recorders:
+            uninstall_hooks()
+
+
+@contextmanager
+def recording() -> Iterator[Recorder]:
+    recorder = start()
+    try:
+        yield recorder
+    finally:
+        stop(recorder)
@@ -0,0 +1,265 @@
+"""
+Line offset index stored in a sidecar file for random access to lines.
+
+The sidecar contains a header followed by the start offset of every line as
+native uint64 values. The header records the size, mtime and inode of the
+indexed file, a digest of the end of the indexed content and the number of
+offsets. The index is reused while these match, extended when the file only
+grew and rebuilt otherwise. Offsets beyond the recorded number are left by
+interrupted updates and are discarded. Updates lock the sidecar. Files in
+directories where the sidecar can not be created are indexed in memory.
+"""
+
+from __future__ import annotations
+
+import errno
+import hashlib
+import io
+import itertools
+import mmap
+import operator
+import os
+import struct
+import sys
+import typing
+from array import array
+from dataclasses import dataclass, field
+
+if typing.TYPE_CHECKING:  # pragma: nocover
+    from types import TracebackType
+    from typing import IO
+
+    from typing_extensions import Self
+
+    from .content_properties import Path
+
+magic = b"SPLIDX2" + sys.byteorder[0].encode()
+# magic, indexed size, mtime_ns, inode, device, digest of the content end,
+# number of offsets
+header_format = struct.Struct("=8sQqQQ16sQ")
+offset_size = array("Q").itemsize
+digest_size = 16
+digested_size = 4096
+block_size = 1 << 20
+
+
+class Header(typing.NamedTuple):
+    size: int
+    mtime_ns: int
+    inode: int
+    device: int
+    digest: bytes
+    number_of_offsets: int
+
+    @property
+    def end(self) -> int:
+        """
+        Position after the last valid offset in the sidecar.
+        """
+        return header_format.size + self.number_of_offsets * offset_size
+
+    def pack(self) -> bytes:
+        return header_format.pack(magic, *self)
+
+    @classmethod
+    def unpack(cls, data: bytes) -> Header | None:
+        if len(data) < header_format.size:
+            return None
+        stored_magic, *values = header_format.unpack_from(data)
+        return cls(*values) if stored_magic == magic else None
+
+
+def lock(file: IO[bytes]) -> None:
+    """
+    Lock file exclusively until it is closed.
+    """
+    import fcntl
+
+    fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+
+
+@dataclass
+class LineIndex:
+    """
+    Random access to lines separated by newlines with a single seek per read.
+
+    Changes to the file are only visible after refresh.
+    """
+
+    path: Path
+    index_path: Path
+    size: int = field(default=0, init=False)
+    file: IO[bytes] | None = field(default=None, init=False)
+    index_map: mmap.mmap | None = field(default=None, init=False)
+    offsets: memoryview | None = field(default=None, init=False)
+
+    @classmethod
+    def open(cls, path: Path, index_path: Path | None = None) -> LineIndex:
+        if path.is_compressed:
+            message = f"Compressed files can not be accessed at offsets: {path}"
+            raise ValueError(message)
+        if index_path is None:
+            index_path = path.with_name(f".{path.name}.lines")
+        index = cls(path, index_path)
+        index.refresh()
+        return index
+
+    def refresh(self) -> None:
+        """
+        Validate index and extend it with content appended to the file.
+        """
+        self.close()
+        self.file = open(self.path, "rb")  # noqa: PTH123, SIM115
+        info = os.fstat(self.file.fileno())
+        try:
+            descriptor = os.open(self.index_path, os.O_RDWR | os.O_CREAT, 0o666)
+        except OSError as exception:
+            if not isinstance(exception, PermissionError) and (
+                exception.errno != errno.EROFS
+            ):
+                raise
+            # read-only directories and mounts are indexed in memory
+            self.create_memory_index(info)
+        else:
+            self.refresh_sidecar(descriptor, info)
+
+    def refresh_sidecar(self, descriptor: int, info: os.stat_result) -> None:
+        with open(descriptor, "r+b") as index_file:
+            lock(index_file)
+            stored_header = Header.unpack(index_file.read(header_format.size))
+            header = stored_header
+            if header is None or not self.is_prefix(header, info):
+                # invalidate the header before offsets are overwritten
+                index_file.seek(0)
+                index_file.write(b"\0" * header_format.size)
+                index_file.write(array("Q", [0]).tobytes())
+                header = Header(0, 0, info.st_ino, info.st_dev, b"", 1)
+            if (header.size, header.mtime_ns) != (info.st_size, info.st_mtime_ns):
+                index_file.seek(header.end)
+                index_file.truncate()
+                count = self.append_offsets(index_file, header.size, info.st_size)
+                header = Header(
+                    info.st_size,
+                    info.st_mtime_ns,
+                    info.st_ino,
+                    info.st_dev,
+                    self.calculate_digest(info.st_size),
+                    header.number_of_offsets + count,
+                )
+            if header != stored_header:
+                # offsets are written before the header that validates them
+                index_file.flush()
+                index_file.seek(0)
+                index_file.write(header.pack())
+        self.size = header.size
+        with self.index_path.open("rb") as index_file:
+            self.index_map = mmap.mmap(
+                index_file.fileno(),
+                header.end,
+                access=mmap.ACCESS_READ,
+            )
+        self.offsets = memoryview(self.index_map)[header_format.size :].cast("Q")
+
+    def create_memory_index(self, info: os.stat_result) -> None:
+        index_file = io.BytesIO()
+        index_file.write(array("Q", [0]).tobytes())
+        self.append_offsets(index_file, 0, info.st_size)
+        self.size = info.st_size
+        self.offsets = index_file.getbuffer().cast("Q")
+
+    def is_prefix(self, header: Header, info: os.stat_result) -> bool:
+        """
+        Whether the indexed content is still the start of the file.
+        """
+        if (header.inode, header.device) != (info.st_ino, info.st_dev):
+            return False
+        if (header.size, header.mtime_ns) == (info.st_size, info.st_mtime_ns):
+            return True
+        # content is assumed to be appended when the end of the old content
+        # is unchanged
+        return (
+            header.size < info.st_size
+            and self.calculate_digest(header.size) == header.digest
+        )
+
+    def calculate_digest(self, size: int) -> bytes:
+        file = typing.cast("IO[bytes]", self.file)
+        start = max(size - digested_size, 0)
+        file.seek(start)
+        content = file.read(size - start)
+        return hashlib.blake2b(content, digest_size=digest_size).digest()
+
+    def append_offsets(self, index_file: IO[bytes], start: int, end: int) -> int:
+        """
+        Write the start offsets of lines that begin after a newline in the range.
+
+        :return: number of written offsets
+        """
+        file = typing.cast("IO[bytes]", self.file)
+        file.seek(start)
+        position = start
+        count = 0
+        while position < end:
+            block = file.read(min(block_size, end - position))
+            if not block:
+                break  # pragma: nocover
+            parts = block.split(b"\n")
+            del parts[-1]
+            # offset after each newline = content before it + newlines so far
+            lengths = itertools.accumulate(map(len, parts))
+            offsets = map(operator.add, lengths, itertools.count(position + 1))
+            offsets_array = array("Q", offsets)
+            index_file.write(offsets_array.tobytes())
+            count += len(offsets_array)
+            position += len(block)
+        return count
+
+    def __len__(self) -> int:
+        offsets = typing.cast("memoryview", self.offsets)
+        number_of_lines = len(offsets)
+        # a trailing newline does not start a new line
+        return number_of_lines - 1 if offsets[-1] == self.size else number_of_lines
+
+    def line(self, number: int) -> str:
+        length = len(self)
+        if number < 0:
+            number += length
+        if not 0 <= number < length:
+            message = f"Line {number} out of range for {length} lines"
+            raise IndexError(message)
+        return self.lines(number, number + 1)[0]
+
+    def lines(self, start: int = 0, stop: int | None = None) -> list[str]:
+        """
+        Read lines in range with slice semantics.
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if start >= stop:
+            return []
+        offsets = typing.cast("memoryview", self.offsets)
+        file = typing.cast("IO[bytes]", self.file)
+        begin = offsets[start]
+        end = offsets[stop] - 1 if stop < len(offsets) else self.size
+        file.seek(begin)
+        content = file.read(end - begin).decode()
+        return [line.removesuffix("\r") for line in content.split("\n")]
+
+    def close(self) -> None:
+        if self.offsets is not None:
+            self.offsets.release()
+        if self.index_map is not None:
+            self.index_map.close()
+        if self.file is not None:
+            self.file.close()
+        self.offsets = self.index_map = self.file = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
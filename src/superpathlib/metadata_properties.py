@@ -1,14 +1,20 @@
-import hashlib
-import mimetypes
+import itertools
 import os
+import stat
+import typing
 import warnings
-from collections.abc import Callable
-from functools import wraps
+from collections.abc import Callable, Iterable, Mapping
+from functools import partial, wraps
 from typing import Any, TypeVar, cast
 
 from . import content_properties
+from .utils import map_concurrently
+
+if typing.TYPE_CHECKING:  # pragma: nocover
+    from .disk_usage import DiskUsage, DiskUsageScanner
 
 T = TypeVar("T")
+PathLikeT = TypeVar("PathLikeT", bound="str | os.PathLike[str]")
 
 
 def catch_missing(
@@ -28,6 +34,33 @@ def catch_missing(
     return wrap_function
 
 
+def count_children(path: str | os.PathLike[str], limit: int | None = None) -> int:
+    """
+    Count children of directory without creating path objects.
+
+    :param limit: stop counting after this number of children
+    :return: 0 if path is not an existing directory
+    """
+    try:
+        with os.scandir(path) as entries:
+            return sum(1 for _ in itertools.islice(entries, limit))
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+
+
+def is_empty(path: str | os.PathLike[str]) -> bool:
+    """
+    :return: whether path is missing, an empty file or a directory without children
+    """
+    try:
+        stat_result = os.stat(path)  # noqa: PTH116
+    except (FileNotFoundError, NotADirectoryError):
+        return True
+    if stat.S_ISDIR(stat_result.st_mode):
+        return count_children(path, limit=1) == 0
+    return stat.S_ISREG(stat_result.st_mode) and stat_result.st_size == 0
+
+
 class Path(content_properties.Path):
     """
     Properties to read & write metadata.
@@ -50,49 +83,256 @@ class Path(content_properties.Path):
 
     @tags.setter
     def tags(self, values: list[str | int | None]) -> None:
-        from .tags import XDGTags  # , autoimport
+        from .tag_index import update_indices
+        from .tags import XDGTags, format_tags  # , autoimport
 
         if len(values) == 0:
             XDGTags(self).clear()
         else:
             XDGTags(self).set(*values)
+        update_indices(self, format_tags(values))
 
     @property
     def tag(self) -> str | None:
-        return self.tags[0] if self.tags else None
+        from .tags import XDGTags  # , autoimport
+
+        return XDGTags(self).first()
 
     @tag.setter
     def tag(self, value: str | int | None) -> None:
-        from .tags import XDGTags  # , autoimport
+        from .tag_index import update_indices
+        from .tags import XDGTags, format_tags  # , autoimport
 
         XDGTags(self).set(value)
+        update_indices(self, format_tags([value]))
+
+    @classmethod
+    def tags_many(
+        cls,
+        paths: Iterable[str | os.PathLike[str]],
+        *,
+        workers: int | None = None,
+    ) -> list[list[str]]:
+        """
+        Read tags of many paths with one opened file descriptor per path.
+        """
+        from .tags import get_tags
+
+        return map_concurrently(get_tags, paths, workers)
+
+    @classmethod
+    def set_tags_many(
+        cls,
+        tags: Mapping[str | os.PathLike[str], Iterable[str | int | None]],
+        *,
+        workers: int | None = None,
+    ) -> None:
+        """
+        Replace tags of many paths with one opened file descriptor per path.
+
+        Tags are removed for paths mapped to no values.
+        """
+        from .tag_index import update_indices
+        from .tags import set_tags
+
+        items = list(tags.items())
+        stored_tags = map_concurrently(lambda item: set_tags(*item), items, workers)
+        for (path, _), path_tags in zip(items, stored_tags, strict=True):
+            update_indices(path, path_tags)
+
+    @classmethod
+    def write_many(  # noqa: PLR0913
+        cls,
+        contents: Mapping[PathLikeT, Any],
+        format: str = "byte_content",  # noqa: A002
+        *,
+        atomic: bool = False,
+        mtimes: Mapping[PathLikeT, float] | None = None,
+        tags: Mapping[PathLikeT, Iterable[str | int | None]] | None = None,
+        workers: int | None = None,
+    ) -> None:
+        """
+        Write content of many paths concurrently.
+
+        Missing parent directories are created once before writing.
+        :param contents: content to write by path
+        :param format: content property to write like text, json or yaml
+        :param atomic: write to a temporary file that replaces the path so that
+            readers never see partial content
+        :param mtimes: modified times to set by path
+        :param tags: tags to set by path
+        """
+        from .bulk import write_many
+
+        write_many(
+            cls,
+            contents,
+            format,
+            atomic=atomic,
+            mtimes=mtimes,
+            tags=tags,
+            workers=workers,
+        )
+
+    @classmethod
+    def attributes_many(
+        cls,
+        paths: Iterable[str | os.PathLike[str]],
+        names: Iterable[str],
+        *,
+        workers: int | None = None,
+    ) -> list[dict[str, bytes]]:
+        """
+        Read extended attributes of many paths with one opened file descriptor per
+        path.
+
+        :return: values of the attributes that are set for each path
+        """
+        from .tags import get_attributes
+
+        names = tuple(names)
+        return map_concurrently(partial(get_attributes, names=names), paths, workers)
+
+    @classmethod
+    def set_attributes_many(
+        cls,
+        attributes: Mapping[str | os.PathLike[str], Mapping[str, bytes | None]],
+        *,
+        workers: int | None = None,
+    ) -> None:
+        """
+        Write extended attributes of many paths with one opened file descriptor per
+        path.
+
+        Attributes with value None are removed.
+        """
+        from .tag_index import update_indices
+        from .tags import default_tag_name, delim, set_attributes
+
+        items = list(attributes.items())
+        map_concurrently(lambda item: set_attributes(*item), items, workers)
+        for path, values in items:
+            if default_tag_name in values:
+                value = values[default_tag_name]
+                tags = [] if value is None else value.decode().strip().split(delim)
+                update_indices(path, tags)
 
     @property
     @catch_missing(default=0)
     def size(self) -> int:
         return self.stat().st_size
 
+    @property
+    @catch_missing(default=0)
+    def tree_size(self) -> int:
+        """
+        Apparent size of path and all its descendants.
+        """
+        return self.disk_usage().apparent_size
+
+    def disk_usage(
+        self,
+        *,
+        workers: int | None = None,
+        scanner: "DiskUsageScanner | None" = None,
+    ) -> "DiskUsage":
+        """
+        Apparent and allocated size of path and all its descendants.
+
+        Files with multiple hardlinks are only counted once.
+        Reuse a scanner to reuse subtotals of unchanged directories.
+        """
+        from .disk_usage import DiskUsageScanner
+
+        if scanner is None:
+            scanner = DiskUsageScanner(workers=workers)
+        return scanner.scan(self)
+
     @property
     def is_root(self) -> bool:
         path = self
-        while not path.exists():
-            path = path.parent
-        return path.owner() == "root"
+        while True:
+            try:
+                return path.owner() == "root"
+            except (FileNotFoundError, NotADirectoryError):  # noqa: PERF203
+                path = path.parent
+
+    def owner(self, *, follow_symlinks: bool = True) -> str:
+        from .ownership import user_name
+
+        return user_name(self.stat(follow_symlinks=follow_symlinks).st_uid)
+
+    def group(self, *, follow_symlinks: bool = True) -> str:
+        from .ownership import group_name
+
+        return group_name(self.stat(follow_symlinks=follow_symlinks).st_gid)
+
+    @classmethod
+    def owners_many(
+        cls,
+        paths: Iterable[str | os.PathLike[str]],
+        *,
+        workers: int | None = None,
+    ) -> list[str]:
+        from .ownership import owner_name
+
+        return map_concurrently(owner_name, paths, workers)
 
     @property
     def has_children(self) -> bool:
-        return next(self.iterdir(), None) is not None if self.is_dir() else False
+        return count_children(self, limit=1) > 0
 
     @property
     def number_of_children(self) -> int:
-        return sum(1 for _ in self.iterdir()) if self.is_dir() else 0
+        return count_children(self)
+
+    @classmethod
+    def has_children_many(
+        cls,
+        paths: Iterable[str | os.PathLike[str]],
+        *,
+        workers: int | None = None,
+    ) -> list[bool]:
+        counts = map_concurrently(partial(count_children, limit=1), paths, workers)
+        return [count > 0 for count in counts]
+
+    @classmethod
+    def number_of_children_many(
+        cls,
+        paths: Iterable[str | os.PathLike[str]],
+        *,
+        workers: int | None = None,
+    ) -> list[int]:
+        return map_concurrently(count_children, paths, workers)
+
+    @classmethod
+    def is_empty_many(
+        cls,
+        paths: Iterable[str | os.PathLike[str]],
+        *,
+        workers: int | None = None,
+    ) -> list[bool]:
+        return map_concurrently(is_empty, paths, workers)
 
     @property
     def filetype(self) -> str | None:
-        filetype = mimetypes.guess_type(self)[0]
-        if filetype:
-            filetype = filetype.split("/")[0]
-        return filetype
+        """
+        Content type derived from extension or from file header if unknown.
+        """
+        from .filetypes import detect_filetype
+
+        return detect_filetype(self)
+
+    @classmethod
+    def filetypes_many(
+        cls,
+        paths: Iterable[str | os.PathLike[str]],
+        *,
+        workers: int | None = None,
+    ) -> list[str | None]:
+        from .filetypes import detect_filetype
+
+        return map_concurrently(detect_filetype, paths, workers)
 
     @property
     def content_hash(self) -> str | None:
@@ -115,4 +355,46 @@ class Path(content_properties.Path):
 
     @property
     def file_content_hash(self) -> str:
+        import hashlib
+
         return hashlib.new("sha512", data=self.byte_content).hexdigest()
+
+    @property
+    def fingerprint(self) -> str | None:
+        """
+        Fast fingerprint of file or tree content for change detection and cache keys.
+        """
+        return self.calculate_fingerprint()
+
+    @catch_missing()
+    def calculate_fingerprint(
+        self,
+        algorithm: str = "auto",
+        *,
+        sampled: bool = False,
+        workers: int | None = None,
+    ) -> str | None:
+        """
+        :param algorithm: xxh3, blake3 or any algorithm of hashlib. The fastest
+            installed algorithm is used for auto.
+        :param sampled: only hash the size and a few blocks of each file
+        """
+        from .hashing import fingerprint
+
+        return fingerprint(self, algorithm, sampled=sampled, workers=workers)
+
+    @classmethod
+    def fingerprints_many(
+        cls,
+        paths: Iterable[str | os.PathLike[str]],
+        algorithm: str = "auto",
+        *,
+        sampled: bool = False,
+        workers: int | None = None,
+    ) -> list[str | None]:
+        from .hashing import fingerprint
+
+        calculate_fingerprint = catch_missing()(
+            partial(fingerprint, algorithm=algorithm, sampled=sampled, workers=1),
+        )
+        return map_concurrently(calculate_fingerprint, paths, workers)
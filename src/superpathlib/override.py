@@ -1,16 +1,19 @@
+from __future__ import annotations
+
 import io
-import shutil
 import typing
-from collections.abc import Callable, Generator
 from functools import wraps
-from os import PathLike
 from typing import IO, Any, TypeVar
 
-from typing_extensions import Self
-
-from . import encryption
+from . import directory_cache, encryption
 from .metadata_properties import catch_missing
 
+if typing.TYPE_CHECKING:  # pragma: nocover
+    from collections.abc import Callable, Generator
+    from os import PathLike
+
+    from typing_extensions import Self
+
 T = TypeVar("T", bound="Path")
 
 
@@ -21,6 +24,8 @@ def create_parent_on_missing(func: Callable[..., Any]) -> Callable[..., Any]:
             res = func(*args, **kwargs)
         except FileNotFoundError:
             path = encryption.Path(args[0])
+            # directories known to exist can be removed by other processes
+            directory_cache.forget(path.parent)
             path.create_parent()
             res = func(*args, **kwargs)
         return res
@@ -47,6 +52,7 @@ class Path(encryption.Path):
 
     @catch_missing(default=0)
     def rmdir(self) -> None:
+        directory_cache.forget(self)
         return super().rmdir()
 
     def iterdir(self, *, missing_ok: bool = True) -> Generator[Self, None, None]:
@@ -77,9 +83,15 @@ class Path(encryption.Path):
                         raise RuntimeError(message) from exception
                 else:
                     target_path.create_parent()
+                import shutil
+
                 target_path = self.__class__(shutil.move(self, target_path))
             else:
+                if isinstance(exception, FileNotFoundError):
+                    # retry creates the parent of the target if it was removed
+                    directory_cache.forget(target_path.parent)
                 raise
+        directory_cache.forget(self)
         return target_path
 
     def replace(self, target: str | PathLike[str]) -> Self:
@@ -96,6 +108,7 @@ class Path(encryption.Path):
     def open_non_existing(self, mode: str, **kwargs: Any) -> IO[Any]:
         if "w" in mode or "a" in mode:
             # exist_ok=True: catch race conditions when calling multiple times
+            directory_cache.forget(self.parent)
             self.create_parent()
             res = self.open(mode, **kwargs)
         else:
@@ -0,0 +1,43 @@
+import os
+from functools import lru_cache
+
+# Lazy imports because pwd and grp are not available on all platforms
+
+cache_size = 1024
+
+
+@lru_cache(maxsize=cache_size)
+def user_name(uid: int) -> str:
+    """
+    :return: name of user or uid as string for unknown users
+    """
+    import pwd
+
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+
+@lru_cache(maxsize=cache_size)
+def group_name(gid: int) -> str:
+    """
+    :return: name of group or gid as string for unknown groups
+    """
+    import grp
+
+    try:
+        return grp.getgrgid(gid).gr_name
+    except KeyError:
+        return str(gid)
+
+
+@lru_cache(maxsize=cache_size)
+def user_id(name: str) -> int:
+    import pwd
+
+    return pwd.getpwnam(name).pw_uid
+
+
+def owner_name(path: str | os.PathLike[str]) -> str:
+    return user_name(os.stat(path).st_uid)  # noqa: PTH116
@@ -0,0 +1,488 @@
+from __future__ import annotations
+
+import contextlib
+import operator
+import os
+import pathlib
+import stat
+import sys
+import typing
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import repeat
+from typing import Any, Generic, Literal, NamedTuple, TypeVar
+
+from .hashing import file_digest
+from .ownership import user_id
+
+if typing.TYPE_CHECKING:  # pragma: nocover
+    from numpy.typing import NDArray
+
+PathT = TypeVar("PathT", bound=pathlib.Path)
+
+FileType = Literal["file", "directory", "symlink"]
+file_type_modes = {
+    "file": stat.S_IFREG,
+    "directory": stat.S_IFDIR,
+    "symlink": stat.S_IFLNK,
+}
+file_type_mask = 0o170000
+Condition = tuple[str, Callable[[Any, Any], Any], int]
+MoveDetection = Literal["inode", "content"]
+RecordValues = tuple[int, str, int, int, int, int, bytes | None]
+
+
+def sorted_children(path: str) -> Iterator[os.DirEntry[str]]:
+    with os.scandir(path) as entries:
+        children = sorted(entries, key=operator.attrgetter("name"))
+    return iter(children)
+
+
+def scan(
+    root: str,
+    *,
+    follow_symlinks: bool = False,
+) -> Iterator[tuple[int, os.DirEntry[str], os.stat_result]]:
+    """
+    Walk tree depth-first with children sorted by name.
+
+    The resulting order is the lexicographic order of the relative path parts,
+    which allows comparing trees with a single sorted merge.
+    :return: parent index, directory entry and stat result of each descendant.
+             Entries are indexed in the order they are yielded and the root has
+             index -1.
+    """
+    index = 0
+    to_traverse = [(-1, sorted_children(root))]
+    while to_traverse:
+        parent, children = to_traverse[-1]
+        child = next(children, None)
+        if child is None:
+            to_traverse.pop()
+            continue
+        try:
+            stat_result = child.stat(follow_symlinks=follow_symlinks)
+        except FileNotFoundError:  # pragma: nocover
+            # removed during scan
+            continue
+        yield parent, child, stat_result
+        if stat.S_ISDIR(stat_result.st_mode):
+            # skip folders that do not allow listing
+            with contextlib.suppress(PermissionError):
+                to_traverse.append((index, sorted_children(child.path)))
+        index += 1
+
+
+class Record(NamedTuple):
+    parts: tuple[str, ...]
+    size: int
+    mtime: int
+    mode: int
+    inode: int
+    digest: bytes | None
+
+    def is_modified(self, other: Record) -> bool:
+        file_type = self.mode & file_type_mask
+        return file_type != other.mode & file_type_mask or (
+            # directory mtime changes with its children
+            file_type != stat.S_IFDIR
+            and (self.size != other.size or self.mtime != other.mtime)
+        )
+
+    def move_key(self, detect_moves: MoveDetection) -> tuple[int, ...] | bytes | None:
+        file_type = self.mode & file_type_mask
+        key: tuple[int, ...] | bytes | None
+        if detect_moves == "content":
+            key = self.digest
+        elif file_type == stat.S_IFDIR:
+            key = (self.inode, file_type)
+        else:
+            # size and mtime are preserved when moving but not when inodes are reused
+            key = (self.inode, file_type, self.size, self.mtime)
+        return key
+
+
+def create_records(values: Iterable[RecordValues]) -> Iterator[Record]:
+    """
+    Add relative path parts to values of entries in sorted depth-first order.
+
+    Only the ancestors of the current entry are kept in memory.
+    """
+    ancestors: list[tuple[int, tuple[str, ...]]] = [(-1, ())]
+    for index, (parent, name, *metadata) in enumerate(values):
+        while ancestors[-1][0] != parent:
+            ancestors.pop()
+        parts = (*ancestors[-1][1], name)
+        record = Record(parts, *metadata)  # type: ignore[arg-type]
+        if stat.S_ISDIR(record.mode):
+            ancestors.append((index, parts))
+        yield record
+
+
+@dataclass
+class TreeDiff(Generic[PathT]):
+    added: list[PathT] = field(default_factory=list)
+    removed: list[PathT] = field(default_factory=list)
+    modified: list[PathT] = field(default_factory=list)
+    moved: list[tuple[PathT, PathT]] = field(default_factory=list)
+
+
+@dataclass
+class RecordDiff:
+    added: list[Record] = field(default_factory=list)
+    removed: list[Record] = field(default_factory=list)
+    modified: list[Record] = field(default_factory=list)
+    moved: list[tuple[Record, Record]] = field(default_factory=list)
+
+    @classmethod
+    def from_merge(cls, old: Iterator[Record], new: Iterator[Record]) -> RecordDiff:
+        """
+        Compare two streams of records that are sorted by their path parts.
+        """
+        diff = cls()
+        old_record = next(old, None)
+        new_record = next(new, None)
+        while old_record is not None or new_record is not None:
+            if new_record is None or (
+                old_record is not None and old_record.parts < new_record.parts
+            ):
+                diff.removed.append(old_record)  # type: ignore[arg-type]
+                old_record = next(old, None)
+            elif old_record is None or new_record.parts < old_record.parts:
+                diff.added.append(new_record)
+                new_record = next(new, None)
+            else:
+                if old_record.is_modified(new_record):
+                    diff.modified.append(new_record)
+                old_record = next(old, None)
+                new_record = next(new, None)
+        return diff
+
+    def detect_moves(self, detect_moves: MoveDetection) -> None:
+        removed_by_key = {}
+        for record in self.removed:
+            key = record.move_key(detect_moves)
+            if key is not None:
+                removed_by_key[key] = record
+        for record in self.added:
+            key = record.move_key(detect_moves)
+            removed_record = removed_by_key.pop(key, None) if key is not None else None
+            if removed_record is not None:
+                self.moved.append((removed_record, record))
+
+        moved_pairs = {(old.parts, new.parts) for old, new in self.moved}
+        moved_old = {old for old, _ in self.moved}
+        moved_new = {new for _, new in self.moved}
+        self.removed = [record for record in self.removed if record not in moved_old]
+        self.added = [record for record in self.added if record not in moved_new]
+        # children of moved directories are implied by the move of the directory
+        self.moved = [
+            (old, new)
+            for old, new in self.moved
+            if old.parts[-1] != new.parts[-1]
+            or (old.parts[:-1], new.parts[:-1]) not in moved_pairs
+        ]
+
+
+@dataclass
+class TreeSnapshot(Generic[PathT]):
+    """
+    Metadata of all descendants of a root collected in a single scan.
+
+    Every column is stored in a compact array with one item per entry.
+    Entries refer to their parent by index instead of storing full paths.
+    :param follow_symlinks: entries are stat-ed through symlinks, also when the
+                            snapshot is compared with the current filesystem
+    """
+
+    root: PathT
+    parents: array[int] = field(default_factory=lambda: array("q"))
+    names: list[str] = field(default_factory=list)
+    sizes: array[int] = field(default_factory=lambda: array("q"))
+    mtimes: array[int] = field(default_factory=lambda: array("q"))
+    modes: array[int] = field(default_factory=lambda: array("I"))
+    inodes: array[int] = field(default_factory=lambda: array("Q"))
+    uids: array[int] = field(default_factory=lambda: array("I"))
+    gids: array[int] = field(default_factory=lambda: array("I"))
+    tags: list[str | None] | None = None
+    digests: list[bytes | None] | None = None
+    follow_symlinks: bool = False
+
+    @classmethod
+    def from_scan(
+        cls,
+        root: PathT,
+        *,
+        follow_symlinks: bool = False,
+        include_tags: bool = False,
+        include_digests: bool = False,
+    ) -> TreeSnapshot[PathT]:
+        snapshot = cls(
+            root,
+            tags=[] if include_tags else None,
+            digests=[] if include_digests else None,
+            follow_symlinks=follow_symlinks,
+        )
+        for parent, entry, stat_result in scan(
+            str(root),
+            follow_symlinks=follow_symlinks,
+        ):
+            snapshot.append(parent, entry.name, stat_result)
+            if snapshot.tags is not None:
+                from .tags import XDGTags
+
+                tags = XDGTags(entry.path).get()
+                snapshot.tags.append(tags[0] if tags else None)
+            if snapshot.digests is not None:
+                digest = (
+                    file_digest(entry.path)
+                    if stat.S_ISREG(stat_result.st_mode)
+                    else None
+                )
+                snapshot.digests.append(digest)
+        return snapshot
+
+    def append(self, parent: int, name: str, stat_result: os.stat_result) -> None:
+        self.parents.append(parent)
+        self.names.append(sys.intern(name))
+        self.sizes.append(stat_result.st_size)
+        self.mtimes.append(stat_result.st_mtime_ns)
+        self.modes.append(stat_result.st_mode)
+        self.inodes.append(stat_result.st_ino)
+        self.uids.append(stat_result.st_uid)
+        self.gids.append(stat_result.st_gid)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def records(self) -> Iterator[Record]:
+        digests = repeat(None) if self.digests is None else self.digests
+        values = zip(
+            self.parents,
+            self.names,
+            self.sizes,
+            self.mtimes,
+            self.modes,
+            self.inodes,
+            digests,
+            strict=False,
+        )
+        return create_records(values)
+
+    def diff(
+        self,
+        other: TreeSnapshot[PathT] | None = None,
+        *,
+        detect_moves: MoveDetection | None = "inode",
+    ) -> TreeDiff[PathT]:
+        """
+        Compare snapshot with a newer snapshot or with the current filesystem.
+
+        Both trees are compared with a single sorted merge so that memory usage
+        only grows with the number of changes.
+        :param detect_moves: match removed and added entries by inode or by content
+                             digest. Content detection requires a snapshot that
+                             includes digests.
+        """
+        if detect_moves == "content" and self.digests is None:
+            message = "Detecting moves by content requires snapshot with digests"
+            raise ValueError(message)
+        new_root = self.root if other is None else other.root
+        new_records = (
+            create_records(
+                (
+                    parent,
+                    entry.name,
+                    stat_result.st_size,
+                    stat_result.st_mtime_ns,
+                    stat_result.st_mode,
+                    stat_result.st_ino,
+                    None,
+                )
+                for parent, entry, stat_result in scan(
+                    str(self.root),
+                    follow_symlinks=self.follow_symlinks,
+                )
+            )
+            if other is None
+            else other.records()
+        )
+        diff = RecordDiff.from_merge(self.records(), new_records)
+        if detect_moves == "content":
+            diff.added = [
+                record._replace(digest=file_digest(new_root.joinpath(*record.parts)))
+                if record.digest is None and stat.S_ISREG(record.mode)
+                else record
+                for record in diff.added
+            ]
+        if detect_moves is not None:
+            diff.detect_moves(detect_moves)
+        return TreeDiff(
+            added=[new_root.joinpath(*record.parts) for record in diff.added],
+            removed=[self.root.joinpath(*record.parts) for record in diff.removed],
+            modified=[new_root.joinpath(*record.parts) for record in diff.modified],
+            moved=[
+                (self.root.joinpath(*old.parts), new_root.joinpath(*new.parts))
+                for old, new in diff.moved
+            ],
+        )
+
+    def relative_parts(self, index: int) -> tuple[str, ...]:
+        parts = []
+        while index != -1:
+            parts.append(self.names[index])
+            index = self.parents[index]
+        return tuple(reversed(parts))
+
+    def path(self, index: int) -> PathT:
+        return self.root.joinpath(*self.relative_parts(index))
+
+    def paths(self, indices: Iterable[int] | None = None) -> Iterator[PathT]:
+        if indices is None:
+            indices = range(len(self))
+        for index in indices:
+            yield self.path(index)
+
+    def columns(self) -> dict[str, NDArray[Any]]:
+        """
+        :return: NumPy views on the numeric columns without copying them.
+        """
+        import numpy as np
+
+        columns = {
+            "parents": self.parents,
+            "sizes": self.sizes,
+            "mtimes": self.mtimes,
+            "modes": self.modes,
+            "inodes": self.inodes,
+            "uids": self.uids,
+            "gids": self.gids,
+        }
+        return {
+            name: np.frombuffer(column, dtype=column.typecode)
+            for name, column in columns.items()
+        }
+
+    def select(  # noqa: PLR0913
+        self,
+        *,
+        file_type: FileType | None = None,
+        min_size: int | None = None,
+        max_size: int | None = None,
+        modified_after: float | None = None,
+        modified_before: float | None = None,
+        suffix: str | None = None,
+        owner: str | None = None,
+    ) -> list[int]:
+        """
+        :return: indices of entries that match all specified conditions.
+        """
+        conditions: list[Condition] = [
+            (name, compare, value)
+            for (name, compare), value in {
+                ("types", operator.eq): None
+                if file_type is None
+                else file_type_modes[file_type],
+                ("sizes", operator.ge): min_size,
+                ("sizes", operator.le): max_size,
+                ("mtimes", operator.ge): None
+                if modified_after is None
+                else int(modified_after * 1e9),
+                ("mtimes", operator.le): None
+                if modified_before is None
+                else int(modified_before * 1e9),
+                ("uids", operator.eq): None if owner is None else user_id(owner),
+            }.items()
+            if value is not None
+        ]
+        try:
+            indices = self.select_with_numpy(conditions)
+        except ModuleNotFoundError:
+            indices = self.select_without_numpy(conditions)
+        if suffix is not None:
+            indices = [index for index in indices if self.names[index].endswith(suffix)]
+        return indices
+
+    def select_with_numpy(self, conditions: list[Condition]) -> list[int]:
+        import numpy as np
+
+        columns = self.columns()
+        columns["types"] = columns["modes"] & file_type_mask
+        mask = np.ones(len(self), dtype=bool)
+        for name, compare, value in conditions:
+            mask &= compare(columns[name], value)
+        return np.flatnonzero(mask).tolist()
+
+    def select_without_numpy(self, conditions: list[Condition]) -> list[int]:
+        columns: dict[str, Any] = {
+            "sizes": self.sizes,
+            "mtimes": self.mtimes,
+            "uids": self.uids,
+            "types": [stat.S_IFMT(mode) for mode in self.modes],
+        }
+        return [
+            index
+            for index in range(len(self))
+            if all(
+                compare(columns[name][index], value)
+                for name, compare, value in conditions
+            )
+        ]
+
+    def owners(self, indices: Iterable[int] | None = None) -> list[str]:
+        """
+        :return: names of owners resolved once per distinct uid
+        """
+        from .ownership import user_name
+
+        uids = self.uids if indices is None else (self.uids[i] for i in indices)
+        return [user_name(uid) for uid in uids]
+
+    def groups(self, indices: Iterable[int] | None = None) -> list[str]:
+        from .ownership import group_name
+
+        gids = self.gids if indices is None else (self.gids[i] for i in indices)
+        return [group_name(gid) for gid in gids]
+
+    def sort(
+        self,
+        key: Literal["sizes", "mtimes", "inodes"] = "sizes",
+        indices: list[int] | None = None,
+        *,
+        reverse: bool = False,
+    ) -> list[int]:
+        """
+        :return: indices ordered by the values in the key column.
+        """
+        if indices is None:
+            indices = list(range(len(self)))
+        try:
+            import numpy as np
+        except ModuleNotFoundError:
+            column = getattr(self, key)
+            indices = sorted(indices, key=column.__getitem__, reverse=reverse)
+        else:
+            selected = np.asarray(indices, dtype=np.int64)
+            values = self.columns()[key][selected]
+            if reverse:
+                # reverse ordering that keeps equal values in original order
+                order = np.argsort(values[::-1], kind="stable")[::-1]
+                order = len(values) - 1 - order
+            else:
+                order = np.argsort(values, kind="stable")
+            indices = selected[order].tolist()
+        return indices
+
+    def total_size(self, indices: list[int] | None = None) -> int:
+        try:
+            import numpy as np
+        except ModuleNotFoundError:
+            sizes = self.sizes if indices is None else (self.sizes[i] for i in indices)
+            total = sum(sizes)
+        else:
+            sizes_column = self.columns()["sizes"]
+            if indices is not None:
+                sizes_column = sizes_column[np.asarray(indices, dtype=np.int64)]
+            total = int(sizes_column.sum())
+        return total
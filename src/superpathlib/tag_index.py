@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import typing
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+from .snapshot import scan
+from .tags import get_tags
+from .utils import map_concurrently
+
+if typing.TYPE_CHECKING:  # pragma: nocover
+    from collections.abc import Iterable
+
+PathT = TypeVar("PathT", bound=pathlib.Path)
+
+
+def get_existing_tags(path: str) -> list[str]:
+    try:
+        return get_tags(path)
+    except FileNotFoundError:
+        # broken symlink or removed during scan
+        return []
+
+
+@dataclass(eq=False)
+class TagIndex(Generic[PathT]):
+    """
+    In-memory index from tags to the paths of a tree.
+
+    The index is kept up to date when tags are set through Path.tags, Path.tag
+    or Path.set_tags_many. Tags changed by other programs are only picked up
+    after a rebuild.
+    """
+
+    root: PathT
+    paths: dict[str, set[str]] = field(default_factory=dict)
+    tags: dict[str, list[str]] = field(default_factory=dict)
+    root_path: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.root_path = os.path.abspath(self.root)  # noqa: PTH100
+        indices.add(self)
+
+    @classmethod
+    def build(cls, root: PathT, *, workers: int | None = None) -> TagIndex[PathT]:
+        index = cls(root)
+        index.rebuild(workers=workers)
+        return index
+
+    def rebuild(self, *, workers: int | None = None) -> None:
+        """
+        Read the tags of all subpaths with their attribute reads spread over threads.
+        """
+        paths = [self.root_path]
+        if os.path.isdir(self.root_path):  # noqa: PTH112
+            paths.extend(entry.path for _, entry, _ in scan(self.root_path))
+        all_tags = map_concurrently(get_existing_tags, paths, workers)
+        self.paths.clear()
+        self.tags.clear()
+        for path, tags in zip(paths, all_tags, strict=True):
+            self.update(path, tags)
+
+    def update(self, path: str, tags: Iterable[str]) -> None:
+        """
+        :param path: absolute path
+        """
+        for tag in self.tags.pop(path, ()):
+            tag_paths = self.paths[tag]
+            tag_paths.discard(path)
+            if not tag_paths:
+                del self.paths[tag]
+        tags = [tag for tag in tags if tag]
+        if tags:
+            self.tags[path] = tags
+            for tag in tags:
+                self.paths.setdefault(tag, set()).add(path)
+
+    def contains(self, path: str) -> bool:
+        return path == self.root_path or path.startswith(
+            os.path.join(self.root_path, ""),  # noqa: PTH118
+        )
+
+    def find(self, tag: str) -> list[PathT]:
+        """
+        :return: sorted paths that have the tag
+        """
+        paths = sorted(self.paths.get(tag, ()))
+        return [self.root.__class__(path) for path in paths]
+
+    @property
+    def all_tags(self) -> list[str]:
+        return sorted(self.paths)
+
+    def close(self) -> None:
+        """
+        Stop receiving updates.
+        """
+        indices.discard(self)
+
+
+indices: weakref.WeakSet[TagIndex[Any]] = weakref.WeakSet()
+
+
+def update_indices(path: str | os.PathLike[str], tags: Iterable[str]) -> None:
+    if indices:
+        absolute_path = os.path.abspath(path)  # noqa: PTH100
+        tags = list(tags)
+        for index in list(indices):
+            if index.contains(absolute_path):
+                index.update(absolute_path, tags)
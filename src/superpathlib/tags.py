@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import errno
+import os
+from contextlib import contextmanager
+
 try:
     import xattr
 
@@ -9,11 +13,36 @@ except ModuleNotFoundError:  # pragma: nocover
 
 from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:
-    from .metadata_properties import Path  # pragma: nocover
+if TYPE_CHECKING:  # pragma: nocover
+    from collections.abc import Iterable, Iterator, Mapping
+    from os import PathLike
+
+    Values = Iterable[str | int | None]
 
 delim = ","
 default_tag_name = "user.xdg.tags"
+# errors raised by operations on attributes that are not set
+missing_attribute_errors = {errno.ENODATA, getattr(errno, "ENOATTR", errno.ENODATA)}
+
+
+def read_attribute(attributes: xattr.xattr, name: str) -> bytes | None:
+    """
+    Read attribute with a single lookup instead of checking its existence first.
+    """
+    try:
+        return attributes.get(name)  # type: ignore[no-any-return]
+    except OSError as exception:
+        if exception.errno in missing_attribute_errors:
+            return None
+        raise
+
+
+def remove_attribute(attributes: xattr.xattr, name: str) -> None:
+    try:
+        attributes.remove(name)
+    except OSError as exception:
+        if exception.errno not in missing_attribute_errors:
+            raise
 
 
 class XDGTags:
@@ -25,29 +54,124 @@ class XDGTags:
         useful for filemanager that can order according to this tag
     """
 
-    def __init__(self, path: Path, name: str = default_tag_name) -> None:
+    def __init__(
+        self,
+        path: str | PathLike[str] | int,
+        name: str = default_tag_name,
+    ) -> None:
         self.tags = xattr.xattr(path) if xattr is not None else None
         self.name = name
 
+    def read(self) -> str | None:
+        if self.tags is None:  # pragma: nocover
+            return None
+        value = read_attribute(self.tags, self.name)
+        return None if value is None else value.decode().strip()
+
     def get(self) -> list[str]:
-        tags = []
-        if self.tags and self.tags.has_key(self.name):
-            tags = self.tags[self.name].decode().strip().split(delim)
-        return tags
+        value = self.read()
+        return [] if value is None else value.split(delim)
+
+    def first(self) -> str | None:
+        value = self.read()
+        return None if value is None else value.split(delim, 1)[0]
 
     def set(self, *values: str | int | None) -> None:
         """
         :param values: tag values to set
         """
         if self.tags is not None:
-            values_set = {
-                str(v).zfill(4) if isinstance(v, int) else str(v)
-                for v in values
-                if v is not None
-            }
-            values_str = delim.join(values_set).encode()
+            values_str = delim.join(format_tags(values)).encode()
             self.tags.set(self.name, values_str)
 
     def clear(self) -> None:
-        if self.tags is not None and self.tags.has_key(self.name):
-            self.tags.remove(self.name)
+        if self.tags is not None:
+            remove_attribute(self.tags, self.name)
+
+
+def format_tags(values: Values) -> list[str]:
+    """
+    :return: unique tags as they are stored
+    """
+    values_set = {
+        str(v).zfill(4) if isinstance(v, int) else str(v)
+        for v in values
+        if v is not None
+    }
+    return list(values_set)
+
+
+@contextmanager
+def open_descriptor(
+    path: str | PathLike[str],
+) -> Iterator[str | PathLike[str] | int]:
+    """
+    Open path once to reuse the file descriptor for multiple attribute operations.
+
+    The path itself is used when it cannot be opened for reading.
+    """
+    try:
+        descriptor = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+    except OSError:
+        yield path
+    else:
+        try:
+            yield descriptor
+        finally:
+            os.close(descriptor)
+
+
+def get_tags(path: str | PathLike[str]) -> list[str]:
+    with open_descriptor(path) as descriptor:
+        return XDGTags(descriptor).get()
+
+
+def set_tags(path: str | PathLike[str], values: Values) -> list[str]:
+    """
+    Replace tags of path and remove the attribute if no values are given.
+
+    :return: tags as they are stored
+    """
+    tags = format_tags(values)
+    with open_descriptor(path) as descriptor:
+        if tags:
+            XDGTags(descriptor).set(*tags)
+        else:
+            XDGTags(descriptor).clear()
+    return tags
+
+
+def get_attributes(path: str | PathLike[str], names: Iterable[str]) -> dict[str, bytes]:
+    """
+    Read several extended attributes of path with a single opened file descriptor.
+
+    :return: values of the attributes that are set
+    """
+    values = {}
+    if xattr is not None:
+        with open_descriptor(path) as descriptor:
+            attributes = xattr.xattr(descriptor)
+            for name in names:
+                value = read_attribute(attributes, name)
+                if value is not None:
+                    values[name] = value
+    return values
+
+
+def set_attributes(
+    path: str | PathLike[str],
+    values: Mapping[str, bytes | None],
+) -> None:
+    """
+    Write several extended attributes of path with a single opened file descriptor.
+
+    :param values: attribute values. Attributes with value None are removed.
+    """
+    if xattr is not None:
+        with open_descriptor(path) as descriptor:
+            attributes = xattr.xattr(descriptor)
+            for name, value in values.items():
+                if value is None:
+                    remove_attribute(attributes, name)
+                else:
+                    attributes.set(name, value)
@@ -0,0 +1,184 @@
+"""
+Read the end of files without reading the content that precedes it.
+"""
+
+from __future__ import annotations
+
+import collections
+import os
+import time
+import typing
+
+if typing.TYPE_CHECKING:  # pragma: nocover
+    from collections.abc import Iterator
+    from typing import IO
+
+    from .content_properties import Path
+
+default_block_size = 1 << 16
+
+
+def read_tail_bytes(path: Path, size: int) -> bytes:
+    if size < 0:
+        message = f"Size must not be negative, got {size}"
+        raise ValueError(message)
+    if path.is_compressed:
+        # compressed streams can not seek backwards efficiently
+        chunks: collections.deque[bytes] = collections.deque()
+        length = 0
+        with path.open_content("rb") as file:
+            while chunk := file.read(default_block_size):
+                chunks.append(chunk)
+                length += len(chunk)
+                while chunks and length - len(chunks[0]) >= size:
+                    length -= len(chunks.popleft())
+        content = b"".join(chunks)
+        return content[max(len(content) - size, 0) :]
+    with path.open("rb") as file:
+        end = file.seek(0, os.SEEK_END)
+        file.seek(max(end - size, 0))
+        return file.read(size)
+
+
+def read_tail_lines(
+    path: Path,
+    number: int,
+    block_size: int = default_block_size,
+) -> list[str]:
+    if path.is_compressed:
+        with path.open_content("rb") as file:
+            tail = collections.deque(file, maxlen=number)
+        return b"".join(tail).decode().splitlines()[-number:]
+    with path.open("rb") as file:
+        end = file.seek(0, os.SEEK_END)
+        return read_lines_before(file, end, number, block_size)
+
+
+def read_lines_before(
+    file: IO[bytes],
+    end: int,
+    number: int,
+    block_size: int,
+) -> list[str]:
+    """
+    Read the last number lines before end by reading blocks backwards.
+    """
+    if number <= 0:
+        return []
+    position = end
+    blocks = []
+    newlines = 0
+    # a trailing newline does not start a new line
+    while position > 0 and newlines <= number:
+        size = min(block_size, position)
+        position -= size
+        file.seek(position)
+        block = file.read(size)
+        blocks.append(block)
+        newlines += block.count(b"\n")
+    content = b"".join(reversed(blocks))
+    if position > 0:
+        # first line is incomplete
+        content = content[content.index(b"\n") + 1 :]
+    return content.decode().splitlines()[-number:]
+
+
+def follow(
+    path: Path,
+    number: int = 0,
+    interval: float = 0.1,
+    block_size: int = default_block_size,
+    *,
+    leading_separators: bool = False,
+) -> Iterator[str]:
+    """
+    Yield the last number lines and all complete lines that are appended later.
+
+    The file is reopened from the start when it is replaced or truncated, which
+    happens when logs are rotated. Truncation is only detected when the file is
+    smaller than the content that was read. Waits for the file to be created.
+    :param leading_separators: the file is written with a newline before each
+        line like append_lines does. The last line is yielded as soon as no
+        more content follows instead of waiting for the next newline.
+    """
+    file: IO[bytes]
+    try:
+        file = open(path, "rb")  # noqa: PTH123, SIM115
+        end = file.seek(0, os.SEEK_END)
+    except FileNotFoundError:
+        # all content of a file that is created later is new
+        file = wait_for_file(path, interval)
+        end = 0
+    pending = b""
+    # newline that separates a yielded line from the next line
+    separator_expected = False
+    try:
+        if leading_separators:
+            yield from read_lines_before(file, end, number, block_size)
+            separator_expected = ends_without_newline(file, end)
+        else:
+            # an incomplete last line is yielded once it is completed
+            end = find_line_start(file, end, block_size)
+            yield from read_lines_before(file, end, number, block_size)
+        file.seek(end)
+        while True:
+            if chunk := file.read(block_size):
+                if separator_expected and chunk.startswith(b"\n"):
+                    chunk = chunk[1:]
+                separator_expected = False
+                *lines, pending = (pending + chunk).split(b"\n")
+                for line in lines:
+                    yield line.rstrip(b"\r").decode()
+            elif is_rotated(path, file):
+                file.close()
+                file = wait_for_file(path, interval)
+                pending = b""
+                separator_expected = False
+            elif leading_separators and pending:
+                yield pending.rstrip(b"\r").decode()
+                pending = b""
+                separator_expected = True
+            else:
+                time.sleep(interval)
+    finally:
+        file.close()
+
+
+def ends_without_newline(file: IO[bytes], end: int) -> bool:
+    if end == 0:
+        return False
+    file.seek(end - 1)
+    return file.read(1) != b"\n"
+
+
+def find_line_start(file: IO[bytes], end: int, block_size: int) -> int:
+    """
+    Position after the last newline before end.
+    """
+    position = end
+    while position > 0:
+        size = min(block_size, position)
+        position -= size
+        file.seek(position)
+        index = file.read(size).rfind(b"\n")
+        if index != -1:
+            return position + index + 1
+    return 0
+
+
+def wait_for_file(path: Path, interval: float) -> IO[bytes]:
+    while True:
+        try:
+            return open(path, "rb")  # noqa: PTH123
+        except FileNotFoundError:  # noqa: PERF203
+            time.sleep(interval)
+
+
+def is_rotated(path: Path, file: IO[bytes]) -> bool:
+    try:
+        info = path.stat()
+    except FileNotFoundError:
+        return False
+    file_info = os.fstat(file.fileno())
+    replaced = (info.st_ino, info.st_dev) != (file_info.st_ino, file_info.st_dev)
+    return replaced or info.st_size < file.tell()
@@ -1,4 +1,8 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 def find_first_match(condition: Callable[..., bool]) -> int:
@@ -24,3 +28,21 @@ def find_first_match(condition: Callable[..., bool]) -> int:
             lower_bound = middle
 
     return upper_bound
+
+
+def map_concurrently(
+    function: Callable[[T], R],
+    items: Iterable[T],
+    workers: int | None = None,
+) -> list[R]:
+    """
+    Apply function to all items in a thread pool and keep the order of the items.
+
+    :param workers: number of threads. Items are processed sequentially for 1.
+    """
+    if workers == 1:
+        return [function(item) for item in items]
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(workers) as executor:
+        return list(executor.map(function, items))
@@ -0,0 +1,489 @@
+from __future__ import annotations
+
+import contextlib
+import ctypes
+import errno
+import logging
+import os
+import pathlib
+import select
+import stat
+import struct
+import sys
+import threading
+import time
+import typing
+from dataclasses import dataclass, field
+from typing import Any, Generic, Literal, TypeVar
+
+from .snapshot import TreeSnapshot, scan
+
+if typing.TYPE_CHECKING:  # pragma: nocover
+    from collections.abc import Callable, Iterator
+    from types import TracebackType
+
+PathT = TypeVar("PathT", bound=pathlib.Path)
+ChangeType = Literal["added", "modified", "removed"]
+
+# inotify constants from <sys/inotify.h>
+IN_MODIFY = 0x2
+IN_ATTRIB = 0x4
+IN_CLOSE_WRITE = 0x8
+IN_MOVED_FROM = 0x40
+IN_MOVED_TO = 0x80
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_DELETE_SELF = 0x400
+IN_MOVE_SELF = 0x800
+IN_Q_OVERFLOW = 0x4000
+IN_IGNORED = 0x8000
+IN_ISDIR = 0x40000000
+watch_mask = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+)
+event_header = struct.Struct("iIII")
+# errors of inotify_add_watch when the watch or memory limits are reached
+inotify_limit_errors = (errno.ENOSPC, errno.ENOMEM)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Change(Generic[PathT]):
+    path: PathT
+    type: ChangeType
+
+
+def coalesce(changes: list[Change[PathT]]) -> list[Change[PathT]]:
+    """
+    Merge consecutive changes of the same path into a single change.
+    """
+    merged: dict[PathT, ChangeType | None] = {}
+    for change in changes:
+        previous = merged.get(change.path)
+        if previous == "added":
+            merged[change.path] = None if change.type == "removed" else "added"
+        elif previous == "removed" and change.type == "added":
+            merged[change.path] = "modified"
+        else:
+            merged[change.path] = change.type
+    return [
+        Change(path, change_type)
+        for path, change_type in merged.items()
+        if change_type is not None
+    ]
+
+
+@dataclass
+class Watch(Generic[PathT]):
+    root: PathT
+    directory: str
+    recursive: bool
+    name: str | None = None
+
+    def create_change(self, name: str, change_type: ChangeType) -> Change[PathT]:
+        path = os.path.join(self.directory, name) if name else self.directory  # noqa: PTH118
+        return Change(self.root.__class__(path), change_type)
+
+
+class InotifyBackend(Generic[PathT]):
+    """
+    Receive change events from the Linux kernel without polling.
+    """
+
+    def __init__(self) -> None:
+        self.libc = ctypes.CDLL("libc.so.6", use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:  # pragma: nocover
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        # the kernel returns the same descriptor for a directory that is
+        # already watched so all watches of a directory share a descriptor
+        self.watches: dict[int, list[Watch[PathT]]] = {}
+        self.lock = threading.Lock()
+
+    def add(self, root: PathT, *, recursive: bool = True) -> None:
+        watch = (
+            Watch(root, str(root), recursive)
+            if root.is_dir()
+            else Watch(root, str(root.parent), recursive, root.name)
+        )
+        if not self.add_watch(watch):
+            message = f"Cannot watch {watch.directory}"
+            raise OSError(ctypes.get_errno(), message)
+        self.add_descendants(watch)
+
+    def add_watch(self, watch: Watch[PathT]) -> bool:
+        wd = self.libc.inotify_add_watch(
+            self.fd,
+            os.fsencode(watch.directory),
+            watch_mask,
+        )
+        if wd >= 0:
+            with self.lock:
+                watches = self.watches.setdefault(wd, [])
+                if watch not in watches:
+                    watches.append(watch)
+        return bool(wd >= 0)
+
+    def add_descendants(self, watch: Watch[PathT]) -> list[Change[PathT]]:
+        """
+        :return: descendants that existed before the directory was watched.
+        """
+        changes = []
+        if watch.recursive and watch.name is None:
+            with contextlib.suppress(OSError):
+                for _, entry, stat_result in scan(watch.directory):
+                    if stat.S_ISDIR(stat_result.st_mode):
+                        self.add_watch(Watch(watch.root, entry.path, recursive=True))
+                    changes.append(Change(watch.root.__class__(entry.path), "added"))
+        return changes
+
+    def remove(self, root: PathT) -> None:
+        self.remove_watches(lambda watch: watch.root == root)
+
+    def remove_directory(self, directory: str) -> None:
+        prefix = directory + os.sep
+        self.remove_watches(
+            lambda watch: (
+                watch.directory == directory or watch.directory.startswith(prefix)
+            ),
+        )
+
+    def remove_watches(self, condition: Callable[[Watch[PathT]], bool]) -> None:
+        """
+        Remove matching watches and stop watching directories without watches.
+        """
+        with self.lock:
+            for wd, watches in list(self.watches.items()):
+                watches[:] = [watch for watch in watches if not condition(watch)]
+                if not watches:
+                    self.libc.inotify_rm_watch(self.fd, wd)
+                    del self.watches[wd]
+
+    def read(self, timeout: float | None) -> list[Change[PathT]]:
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+        data = os.read(self.fd, 1 << 16)
+        changes = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, name_length = event_header.unpack_from(data, offset)
+            offset += event_header.size
+            name = os.fsdecode(data[offset : offset + name_length].rstrip(b"\0"))
+            offset += name_length
+            changes.extend(self.process_event(wd, mask, name))
+        return changes
+
+    def process_event(self, wd: int, mask: int, name: str) -> list[Change[PathT]]:
+        if mask & IN_Q_OVERFLOW:  # pragma: nocover
+            # events were dropped so any watched path can have changed
+            with self.lock:
+                roots = {
+                    watch.root for watches in self.watches.values() for watch in watches
+                }
+            return [Change(root, "modified") for root in roots]
+        with self.lock:
+            watches = (
+                self.watches.pop(wd, [])
+                if mask & IN_IGNORED
+                else list(self.watches.get(wd, []))
+            )
+        if mask & IN_IGNORED:
+            return []
+        changes = []
+        for watch in watches:
+            changes.extend(self.process_watch_event(watch, mask, name))
+        return changes
+
+    def process_watch_event(
+        self,
+        watch: Watch[PathT],
+        mask: int,
+        name: str,
+    ) -> list[Change[PathT]]:
+        if not name:
+            # events on watched subdirectories are reported by their parent
+            if watch.directory != str(watch.root):
+                return []
+            is_removed = mask & (IN_DELETE_SELF | IN_MOVE_SELF)
+            return [watch.create_change("", "removed" if is_removed else "modified")]
+        if watch.name is not None and name != watch.name:
+            return []
+
+        change_type: ChangeType = (
+            "added"
+            if mask & (IN_CREATE | IN_MOVED_TO)
+            else "removed"
+            if mask & (IN_DELETE | IN_MOVED_FROM)
+            else "modified"
+        )
+        changes = [watch.create_change(name, change_type)]
+        if mask & IN_ISDIR and watch.recursive:
+            path = os.path.join(watch.directory, name)  # noqa: PTH118
+            subdirectory = Watch(watch.root, path, recursive=True)
+            if change_type == "added" and self.add_watch(subdirectory):
+                changes.extend(self.add_descendants(subdirectory))
+            elif change_type == "removed":
+                self.remove_directory(path)
+        return changes
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingBackend(Generic[PathT]):
+    """
+    Detect changes by comparing snapshots on platforms without inotify.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.states: dict[
+            PathT,
+            tuple[bool, TreeSnapshot[PathT] | tuple[int, ...]],
+        ] = {}
+
+    def add(self, root: PathT, *, recursive: bool = True) -> None:
+        self.states[root] = recursive, self.capture(root)
+
+    def remove(self, root: PathT) -> None:
+        self.states.pop(root, None)
+
+    @classmethod
+    def capture(cls, root: PathT) -> TreeSnapshot[PathT] | tuple[int, ...]:
+        try:
+            stat_result = root.stat()
+        except FileNotFoundError:
+            return ()
+        if stat.S_ISDIR(stat_result.st_mode):
+            return TreeSnapshot.from_scan(root)
+        return stat_result.st_ino, stat_result.st_size, stat_result.st_mtime_ns
+
+    def read(self, timeout: float | None) -> list[Change[PathT]]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        changes = self.detect_changes()
+        while not changes and (deadline is None or time.monotonic() < deadline):
+            interval = (
+                self.interval
+                if deadline is None
+                else min(self.interval, max(deadline - time.monotonic(), 0))
+            )
+            time.sleep(interval)
+            changes = self.detect_changes()
+        return changes
+
+    def detect_changes(self) -> list[Change[PathT]]:
+        changes: list[Change[PathT]] = []
+        for root, (recursive, state) in list(self.states.items()):
+            new_state = self.capture(root)
+            self.states[root] = recursive, new_state
+            if isinstance(state, TreeSnapshot) and isinstance(new_state, TreeSnapshot):
+                changes.extend(self.compare_snapshots(state, new_state, recursive))
+            elif state != new_state:
+                change_type: ChangeType = (
+                    "added"
+                    if state == ()
+                    else "removed"
+                    if new_state == ()
+                    else "modified"
+                )
+                changes.append(Change(root, change_type))
+        return changes
+
+    @classmethod
+    def compare_snapshots(
+        cls,
+        snapshot: TreeSnapshot[PathT],
+        new_snapshot: TreeSnapshot[PathT],
+        recursive: bool,  # noqa: FBT001
+    ) -> Iterator[Change[PathT]]:
+        diff = snapshot.diff(new_snapshot, detect_moves=None)
+        changes = (
+            *(Change(path, "added") for path in diff.added),
+            *(Change(path, "removed") for path in diff.removed),
+            *(Change(path, "modified") for path in diff.modified),
+        )
+        for change in changes:
+            if recursive or change.path.parent == snapshot.root:
+                yield change
+
+
+@dataclass
+class Watcher(Generic[PathT]):
+    """
+    Batched and coalesced change events for files and directory trees.
+
+    Use inotify on Linux and fall back to polling on other platforms and when
+    inotify is unavailable or its limits are reached.
+    :param latency: time to wait for more events after the first event of a batch
+    """
+
+    latency: float = 0.05
+    polling: bool = not sys.platform.startswith("linux")
+    poll_interval: float = 1
+    backend: InotifyBackend[PathT] | PollingBackend[PathT] = field(init=False)
+    roots: dict[PathT, bool] = field(default_factory=dict, init=False)
+    retired_backend: InotifyBackend[PathT] | None = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        if not self.polling:
+            try:
+                self.backend = InotifyBackend()
+            except OSError:
+                self.polling = True
+        if self.polling:
+            self.backend = PollingBackend(self.poll_interval)
+
+    def add(self, path: PathT, *, recursive: bool = True) -> None:
+        try:
+            self.backend.add(path, recursive=recursive)
+        except OSError as exception:
+            if exception.errno not in inotify_limit_errors:
+                raise
+            self.switch_to_polling()
+            self.backend.add(path, recursive=recursive)
+        self.roots[path] = recursive
+
+    def switch_to_polling(self) -> None:
+        backend = typing.cast("InotifyBackend[PathT]", self.backend)
+        # removing the watches wakes up readers that wait for inotify events
+        # and the descriptor is only closed with the watcher
+        backend.remove_watches(lambda _: True)
+        self.retired_backend = backend
+        self.polling = True
+        self.backend = PollingBackend(self.poll_interval)
+        for root, recursive in self.roots.items():
+            self.backend.add(root, recursive=recursive)
+
+    def remove(self, path: PathT) -> None:
+        self.roots.pop(path, None)
+        self.backend.remove(path)
+
+    def read(self, timeout: float | None = None) -> list[Change[PathT]]:
+        """
+        :return: coalesced changes or empty list if no change before timeout.
+        """
+        changes = self.backend.read(timeout)
+        if changes and not self.polling:
+            deadline = time.monotonic() + self.latency
+            while (remaining := deadline - time.monotonic()) > 0:
+                changes.extend(self.backend.read(remaining))
+        return coalesce(changes)
+
+    def __iter__(self) -> Iterator[list[Change[PathT]]]:
+        while True:
+            if changes := self.read():
+                yield changes
+
+    def close(self) -> None:
+        for backend in (self.backend, self.retired_backend):
+            if isinstance(backend, InotifyBackend):
+                backend.close()
+
+    def __enter__(self) -> Watcher[PathT]:
+        return self
+
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+@dataclass
+class Subscription(Generic[PathT]):
+    """
+    :param failed: changes are not delivered anymore because the watcher failed
+    """
+
+    path: PathT
+    callback: Callable[[list[Change[PathT]]], Any]
+    recursive: bool = True
+    failed: bool = field(default=False, init=False)
+
+    def matches(self, path: PathT) -> bool:
+        return path == self.path or (self.recursive and self.path in path.parents)
+
+    def cancel(self) -> None:
+        dispatcher.unsubscribe(self)
+
+
+@dataclass
+class Dispatcher:
+    """
+    Share a single watcher and thread across all subscriptions.
+    """
+
+    subscriptions: list[Subscription[Any]] = field(default_factory=list)
+    watcher: Watcher[Any] | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def subscribe(self, subscription: Subscription[Any]) -> None:
+        with self.lock:
+            if self.watcher is None:
+                self.watcher = Watcher()
+                thread = threading.Thread(target=self.run, args=(self.watcher,))
+                thread.daemon = True
+                thread.start()
+            self.subscriptions.append(subscription)
+        self.watcher.add(subscription.path, recursive=subscription.recursive)
+
+    def unsubscribe(self, subscription: Subscription[Any]) -> None:
+        with self.lock:
+            if subscription not in self.subscriptions:
+                # subscriptions are removed when the watcher fails
+                return
+            self.subscriptions.remove(subscription)
+            is_watched = any(
+                other.path == subscription.path for other in self.subscriptions
+            )
+        if self.watcher is not None and not is_watched:
+            self.watcher.remove(subscription.path)
+
+    def run(self, watcher: Watcher[Any]) -> None:
+        try:
+            for changes in watcher:
+                self.dispatch(changes)
+        except Exception:
+            logger.exception("Watcher failed, subscriptions are not updated anymore")
+            self.fail(watcher)
+
+    def dispatch(self, changes: list[Change[Any]]) -> None:
+        with self.lock:
+            subscriptions = list(self.subscriptions)
+        for subscription in subscriptions:
+            matching_changes = [
+                change for change in changes if subscription.matches(change.path)
+            ]
+            if matching_changes:
+                try:
+                    subscription.callback(matching_changes)
+                except Exception:
+                    # keep delivering changes to other subscriptions
+                    logger.exception("Subscription callback failed")
+
+    def fail(self, watcher: Watcher[Any]) -> None:
+        """
+        Mark subscriptions as failed and start a new watcher for new ones.
+        """
+        with self.lock:
+            if self.watcher is watcher:
+                for subscription in self.subscriptions:
+                    subscription.failed = True
+                self.subscriptions.clear()
+                self.watcher = None
+        watcher.close()
+
+
+dispatcher = Dispatcher()
@@ -57,6 +57,15 @@ def in_memory_directory() -> Iterator[Path]:
     yield from provision_directory(in_memory=True)
 
 
+@pytest.fixture
+def tree(directory: Path) -> Path:
+    (directory / "empty.txt").touch()
+    (directory / "folder" / "small.txt").text = "content"
+    (directory / "folder" / "nested" / "large.bin").byte_content = b"0" * 100
+    (directory / "folder" / "nested" / "large.bin").mtime = 1
+    return directory
+
+
 @pytest.fixture
 def encryption_path(path: Path) -> Iterator[EncryptedPath]:
     with path.encrypted as encryption_path:
@@ -0,0 +1,155 @@
+import asyncio
+import threading
+import typing
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from superpathlib import Path, aio
+
+
+@pytest.fixture
+def executor() -> Iterator[None]:
+    with ThreadPoolExecutor(2) as executor:
+        aio.configure(batch_size=2, buffer_size=1, executor=executor)
+        yield
+    aio.configure()
+
+
+@pytest.mark.usefixtures("executor")
+def test_properties(path: Path) -> None:
+    async def run() -> None:
+        await path.aio.write_json({"key": "value"})
+        assert await path.aio.json == {"key": "value"}
+        assert await path.aio.exists()
+        await path.aio.write_text("content")
+        results = await asyncio.gather(*(path.aio.text for _ in range(5)))
+        assert results == ["content"] * 5
+        assert await path.aio.archive_format is None
+
+    asyncio.run(run())
+
+
+@pytest.mark.usefixtures("executor")
+def test_errors(directory: Path) -> None:
+    path = directory / "missing"
+
+    async def run() -> None:
+        with pytest.raises(FileNotFoundError):
+            await path.aio.stat()
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            path.aio.missing  # noqa: B018
+        with pytest.raises(AttributeError):
+            path.aio.write_missing  # noqa: B018
+
+    asyncio.run(run())
+
+
+@pytest.mark.usefixtures("executor")
+def test_find(directory: Path) -> None:
+    paths = [directory / name for name in ("first.txt", "second.txt", "third.bin")]
+    for path in paths:
+        path.touch()
+
+    async def collect(items: Any) -> list[Path]:
+        return sorted([item async for item in items])
+
+    async def run() -> None:
+        assert await collect(directory.aio.find(lambda path: path != directory)) == (
+            paths
+        )
+        assert await collect(directory.aio.iterdir()) == paths
+        assert await collect(directory.aio.glob("*.txt")) == paths[:2]
+        assert await collect(directory.aio.rglob("*.bin")) == paths[2:]
+        async for path in directory.aio.iterdir():
+            assert path in paths
+            break
+
+    asyncio.run(run())
+
+
+def test_find_error(path: Path) -> None:
+    async def run() -> None:
+        assert await path.aio.is_file()
+        with pytest.raises(NotADirectoryError):
+            async for _ in path.aio.iterdir():
+                pass  # pragma: nocover
+
+    path.touch()
+    asyncio.run(run())
+
+
+def test_read_after_write(path: Path) -> None:
+    path.text = "old"
+
+    async def run() -> list[Any]:
+        return list(
+            await asyncio.gather(
+                path.aio.text,
+                path.aio.write_text("new"),
+                path.aio.text,
+            ),
+        )
+
+    with ThreadPoolExecutor(1) as executor:
+        aio.configure(executor=executor)
+        assert asyncio.run(run()) == ["old", 3, "new"]
+    aio.configure()
+
+
+def test_stream_with_single_worker(directory: Path) -> None:
+    for index in range(5):
+        (directory / str(index)).touch()
+
+    async def run() -> list[bool]:
+        return [await path.aio.exists() async for path in directory.aio.iterdir()]
+
+    with ThreadPoolExecutor(1) as executor:
+        aio.configure(max_workers=1, buffer_size=2, executor=executor)
+        assert asyncio.run(asyncio.wait_for(run(), timeout=10)) == [True] * 5
+    aio.configure()
+
+
+def test_calls_are_spread_over_workers() -> None:
+    number_of_calls = 4
+    # all calls only return when they run concurrently
+    barrier = threading.Barrier(number_of_calls, timeout=10)
+
+    async def run() -> list[int]:
+        batcher = aio.get_batcher()
+        calls = (batcher.run(barrier.wait) for _ in range(number_of_calls))
+        return list(await asyncio.gather(*calls))
+
+    with ThreadPoolExecutor(number_of_calls) as executor:
+        aio.configure(max_workers=number_of_calls, executor=executor)
+        assert sorted(asyncio.run(run())) == list(range(number_of_calls))
+    aio.configure()
+
+
+def test_cancelled_reader_does_not_cancel_shared_read(path: Path) -> None:
+    path.text = "content"
+
+    async def run() -> str:
+        first_read = asyncio.ensure_future(path.aio.text)
+        second_read = asyncio.ensure_future(path.aio.text)
+        await asyncio.sleep(0)
+        first_read.cancel()
+        return typing.cast("str", await second_read)
+
+    assert asyncio.run(run()) == "content"
+
+
+def test_streams_run_on_executor() -> None:
+    async def run() -> list[str]:
+        names = aio.stream(lambda: iter([threading.current_thread().name]))
+        return [name async for name in names]
+
+    aio.configure(max_workers=1)
+    executor = aio.settings.get_executor()
+    (name,) = asyncio.run(run())
+    assert name.startswith("superpathlib")
+    aio.configure()
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
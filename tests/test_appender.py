@@ -0,0 +1,65 @@
+from superpathlib import Path
+
+
+def test_append_bytes(path: Path) -> None:
+    path.byte_content = b"first"
+    path.append_bytes(b" second")
+    assert path.byte_content == b"first second"
+
+
+def test_append_text_to_missing_file(directory: Path) -> None:
+    path = directory / "folder" / "file.txt"
+    path.append_text("first")
+    path.append_text(" second")
+    assert path.text == "first second"
+
+
+def test_append_lines(path: Path) -> None:
+    path.append_lines(["first"])
+    path.append_lines(["second", "third"])
+    assert path.lines == ["first", "second", "third"]
+
+
+def test_append_lines_after_newline(path: Path) -> None:
+    path.text = "first\n"
+    path.append_lines(["second"])
+    assert path.text == "first\nsecond"
+
+
+def test_append_compressed(directory: Path) -> None:
+    path = directory / "log.gz"
+    path.append_lines(["first"])
+    path.append_lines(["second"])
+    assert path.lines == ["first", "second"]
+
+
+def test_buffer(path: Path) -> None:
+    with path.appender(buffer_size=10) as appender:
+        appender.write_text("12345")
+        assert path.text == ""
+        appender.write_line("67890")
+        assert path.text == "12345\n67890"
+        appender.write_bytes(b"")
+        appender.write_line("next")
+        appender.flush()
+        assert path.lines == ["12345", "67890", "next"]
+        appender.flush()
+
+
+def test_roll_over(directory: Path) -> None:
+    path = directory / "audit.log"
+    with path.appender(max_size=10, backups=2, buffer_size=1) as appender:
+        for index in range(4):
+            appender.write_line(f"line {index}")
+    assert path.lines == ["line 3"]
+    assert (directory / "audit.1.log").lines == ["line 2"]
+    assert (directory / "audit.2.log").lines == ["line 1"]
+    assert not (directory / "audit.3.log").exists()
+
+
+def test_roll_over_without_backups(directory: Path) -> None:
+    path = directory / "audit.log"
+    path.text = "existing content"
+    path.append_text("new", max_size=10, backups=0)
+    assert path.text == "new"
+    assert list(directory.iterdir()) == [path]
@@ -0,0 +1,47 @@
+from dataclasses import replace
+
+import pytest
+
+from benchmarks.cases import Case, Operation, scales
+from benchmarks.suite import compare, main, run_suite
+from superpathlib import Path
+
+
+def test_suite() -> None:
+    results = list(run_suite(scales["tiny"], runs=1))
+    assert len(results) == len({result.name for result in results})
+    for result in results:
+        assert result.median_ms > 0
+        assert result.throughput > 0
+        assert result.peak_memory > 0
+        assert result.format().startswith(result.name)
+
+
+def test_selection() -> None:
+    results = list(run_suite(scales["tiny"], runs=2, selection="read text"))
+    assert [result.name for result in results] == ["read text"]
+
+
+def test_unavailable_case() -> None:
+    case = Case("missing", lambda *_: Operation(int), requires=("missing_module",))
+    assert not case.is_available
+
+
+def test_compare() -> None:
+    (result,) = run_suite(scales["tiny"], runs=1, selection="write text")
+    faster_result = replace(result, median_ms=result.median_ms / 2)
+    baselines = {result.key: faster_result}
+    (regression,) = compare([result], baselines)
+    assert regression.metric == "median_ms"
+    assert regression.format().startswith("Regression in tiny/write text")
+    assert not list(compare([faster_result], {result.key: result}))
+    assert not list(compare([result], {}))
+
+
+def test_main(path: Path) -> None:
+    arguments = ["--scale", "tiny", "--runs", "1", "--filter", "read byte_content"]
+    main([*arguments, "--save", str(path)])
+    assert list(path.json) == ["tiny/read byte_content"]
+    main([*arguments, "--compare", str(path), "--tolerance", "100"])
+    with pytest.raises(SystemExit):
+        main([*arguments, "--compare", str(path), "--tolerance", "-1"])
@@ -0,0 +1,116 @@
+import json
+
+import pytest
+
+from superpathlib import Path
+
+
+@pytest.fixture
+def json_paths(directory: Path) -> list[Path]:
+    paths = [directory / f"{index}.json" for index in range(20)]
+    for index, path in enumerate(paths):
+        path.json = {"index": index}
+    return paths
+
+
+@pytest.mark.parametrize("workers", [1, None])
+def test_read_many(json_paths: list[Path], workers: int | None) -> None:
+    results = list(Path.read_many(json_paths, "json", workers=workers))
+    assert [result.path for result in results] == json_paths
+    assert [result.content for result in results] == [path.json for path in json_paths]
+    assert all(result.is_success for result in results)
+    assert all(isinstance(result.path, Path) for result in results)
+
+
+def test_read_many_in_processes(json_paths: list[Path]) -> None:
+    results = Path.read_many(json_paths, "json", workers=2, processes=True)
+    contents = [result.content for result in results]
+    assert contents == [path.json for path in json_paths]
+
+
+def test_read_many_unordered(json_paths: list[Path]) -> None:
+    results = Path.read_many(json_paths, "json", ordered=False)
+    contents = {result.path: result.content for result in results}
+    assert contents == {path: path.json for path in json_paths}
+
+
+def test_errors_are_reported_per_path(json_paths: list[Path], directory: Path) -> None:
+    invalid_path = directory / "invalid.json"
+    invalid_path.text = "{"
+    paths = [json_paths[0], invalid_path, json_paths[1]]
+
+    results = list(Path.read_many(paths, "json"))
+
+    assert [result.is_success for result in results] == [True, False, True]
+    assert results[1].content is None
+    assert isinstance(results[1].error, json.JSONDecodeError)
+
+
+def test_stop_reading(json_paths: list[Path]) -> None:
+    results = Path.read_many(json_paths)
+    first_result = next(results)
+    results.close()  # type: ignore[attr-defined]
+    assert first_result.content == json_paths[0].text
+
+
+def test_unsupported_format(path: Path) -> None:
+    with pytest.raises(ValueError, match="Unsupported format"):
+        list(Path.read_many([path], "exists"))
+
+
+@pytest.mark.parametrize("workers", [1, None])
+def test_write_many(directory: Path, workers: int | None) -> None:
+    contents: dict[Path, dict[str, int] | list[int]] = {
+        directory / "first" / "nested" / f"{index}.json": {"index": index}
+        for index in range(10)
+    }
+    contents[directory / "second" / "file.json"] = []
+    Path.write_many(contents, "json", workers=workers)
+    assert {path: path.json for path in contents} == contents
+
+
+def test_write_many_with_metadata(directory: Path) -> None:
+    paths = [directory / "folder" / f"{index}.txt" for index in range(3)]
+    Path.write_many(
+        {str(path): f"content {index}" for index, path in enumerate(paths)},
+        "text",
+        mtimes={str(paths[0]): 1000},
+        tags={str(paths[1]): ["tag", "other"]},
+    )
+    assert [path.text for path in paths] == [f"content {index}" for index in range(3)]
+    assert paths[0].mtime == 1000  # noqa: PLR2004
+    assert sorted(paths[1].tags) == ["other", "tag"]
+    assert paths[2].tags == []
+
+
+def test_write_many_atomic(directory: Path) -> None:
+    path = directory / "content.gz"
+    path.text = "old content"
+    index = directory.tag_index()
+    Path.write_many(
+        {path: "new content"},
+        "text",
+        atomic=True,
+        mtimes={path: 1000},
+        tags={path: ["tag"]},
+    )
+    assert index.find("tag") == [path]
+    index.close()
+    assert path.text == "new content"
+    assert path.mtime == 1000  # noqa: PLR2004
+    assert path.tags == ["tag"]
+    assert list(directory.iterdir()) == [path]
+
+
+def test_failed_atomic_write_keeps_content(directory: Path) -> None:
+    path = directory / "content.json"
+    path.json = {"key": "value"}
+    with pytest.raises(TypeError):
+        Path.write_many({path: {"key": object()}}, "json", atomic=True)
+    assert path.json == {"key": "value"}
+    assert list(directory.iterdir()) == [path]
+
+
+def test_write_unsupported_format(path: Path) -> None:
+    with pytest.raises(ValueError, match="Unsupported format"):
+        Path.write_many({path: 0}, "mtime")
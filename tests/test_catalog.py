@@ -0,0 +1,77 @@
+import pytest
+
+from superpathlib import Path
+
+
+@pytest.fixture
+def database(path: Path) -> Path:
+    return path
+
+
+def test_catalog_find(tree: Path, database: Path) -> None:
+    with tree.catalog(database) as catalog:
+        paths = tree.find(lambda path: path != tree, recurse_on_match=True)
+        assert sorted(catalog.find()) == sorted(paths)
+        assert list(catalog.find(suffix=".txt", min_size=1)) == [
+            tree / "folder" / "small.txt",
+        ]
+        assert list(catalog.find(max_size=10, modified_before=2)) == []
+        assert list(catalog.find(modified_after=2, file_type="directory")) == [
+            tree / "folder",
+            tree / "folder" / "nested",
+        ]
+
+
+def test_catalog_tags(tree: Path, database: Path) -> None:
+    (tree / "empty.txt").tag = "tag"
+    with tree.catalog(database, include_tags=True) as catalog:
+        assert list(catalog.find(tag="tag")) == [tree / "empty.txt"]
+
+
+def test_catalog_tags_not_indexed(tree: Path, database: Path) -> None:
+    with (
+        tree.catalog(database) as catalog,
+        pytest.raises(ValueError, match="does not index tags"),
+    ):
+        list(catalog.find(tag="tag"))
+
+
+def test_catalog_refresh(tree: Path, database: Path) -> None:
+    tree.catalog(database).close()
+    added_path = tree / "folder" / "added.txt"
+    added_path.touch()
+    (tree / "folder" / "nested").rmtree()
+    with tree.catalog(database) as catalog:
+        assert list(catalog.find(suffix=".txt", file_type="file")) == [
+            tree / "empty.txt",
+            added_path,
+            tree / "folder" / "small.txt",
+        ]
+        assert list(catalog.find(suffix=".bin")) == []
+
+
+def test_catalog_refresh_skips_unchanged_directories(
+    tree: Path,
+    database: Path,
+) -> None:
+    tree.catalog(database).close()
+    changed_path = tree / "folder" / "small.txt"
+    changed_path.text = "changed content"
+    with tree.catalog(database) as catalog:
+        assert list(catalog.find(min_size=10, suffix=".txt")) == []
+        catalog.refresh(full=True)
+        assert list(catalog.find(min_size=10, suffix=".txt")) == [changed_path]
+
+
+def test_catalog_other_root(tree: Path, database: Path) -> None:
+    tree.catalog(database).close()
+    with pytest.raises(ValueError, match="created for"):
+        (tree / "folder").catalog(database)
+
+
+def test_catalog_removed_root(tree: Path, database: Path) -> None:
+    catalog = tree.catalog(database)
+    tree.rmtree()
+    catalog.refresh()
+    assert list(catalog.find()) == []
+    catalog.close()
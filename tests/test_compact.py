@@ -0,0 +1,61 @@
+import sys
+
+import pytest
+
+from benchmarks.compact_path import main
+from superpathlib import Path
+from superpathlib.compact import CompactPath
+
+
+@pytest.fixture
+def compact_path(path: Path) -> CompactPath:
+    return CompactPath(path)
+
+
+def test_slots(compact_path: CompactPath) -> None:
+    assert not hasattr(compact_path, "__dict__")
+    assert sys.getsizeof(compact_path) < sys.getsizeof(Path(compact_path))
+    assert CompactPath.__mro__[1:] == Path.__mro__[-4:]
+
+
+def test_derived_paths(compact_path: CompactPath) -> None:
+    assert isinstance(compact_path / "child", CompactPath)
+    assert isinstance(compact_path.parent, CompactPath)
+    assert isinstance(CompactPath.HOME, CompactPath)
+    assert compact_path == Path(compact_path)
+
+
+def test_content(compact_path: CompactPath) -> None:
+    compact_path.text = "content"
+    assert compact_path.text == "content"
+    assert compact_path.size == len("content")
+    assert Path(compact_path).text == "content"
+
+
+def test_overridden_methods(compact_path: CompactPath) -> None:
+    compact_path.unlink()
+    compact_path.touch()
+    assert compact_path.exists()
+    assert compact_path in compact_path.parent.iterdir()
+    moved_path = compact_path.rename(compact_path.with_suffix(".moved"))
+    assert isinstance(moved_path, CompactPath)
+    assert moved_path.exists()
+    moved_path.rename(compact_path)
+
+
+def test_cached_properties(compact_path: CompactPath) -> None:
+    compact_path.text = "content"
+    assert compact_path.archive_format is None
+    assert compact_path.cached_text is compact_path.cached_text
+
+    class Storage:
+        content = compact_path.cached_text
+
+    assert Storage.content == "content"
+
+
+def test_benchmark(capsys: pytest.CaptureFixture[str]) -> None:
+    main(["--number", "10", "--repeat", "1"])
+    output = capsys.readouterr().out
+    assert "CompactPath" in output
+    assert "memory" in output
@@ -0,0 +1,117 @@
+import gzip
+from collections.abc import Iterator
+
+import pytest
+
+from superpathlib import Path, compression
+
+content = {"key": ["value"] * 100, "nested": {"number": 1}}
+
+
+@pytest.fixture(params=list(compression.openers))
+def compressed_path(request: pytest.FixtureRequest, directory: Path) -> Path:
+    return directory / f"content.json{request.param}"
+
+
+@pytest.fixture
+def settings() -> Iterator[None]:
+    original_settings = compression.settings
+    yield
+    compression.settings = original_settings
+
+
+def test_is_compressed(compressed_path: Path) -> None:
+    assert compressed_path.is_compressed
+    assert not compressed_path.with_suffix("").is_compressed
+
+
+def test_bytes(compressed_path: Path) -> None:
+    byte_content = b"content" * 100
+    compressed_path.byte_content = byte_content
+    assert compressed_path.byte_content == byte_content
+    assert len(compressed_path.read_bytes()) < len(byte_content)
+
+
+def test_text(compressed_path: Path) -> None:
+    compressed_path.text = "content"
+    assert compressed_path.text == "content"
+    assert compressed_path.read_bytes() != b"content"
+
+
+def test_lines(compressed_path: Path) -> None:
+    lines = ["first", "", "third"]
+    compressed_path.lines = lines
+    assert compressed_path.lines == lines
+    compressed_path.lines = []
+    assert compressed_path.lines == []
+
+
+def test_json(compressed_path: Path) -> None:
+    compressed_path.json = content
+    assert compressed_path.json == content
+
+
+def test_yaml(compressed_path: Path) -> None:
+    compressed_path.yaml = content
+    assert compressed_path.yaml == content
+
+
+def test_copy_is_identical(compressed_path: Path) -> None:
+    compressed_path.json = content
+    copied_path = compressed_path.with_name("copy.bin")
+    compressed_path.copy_to(copied_path)
+    assert copied_path.read_bytes() == compressed_path.read_bytes()
+
+
+def test_missing_file(compressed_path: Path) -> None:
+    assert compressed_path.text == ""
+    assert compressed_path.byte_content == b""
+    assert compressed_path.json == {}
+
+
+def test_stream(compressed_path: Path) -> None:
+    with compressed_path.open_content("w") as file:
+        for index in range(3):
+            file.write(f"{index}\n")
+    with compressed_path.open_content("a") as file:
+        file.write("3\n")
+    assert compressed_path.lines == ["0", "1", "2", "3"]
+
+
+def test_uncompressed_stream(path: Path) -> None:
+    with path.open_content("w") as file:
+        file.write("content")
+    assert path.read_text() == "content"
+
+
+def test_gzip_format(directory: Path) -> None:
+    path = directory / "content.gz"
+    path.text = "content"
+    assert gzip.decompress(path.read_bytes()) == b"content"
+
+
+@pytest.mark.usefixtures("settings")
+def test_configure(directory: Path) -> None:
+    path = directory / "content.gz"
+    byte_content = bytes(range(256)) * 100
+    compression.configure(levels={".gz": 0})
+    path.byte_content = byte_content
+    uncompressed_size = path.size
+    compression.configure(levels={".gz": 9}, threads=0)
+    path.byte_content = byte_content
+    assert path.size < uncompressed_size
+    assert compression.settings.levels[".xz"] == compression.default_levels[".xz"]
+    zstd_path = directory / "content.zst"
+    zstd_path.byte_content = byte_content
+    assert zstd_path.byte_content == byte_content
+
+
+@pytest.mark.usefixtures("settings")
+def test_configure_keeps_unspecified_settings() -> None:
+    levels = {".gz": 9, ".xz": 1}
+    threads = 2
+    compression.configure(levels={".gz": levels[".gz"]})
+    compression.configure(threads=threads)
+    compression.configure(levels={".xz": levels[".xz"]})
+    assert compression.settings.levels == {**compression.default_levels, **levels}
+    assert compression.settings.threads == threads
@@ -0,0 +1,135 @@
+import os
+import pathlib
+import shutil
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from superpathlib import Path, directory_cache
+from superpathlib.directory_cache import DirectoryCache
+
+
+@pytest.fixture
+def cache() -> Iterator[DirectoryCache]:
+    with directory_cache.caching() as cache:
+        yield cache
+
+
+@pytest.fixture
+def mkdir() -> Iterator[MagicMock]:
+    with patch.object(
+        pathlib.Path,
+        "mkdir",
+        autospec=True,
+        side_effect=pathlib.Path.mkdir,
+    ) as mkdir:
+        yield mkdir
+
+
+def test_disabled(directory: Path, mkdir: MagicMock) -> None:
+    path = directory / "folder" / "file.txt"
+    for _ in range(2):
+        path.create_parent()
+    assert mkdir.call_count == 2  # noqa: PLR2004
+    assert directory_cache.cache is None
+
+
+@pytest.mark.usefixtures("cache")
+def test_known_directory_is_not_created(directory: Path, mkdir: MagicMock) -> None:
+    for index in range(3):
+        path = directory / "folder" / f"{index}.txt"
+        path.touch()
+        path.rename(directory / "target" / path.name)
+    assert mkdir.call_count == 2  # noqa: PLR2004
+
+
+def test_removed_directories_are_forgotten(
+    directory: Path,
+    cache: DirectoryCache,
+) -> None:
+    folder = directory / "folder"
+    (folder / "nested" / "file.txt").text = "content"
+    (directory / "folder_sibling" / "file.txt").text = "content"
+    (directory / "other" / "file.txt").text = "content"
+    assert str(folder / "nested") in cache
+
+    folder.rmtree()
+
+    assert str(folder / "nested") not in cache
+    assert str(directory / "folder_sibling") in cache
+    (folder / "nested" / "file.txt").text = "content"
+    assert str(folder / "nested") in cache
+
+    directory.rmtree(remove_root=False)
+    assert not cache
+
+
+def test_renamed_and_removed_directories_are_forgotten(
+    directory: Path,
+    cache: DirectoryCache,
+) -> None:
+    folder = directory / "folder"
+    (folder / "file.txt").touch()
+    folder.rename(directory / "renamed")
+    assert str(folder) not in cache
+    assert str(directory / "renamed" / "file.txt") not in cache
+
+    (folder / "file.txt").touch()
+    (folder / "file.txt").unlink()
+    folder.rmdir()
+    assert str(folder) not in cache
+
+
+@pytest.mark.usefixtures("cache")
+def test_directories_removed_elsewhere(directory: Path) -> None:
+    folder = directory / "folder"
+    (folder / "file.txt").text = "content"
+    for write in (
+        lambda: setattr(folder / "file.txt", "text", "content"),
+        (folder / "touched.txt").touch,
+        lambda: (directory / "source.txt").rename(folder / "renamed.txt"),
+    ):
+        (directory / "source.txt").touch()
+        shutil.rmtree(folder)
+        write()
+        assert folder.exists()
+
+
+def test_only_missing_parent_is_forgotten(directory: Path) -> None:
+    with directory_cache.caching() as cache:
+        (directory / "other" / "file.txt").touch()
+        folder = directory / "folder"
+        (folder / "file.txt").touch()
+        shutil.rmtree(folder)
+        (folder / "file.txt").touch()
+        assert str(folder) in cache
+        assert str(directory / "other") in cache
+
+
+def test_bounded_size(directory: Path) -> None:
+    with directory_cache.caching(max_size=2) as cache:
+        for name in ("first", "second", "first", "third"):
+            (directory / name / "file.txt").create_parent()
+        assert len(cache) == 2  # noqa: PLR2004
+        assert str(directory / "second") not in cache
+        assert str(directory / "first") in cache
+    assert directory_cache.cache is None
+
+
+def test_enable() -> None:
+    cache = directory_cache.enable()
+    try:
+        cache.add(os.sep)
+        cache.add(os.sep)
+        directory_cache.forget(os.sep)
+        assert not cache
+        cache.add(os.sep)
+        directory_cache.forget_all()
+        assert not cache
+        with pytest.raises(ValueError, match="at least 1"):
+            directory_cache.enable(max_size=0)
+    finally:
+        directory_cache.disable()
+    directory_cache.forget_all()
+    assert directory_cache.cache is None
@@ -0,0 +1,166 @@
+import errno
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from superpathlib import Path
+from superpathlib.duplicates import find_duplicates
+from superpathlib.hashing import file_digest, partial_block_size, partial_digest
+
+linux_only = pytest.mark.skipif(
+    sys.platform != "linux",
+    reason="reflinks use a Linux ioctl",
+)
+
+large_size = 4 * partial_block_size
+
+
+def large_content(marker: bytes = b"x") -> bytes:
+    content = bytearray(large_size)
+    # differs from other large contents in the middle only
+    content[large_size // 2] = ord(marker)
+    return bytes(content)
+
+
+def test_partial_digest_of_small_file(path: Path) -> None:
+    path.byte_content = b"content" * (partial_block_size // 4)
+    size = path.size
+    assert size <= 2 * partial_block_size
+    assert partial_digest(path, size) == file_digest(path)
+
+
+def test_find_duplicates(directory: Path) -> None:
+    (directory / "a").text = "content"
+    (directory / "folder" / "b").text = "content"
+    (directory / "c").text = "other content"
+    (directory / "d").text = "differs"
+    (directory / "large1").byte_content = large_content()
+    (directory / "large2").byte_content = large_content()
+    (directory / "large3").byte_content = large_content(b"y")
+
+    groups = directory.find_duplicates()
+
+    assert [group.paths for group in groups] == [
+        [directory / "large1", directory / "large2"],
+        [directory / "a", directory / "folder" / "b"],
+    ]
+    assert groups[0].wasted_size == large_size
+    assert groups[0].digest == file_digest(directory / "large1")
+    assert isinstance(groups[0].paths[0], Path)
+
+
+def test_min_size(directory: Path) -> None:
+    (directory / "a").text = "content"
+    (directory / "b").text = "content"
+    (directory / "empty1").touch()
+    (directory / "empty2").touch()
+    assert not directory.find_duplicates(min_size=len("content") + 1)
+
+
+def test_hardlinks_are_hashed_once(directory: Path) -> None:
+    path = directory / "a"
+    path.text = "content"
+    (directory / "b").hardlink_to(path)
+    assert not directory.find_duplicates()
+    (directory / "c").text = "content"
+
+    (group,) = directory.find_duplicates()
+
+    assert group.paths == [path, directory / "b", directory / "c"]
+    assert group.wasted_size == len("content")
+
+
+def test_missing_files_are_skipped(directory: Path) -> None:
+    paths = [directory / name for name in ("a", "b", "c")]
+    for path in paths:
+        path.byte_content = large_content()
+    entries = [(path, path.stat()) for path in paths]
+    paths[0].unlink()
+    (group,) = find_duplicates(entries)
+    assert group.paths == paths[1:]
+
+    paths[1].unlink()
+    assert not find_duplicates(entries)
+
+
+def test_files_removed_before_full_digest(directory: Path) -> None:
+    paths = [directory / name for name in ("a", "b")]
+    for path in paths:
+        path.byte_content = large_content()
+    entries = [(path, path.stat()) for path in paths]
+    error = FileNotFoundError(paths[0])
+    with patch("superpathlib.duplicates.file_digest", side_effect=error):
+        assert not find_duplicates(entries)
+
+
+def test_deduplicate(directory: Path) -> None:
+    paths = [directory / name for name in ("a", "b", "c")]
+    for path in paths:
+        path.text = "content"
+
+    assert directory.deduplicate() == 2 * len("content")
+
+    inodes = {path.stat().st_ino for path in paths}
+    assert len(inodes) == 1
+    assert all(path.text == "content" for path in paths)
+    assert sorted(directory.iterdir()) == paths
+    assert not directory.deduplicate()
+
+
+def test_freed_size_counts_inodes_once(directory: Path) -> None:
+    (directory / "a").text = "content"
+    (directory / "b").text = "content"
+    (directory / "b2").hardlink_to(directory / "b")
+    (group,) = directory.find_duplicates()
+    assert group.wasted_size == len("content")
+    assert group.link() == group.wasted_size
+
+
+def test_changed_files_are_not_linked(directory: Path) -> None:
+    paths = [directory / name for name in ("a", "b", "c", "d")]
+    for path in paths:
+        path.text = "content"
+    (group,) = directory.find_duplicates()
+    paths[1].text = "changed"
+    os.utime(paths[1], ns=(0, 0))
+    paths[2].unlink()
+
+    assert group.link() == len("content")
+
+    assert paths[1].text == "changed"
+    assert paths[3].stat().st_ino == paths[0].stat().st_ino
+
+
+@linux_only
+def test_reflink(directory: Path) -> None:
+    paths = [directory / name for name in ("a", "b")]
+    for path in paths:
+        path.text = "content"
+    (group,) = directory.find_duplicates()
+
+    def clone(destination: int, _: int, source: int) -> None:
+        os.sendfile(destination, source, 0, len("content"))
+
+    with patch("fcntl.ioctl", side_effect=clone) as ioctl:
+        assert group.link("reflink") == len("content")
+    ioctl.assert_called_once()
+    assert sorted(directory.iterdir()) == paths
+    assert paths[1].text == "content"
+
+
+@linux_only
+def test_failed_link_keeps_file(directory: Path) -> None:
+    paths = [directory / name for name in ("a", "b")]
+    for path in paths:
+        path.text = "content"
+    (group,) = directory.find_duplicates()
+    error = OSError(errno.EOPNOTSUPP, "Operation not supported")
+    with (
+        patch("fcntl.ioctl", side_effect=error),
+        pytest.raises(OSError, match="not supported"),
+    ):
+        group.link("reflink")
+    assert sorted(directory.iterdir()) == paths
+    assert all(path.text == "content" for path in paths)
@@ -0,0 +1,97 @@
+import os
+import sys
+from collections.abc import Callable
+from unittest.mock import patch
+
+import pytest
+
+from superpathlib import Path
+from superpathlib.hashing import (
+    choose_fast_algorithm,
+    file_digest,
+    number_of_samples,
+    partial_block_size,
+)
+
+algorithms = ("xxh3", "blake3", "blake2b", "sha256")
+
+
+@pytest.mark.parametrize("algorithm", algorithms)
+def test_file_fingerprint(path: Path, algorithm: str) -> None:
+    path.text = "content"
+    fingerprint = path.calculate_fingerprint(algorithm)
+    assert fingerprint == f"{algorithm}:{file_digest(path, algorithm).hex()}"
+    path.text = "changed"
+    assert path.calculate_fingerprint(algorithm) != fingerprint
+
+
+def test_missing_path(directory: Path) -> None:
+    path = directory / "missing"
+    assert path.fingerprint is None
+    assert Path.fingerprints_many([path, directory]) == [None, directory.fingerprint]
+
+
+def test_fast_algorithm_is_preferred(path: Path) -> None:
+    fingerprint = path.fingerprint
+    assert fingerprint is not None
+    assert fingerprint.startswith(f"{choose_fast_algorithm()}:")
+
+
+def test_fallback_algorithm() -> None:
+    choose_fast_algorithm.cache_clear()
+    try:
+        with patch.dict(sys.modules, {"xxhash": None, "blake3": None}):
+            assert choose_fast_algorithm() == "blake2b"
+    finally:
+        choose_fast_algorithm.cache_clear()
+
+
+def test_sampled_fingerprint(path: Path) -> None:
+    size = 2 * number_of_samples * partial_block_size
+    content = bytearray(size)
+    path.byte_content = bytes(content)
+    fingerprint = path.calculate_fingerprint(sampled=True)
+
+    # change between the sampled blocks
+    content[partial_block_size + 1] = 1
+    path.byte_content = bytes(content)
+    assert path.calculate_fingerprint(sampled=True) == fingerprint
+    assert path.calculate_fingerprint() != fingerprint
+
+    content[-1] = 1
+    path.byte_content = bytes(content)
+    assert path.calculate_fingerprint(sampled=True) != fingerprint
+
+
+def test_sampled_fingerprint_of_small_file(path: Path) -> None:
+    path.text = "content"
+    fingerprint = path.calculate_fingerprint(sampled=True)
+    path.text = "changed"
+    assert path.calculate_fingerprint(sampled=True) != fingerprint
+
+
+def test_tree_fingerprint(directory: Path, directory2: Path) -> None:
+    for root in (directory, directory2):
+        (root / "file").text = "content"
+        (root / "folder" / "nested").text = "nested content"
+        (root / "link").symlink_to("file")
+    assert directory.fingerprint == directory2.fingerprint
+    assert directory.fingerprint == directory.calculate_fingerprint(workers=1)
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda root: setattr(root / "file", "text", "changed"),
+        lambda root: (root / "file").rename(root / "renamed"),
+        lambda root: (root / "empty").mkdir(),
+        lambda root: (root / "link").unlink(),
+        lambda root: os.mkfifo(root / "fifo"),
+    ],
+)
+def test_tree_changes(directory: Path, change: Callable[[Path], object]) -> None:
+    (directory / "file").text = "content"
+    (directory / "link").symlink_to("file")
+    fingerprint = directory.fingerprint
+    change(directory)
+    assert directory.fingerprint != fingerprint
@@ -1,5 +1,6 @@
 import os
 from collections.abc import Callable
+from unittest.mock import patch
 
 import pytest
 
@@ -76,6 +77,26 @@ def test_copy(path: Path, path2: Path, content: bytes) -> None:
     assert path2.byte_content == content
 
 
+def test_copy_properties(path: Path, directory: Path) -> None:
+    path.touch()
+    path.tag = "tag"
+    path.mtime = 1
+    (directory / "child").touch()
+    path.copy_properties_to(directory)
+    for subpath in (directory, directory / "child"):
+        assert subpath.tag == "tag"
+        assert subpath.mtime == 1
+
+
+def test_copy_without_tag(path: Path, path2: Path) -> None:
+    path.text = "content"
+    with patch("concurrent.futures.ThreadPoolExecutor") as executor:
+        path.copy_to(path2)
+    executor.assert_not_called()
+    # a missing tag is copied as an empty tag
+    assert path2.tag == ""
+
+
 @slower_test_settings
 @byte_content
 def test_copy_if_newer_copies(path: Path, path2: Path, content: bytes) -> None:
@@ -280,6 +301,50 @@ def test_rmtree_preserve_root(directory: Path) -> None:
     directory.rmtree(remove_root=False)
 
 
+def test_rmtree_preserve_root_keeps_directory(directory: Path) -> None:
+    (directory / "child" / "grandchild").touch()
+    (directory / "file").touch()
+    inode = directory.stat().st_ino
+    directory.rmtree(remove_root=False)
+    assert directory.stat().st_ino == inode
+    assert not directory.has_children
+
+
+def test_rmtree_preserve_root_missing_ok(directory: Path) -> None:
+    directory.rmdir()
+    directory.rmtree(remove_root=False, missing_ok=True)
+    assert directory.is_dir()
+
+
+def test_rmtree_preserve_root_not_existing(directory: Path) -> None:
+    directory.rmdir()
+    with pytest.raises(FileNotFoundError):
+        directory.rmtree(remove_root=False)
+
+
+def test_clear_missing_directory_ignoring_errors(directory: Path) -> None:
+    directory.rmdir()
+    directory.clear(ignore_errors=True)
+    assert directory.is_dir()
+    directory.rmdir()
+    directory.rmtree(remove_root=False, ignore_errors=True)
+    assert directory.is_dir()
+
+
+def test_clear_keep(directory: Path) -> None:
+    kept_paths = directory / "kept", directory / "folder" / "kept"
+    removed_paths = directory / "removed", directory / "folder" / "removed"
+    for path in (*kept_paths, *removed_paths):
+        path.touch()
+    (directory / "kept_folder" / "child").touch()
+
+    directory.clear(keep=["kept", "kept_folder", str(Path("folder") / "kept")])
+
+    assert all(path.exists() for path in kept_paths)
+    assert not any(path.exists() for path in removed_paths)
+    assert (directory / "kept_folder" / "child").exists()
+
+
 @slower_test_settings
 @dictionary_content
 def test_yaml_update(content: dict[str, str]) -> None:
@@ -0,0 +1,61 @@
+import subprocess
+import sys
+
+import pytest
+
+# modules that are only imported when the functionality that needs them is used
+lazy_modules = (
+    "asyncio",
+    "blake3",
+    "bz2",
+    "concurrent.futures",
+    "dataclasses",
+    "getpass",
+    "gzip",
+    "hashlib",
+    "inspect",
+    "json",
+    "lz4",
+    "lzma",
+    "mimetypes",
+    "shlex",
+    "shutil",
+    "sqlite3",
+    "subprocess",
+    "superpathlib.aio",
+    "superpathlib.appender",
+    "superpathlib.bulk",
+    "superpathlib.catalog",
+    "superpathlib.line_index",
+    "superpathlib.compact",
+    "superpathlib.duplicates",
+    "superpathlib.hashing",
+    "superpathlib.snapshot",
+    "superpathlib.tail",
+    "superpathlib.tags",
+    "superpathlib.watch",
+    "typing_extensions",
+    "xxhash",
+    "zstandard",
+)
+
+script = """
+import sys
+
+modules = set(sys.modules)
+import superpathlib
+
+print("\\n".join(set(sys.modules) - modules))
+"""
+
+
+@pytest.fixture(scope="module")
+def imported_modules() -> set[str]:
+    command = (sys.executable, "-c", script)
+    output = subprocess.check_output(command, text=True)  # noqa: S603
+    return set(output.splitlines())
+
+
+@pytest.mark.parametrize("module", lazy_modules)
+def test_lazy_module(imported_modules: set[str], module: str) -> None:
+    assert module not in imported_modules
@@ -0,0 +1,89 @@
+import os
+
+import pytest
+
+from superpathlib import Path, base, instrumentation
+from superpathlib.compact import CompactPath
+from superpathlib.encryption import EncryptedPath
+from superpathlib.instrumentation import OperationStats
+
+
+def test_recording(path: Path) -> None:
+    with instrumentation.recording() as recorder:
+        path.text = "content"
+        assert path.text == "content"
+        assert path.size == len("content")
+    stats = recorder.snapshot()
+    assert stats["text.setter"].bytes_written == len("content")
+    assert stats["text"].bytes_read == len("content")
+    assert stats["text"].calls == 1
+    assert stats["read_text"].calls == 1
+    assert stats["size"].stat_calls == 1
+    assert stats["stat"].calls >= 1
+    assert sum(stats["text"].latency_histogram.values()) == 1
+    assert stats["text"].mean_time > 0
+
+    recorder.reset()
+    assert recorder.snapshot() == {}
+    assert OperationStats().mean_time == 0
+
+
+def test_hooks_removed(path: Path) -> None:
+    original_stat = os.stat
+    first_recorder = instrumentation.start()
+    second_recorder = instrumentation.start()
+    # other code that uses os is not affected
+    assert os.stat is original_stat
+    instrumentation.stop(first_recorder)
+    path.byte_content = b"content"
+    assert "read_bytes" in vars(base.Path)
+    instrumentation.stop(second_recorder)
+    assert "read_bytes" not in vars(base.Path)
+    assert "stat" not in vars(base.Path)
+    assert "write_bytes" in second_recorder.snapshot()
+    assert first_recorder.snapshot() == {}
+
+
+def test_errors(path: Path) -> None:
+    path.touch()
+    with instrumentation.recording() as recorder:
+        with pytest.raises(IsADirectoryError):
+            path.parent.read_bytes()
+        with pytest.raises(NotADirectoryError):
+            list(path.iterdir(missing_ok=False))
+    stats = recorder.snapshot()
+    assert stats["read_bytes"].errors == 1
+    assert stats["iterdir"].errors == 1
+
+
+def test_find(directory: Path) -> None:
+    (directory / "folder" / "file").touch()
+    with instrumentation.recording() as recorder:
+        assert len(list(directory.find())) == 3  # noqa: PLR2004
+    stats = recorder.snapshot()
+    assert stats["find"].calls == 1
+    assert stats["find"].stat_calls > 0
+    assert stats["iterdir"].calls == 2  # noqa: PLR2004
+
+
+def test_encrypted(encryption_path: EncryptedPath) -> None:
+    with instrumentation.recording() as recorder:
+        encryption_path.byte_content = b"content"
+        assert encryption_path.byte_content == b"content"
+    stats = recorder.snapshot()
+    assert stats["EncryptedPath.write_bytes"].calls == 1
+    assert stats["EncryptedPath.read_bytes"].bytes_read > 0
+
+
+def test_compact_path(path: Path) -> None:
+    compact_path = CompactPath(path)
+    original_text = vars(CompactPath)["text"]
+    with instrumentation.recording() as recorder:
+        compact_path.text = "content"
+        assert compact_path.text == "content"
+        assert compact_path.size == len("content")
+    stats = recorder.snapshot()
+    assert stats["text"].bytes_read == len("content")
+    assert stats["text.setter"].calls == 1
+    assert stats["size"].stat_calls == 1
+    assert vars(CompactPath)["text"] is original_text
@@ -0,0 +1,148 @@
+import errno
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from superpathlib import Path
+from superpathlib.line_index import LineIndex
+
+lines = [f"line {index}" for index in range(100)]
+
+
+@pytest.fixture
+def corpus(directory: Path) -> Path:
+    path = directory / "corpus.txt"
+    path.lines = lines
+    return path
+
+
+def test_line(corpus: Path) -> None:
+    assert corpus.line(0) == lines[0]
+    assert corpus.line(42) == lines[42]
+    assert corpus.line(-1) == lines[-1]
+    with pytest.raises(IndexError):
+        corpus.line(len(lines))
+
+
+def test_line_range(corpus: Path) -> None:
+    assert corpus.line_range(10, 13) == lines[10:13]
+    assert corpus.line_range(95) == lines[95:]
+    assert corpus.line_range(-2) == lines[-2:]
+    assert corpus.line_range(5, 5) == []
+
+
+def test_sidecar(corpus: Path) -> None:
+    with corpus.line_index() as index:
+        assert len(index) == len(lines)
+    sidecar = corpus.with_name(f".{corpus.name}.lines")
+    assert sidecar.exists()
+    mtime = sidecar.mtime
+    with corpus.line_index() as index:
+        assert len(index) == len(lines)
+    assert sidecar.mtime == mtime
+
+
+def test_append(corpus: Path) -> None:
+    with corpus.line_index() as index:
+        corpus.append_lines(["appended"])
+        assert len(index) == len(lines)
+        index.refresh()
+        assert len(index) == len(lines) + 1
+        assert index.line(-1) == "appended"
+        assert index.line(-2) == lines[-1]
+
+
+def test_interrupted_append(corpus: Path) -> None:
+    sidecar = corpus.with_name(f".{corpus.name}.lines")
+    assert corpus.line(0) == lines[0]
+    # offsets of an update that stopped before its header was written
+    with sidecar.open("ab") as index_file:
+        index_file.write(bytes(8 * 3))
+    corpus.append_lines(["appended"])
+    assert corpus.line_range(-2) == [lines[-1], "appended"]
+
+
+def test_concurrent_refresh(corpus: Path) -> None:
+    indices = [corpus.line_index() for _ in range(8)]
+    corpus.append_lines([f"appended {index}" for index in range(1000)])
+    with ThreadPoolExecutor(len(indices)) as executor:
+        list(executor.map(LineIndex.refresh, indices))
+    for index in indices:
+        assert len(index) == len(lines) + 1000
+        index.close()
+    assert corpus.line_range(-1) == ["appended 999"]
+
+
+def test_rewrite(corpus: Path) -> None:
+    assert corpus.line(1) == lines[1]
+    corpus.lines = ["rewritten", "content", "with", "more", "lines", *lines]
+    assert corpus.line(1) == "content"
+    corpus.lines = ["shorter"]
+    assert corpus.line_range() == ["shorter"]
+
+
+def test_replace(corpus: Path) -> None:
+    assert corpus.line(1) == lines[1]
+    replacement = corpus.with_name("replacement")
+    replacement.lines = [line.upper() for line in lines]
+    replacement.replace(corpus)
+    assert corpus.line(1) == lines[1].upper()
+
+
+def test_line_endings(directory: Path) -> None:
+    path = directory / "content.txt"
+    path.text = "first\r\n\nthird\n"
+    assert path.line_range() == ["first", "", "third"]
+    path.text = ""
+    assert path.line_range() == []
+
+
+def test_block_boundaries(
+    corpus: Path,
+    directory: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("superpathlib.line_index.block_size", 7)
+    index_path = directory / "index"
+    with LineIndex.open(corpus, index_path) as index:
+        assert index.lines() == lines
+    assert index_path.exists()
+
+
+@pytest.mark.parametrize(
+    "exception",
+    [PermissionError(errno.EACCES, "denied"), OSError(errno.EROFS, "read-only")],
+)
+def test_unwritable_sidecar(
+    corpus: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    exception: OSError,
+) -> None:
+    sidecar = corpus.with_name(f".{corpus.name}.lines")
+
+    def open_sidecar(*_: Any) -> int:
+        raise exception
+
+    monkeypatch.setattr("superpathlib.line_index.os.open", open_sidecar)
+    assert corpus.line(42) == lines[42]
+    assert corpus.line_range(-2) == lines[-2:]
+    with corpus.line_index() as index:
+        corpus.append_lines(["appended"])
+        index.refresh()
+        assert index.line(-1) == "appended"
+    assert not sidecar.exists()
+
+
+def test_sidecar_errors(corpus: Path) -> None:
+    sidecar = corpus.with_name(f".{corpus.name}.lines")
+    sidecar.mkdir()
+    with pytest.raises(IsADirectoryError):
+        corpus.line(0)
+
+
+def test_invalid_paths(directory: Path) -> None:
+    with pytest.raises(ValueError, match="Compressed"):
+        (directory / "content.gz").line(0)
+    with pytest.raises(FileNotFoundError):
+        (directory / "missing").line(0)
@@ -1,11 +1,21 @@
+import grp
 import hashlib
 import math
+import os
+import pwd
+import shutil
+import sys
 import time
+from unittest.mock import patch
 
+import pytest
 from hypothesis import given, strategies
 from hypothesis.strategies import lists
 
 from superpathlib import Path
+from superpathlib.disk_usage import DiskUsageScanner
+from superpathlib.filetypes import header_size
+from superpathlib.ownership import group_name, user_name
 from tests.content import byte_content, slower_test_settings, text_strategy
 from tests.utils import ignore_fixture_warning
 
@@ -44,6 +54,42 @@ def test_tag(path: Path, content: str) -> None:
     assert path.tag == content
 
 
+def test_missing_tags(path: Path) -> None:
+    path.touch()
+    assert path.tag is None
+    path.tags = []
+    assert path.tags == []
+
+
+def test_attributes_many(directory: Path) -> None:
+    paths = [directory / "first", directory / "second"]
+    for path in paths:
+        path.touch()
+    attributes = {"user.first": b"first", "user.second": None}
+    Path.set_attributes_many(dict.fromkeys(paths, attributes), workers=1)
+    Path.set_attributes_many({paths[1]: {"user.xdg.tags": b"tag,other"}})
+    names = ["user.first", "user.second", "user.xdg.tags"]
+    assert Path.attributes_many(paths, names) == [
+        {"user.first": b"first"},
+        {"user.first": b"first", "user.xdg.tags": b"tag,other"},
+    ]
+    assert paths[1].tags == ["tag", "other"]
+    Path.set_attributes_many({paths[1]: {"user.xdg.tags": None}})
+    assert paths[1].tag is None
+
+
+@pytest.mark.skipif(
+    sys.platform != "linux",
+    reason="error of invalid attribute names differs per platform",
+)
+def test_invalid_attributes(path: Path) -> None:
+    path.touch()
+    with pytest.raises(OSError, match="Operation not supported"):
+        Path.attributes_many([path], ["invalid.name"])
+    with pytest.raises(OSError, match="Operation not supported"):
+        Path.set_attributes_many({path: {"invalid.name": None}})
+
+
 @slower_test_settings
 @byte_content
 def test_size(path: Path, content: bytes) -> None:
@@ -78,3 +124,143 @@ def test_is_root(directory: Path) -> None:
 def test_default(path: Path) -> None:
     path.unlink()
     assert path.mtime == 0
+
+
+def test_number_of_children_counts_entries(directory: Path) -> None:
+    (directory / "file").touch()
+    (directory / "folder" / "file").touch()
+    assert directory.number_of_children == 2  # noqa: PLR2004
+    assert directory.has_children
+
+
+def test_number_of_children_file(path: Path) -> None:
+    assert path.number_of_children == 0
+    assert not path.has_children
+
+
+def test_children_many(directory: Path, path: Path) -> None:
+    (directory / "file").touch()
+    missing_path = directory / "missing"
+    paths = [directory, path, missing_path]
+    assert Path.number_of_children_many(paths) == [1, 0, 0]
+    assert Path.has_children_many(paths, workers=1) == [True, False, False]
+    assert Path.is_empty_many(paths) == [False, True, True]
+
+
+def test_tree_size(directory: Path) -> None:
+    (directory / "file").byte_content = b"0" * 10
+    (directory / "folder" / "file").byte_content = b"0" * 20
+    directory_sizes = sum(
+        path.size for path in directory.find(Path.is_dir, recurse_on_match=True)
+    )
+    assert directory.tree_size == 30 + directory_sizes
+
+
+def test_tree_size_file(path: Path) -> None:
+    path.byte_content = b"content"
+    assert path.tree_size == len(b"content")
+    path.unlink()
+    assert path.tree_size == 0
+
+
+def test_disk_usage_hardlinks(directory: Path) -> None:
+    path = directory / "file"
+    path.byte_content = b"0" * 10
+    usage = directory.disk_usage()
+    (directory / "link").hardlink_to(path)
+    assert directory.disk_usage().apparent_size == usage.apparent_size
+    assert directory.disk_usage().allocated_size >= usage.allocated_size > 0
+
+
+def test_disk_usage_cache(directory: Path) -> None:
+    folder = directory / "folder"
+    (folder / "file").byte_content = b"0" * 10
+    scanner = DiskUsageScanner(workers=2)
+    usage = directory.disk_usage(scanner=scanner)
+    # subtotals of unchanged directories are reused without checking files
+    with patch("os.lstat", wraps=os.lstat) as lstat:
+        assert directory.disk_usage(scanner=scanner) == usage
+    stat_paths = {call.args[0] for call in lstat.call_args_list}
+    assert stat_paths == {str(directory), str(folder)}
+    (folder / "added").byte_content = b"0" * 5
+    assert (
+        directory.disk_usage(scanner=scanner).apparent_size == usage.apparent_size + 5
+    )
+    shutil.rmtree(folder)
+    directory.disk_usage(scanner=scanner)
+    assert list(scanner.cache) == [str(directory)]
+
+
+def test_disk_usage_cache_with_file_checks(directory: Path) -> None:
+    path = directory / "folder" / "file"
+    path.byte_content = b"0" * 10
+    scanner = DiskUsageScanner(check_files=True)
+    usage = directory.disk_usage(scanner=scanner)
+    path.byte_content = b"0" * 20
+    # size changes of files are detected without listing directories again
+    with patch("os.scandir") as scandir:
+        grown_usage = directory.disk_usage(scanner=scanner)
+    scandir.assert_not_called()
+    assert grown_usage.apparent_size == usage.apparent_size + 10
+    # files are listed when the cache was filled without checking files
+    scanner = DiskUsageScanner()
+    directory.disk_usage(scanner=scanner)
+    scanner.check_files = True
+    assert directory.disk_usage(scanner=scanner) == grown_usage
+
+
+def test_owner(path: Path) -> None:
+    owner = pwd.getpwuid(os.getuid()).pw_name
+    assert path.owner() == owner
+    assert path.group() == grp.getgrgid(os.getgid()).gr_name
+    assert Path.owners_many([path, path.parent]) == [owner, path.parent.owner()]
+
+
+def test_unknown_owner() -> None:
+    unknown_id = 2**31
+    assert user_name(unknown_id) == str(unknown_id)
+    assert group_name(unknown_id) == str(unknown_id)
+
+
+def test_filetypes_fallback(path: Path) -> None:
+    assert path.with_suffix(".docx").filetype == "application"
+    assert path.with_suffix(".unknown_extension").filetype is None
+
+
+def test_filetype_content(directory: Path) -> None:
+    contents = {
+        "image": b"\x89PNG\r\n\x1a\n" + bytes(range(256)),
+        "video": b"\x00\x00\x00\x18ftypmp42",
+        "audio": b"RIFF\x00\x00\x00\x00WAVEfmt ",
+        "application": b"%PDF-1.7",
+        # multibyte character is cut off at the end of the header
+        "text": ("a" * (header_size - 1) + "é").encode(),
+    }
+    for filetype, content in contents.items():
+        path = directory / filetype
+        path.byte_content = content
+        assert path.filetype == filetype
+        assert path.filetype == filetype
+
+    binary_path = directory / "binary"
+    binary_path.byte_content = b"\x00\xff"
+    paths = [directory / filetype for filetype in contents]
+    paths.extend((binary_path, directory, directory / "missing"))
+    expected_filetypes = [*contents, None, None, None]
+    assert Path.filetypes_many(paths) == expected_filetypes
+
+
+def test_filetype_invalid_text(path: Path) -> None:
+    path.byte_content = b"\xff" * 10
+    assert path.filetype is None
+    path.byte_content = b"hello\xff"
+    assert path.filetype is None
+    path.byte_content = "truncated é".encode()[:-1]
+    assert path.filetype is None
+
+
+def test_filetype_cache_size(directory: Path) -> None:
+    with patch("superpathlib.filetypes.cache_size", 1):
+        for name in ("first", "second"):
+            (directory / name).text = name
+            assert (directory / name).filetype == "text"
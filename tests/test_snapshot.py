@@ -0,0 +1,129 @@
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from superpathlib import Path
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "without_numpy"])
+def numpy_available(request: pytest.FixtureRequest) -> Iterator[None]:
+    if request.param:
+        yield
+    else:
+        with patch.dict("sys.modules", {"numpy": None}):
+            yield
+
+
+def test_snapshot_paths(tree: Path) -> None:
+    snapshot = tree.snapshot()
+    paths = tree.find(lambda path: path != tree, recurse_on_match=True)
+    assert list(snapshot.paths()) == sorted(paths)
+    assert all(isinstance(path, Path) for path in snapshot.paths())
+
+
+def test_snapshot_metadata(tree: Path) -> None:
+    snapshot = tree.snapshot()
+    for index, path in enumerate(snapshot.paths()):
+        assert snapshot.sizes[index] == path.stat().st_size
+        assert snapshot.inodes[index] == path.stat().st_ino
+
+
+def test_snapshot_tags(tree: Path) -> None:
+    (tree / "empty.txt").tag = "tag"
+    snapshot = tree.snapshot(include_tags=True)
+    assert snapshot.tags == ["tag", None, None, None, None]
+
+
+@pytest.mark.usefixtures("numpy_available")
+def test_snapshot_select(tree: Path) -> None:
+    snapshot = tree.snapshot()
+    files = snapshot.select(file_type="file", min_size=1)
+    assert {path.name for path in snapshot.paths(files)} == {"small.txt", "large.bin"}
+    recent = snapshot.select(modified_after=2, max_size=10, suffix=".txt")
+    assert {path.name for path in snapshot.paths(recent)} == {"empty.txt", "small.txt"}
+    assert snapshot.select(modified_before=2) == files[:1]
+
+
+@pytest.mark.usefixtures("numpy_available")
+def test_snapshot_owners(tree: Path) -> None:
+    snapshot = tree.snapshot()
+    owner = tree.owner()
+    assert snapshot.owners() == [owner] * len(snapshot)
+    assert snapshot.groups([0]) == [tree.group()]
+    assert snapshot.owners([0]) == [owner]
+    assert snapshot.groups() == [tree.group()] * len(snapshot)
+    assert snapshot.select(owner=owner) == list(range(len(snapshot)))
+
+
+@pytest.mark.usefixtures("numpy_available")
+def test_snapshot_sort(tree: Path) -> None:
+    snapshot = tree.snapshot()
+    files = snapshot.select(file_type="file")
+    names = [snapshot.names[index] for index in snapshot.sort(indices=files)]
+    assert names == ["empty.txt", "small.txt", "large.bin"]
+    ordered = snapshot.sort("mtimes", reverse=True)
+    assert snapshot.names[ordered[-1]] == "large.bin"
+
+
+@pytest.mark.usefixtures("numpy_available")
+def test_snapshot_total_size(tree: Path) -> None:
+    snapshot = tree.snapshot()
+    files = snapshot.select(file_type="file")
+    assert snapshot.total_size(files) == len("content") + 100
+    assert snapshot.total_size() >= snapshot.total_size(files)
+
+
+def test_snapshot_diff(tree: Path) -> None:
+    snapshot = tree.snapshot()
+    (tree / "empty.txt").unlink()
+    (tree / "added.txt").touch()
+    (tree / "folder" / "small.txt").text = "modified content"
+    moved_path = tree / "folder" / "nested" / "large.bin"
+    moved_path.rename(tree / "moved.bin")
+
+    diff = snapshot.diff()
+    assert diff.added == [tree / "added.txt"]
+    assert diff.removed == [tree / "empty.txt"]
+    assert diff.modified == [tree / "folder" / "small.txt"]
+    assert diff.moved == [(moved_path, tree / "moved.bin")]
+    assert tree.snapshot().diff() == type(diff)()
+
+
+def test_snapshot_diff_moved_directory(tree: Path) -> None:
+    snapshot = tree.snapshot()
+    (tree / "folder").rename(tree / "renamed")
+    diff = snapshot.diff(tree.snapshot())
+    assert diff.moved == [(tree / "folder", tree / "renamed")]
+    assert not diff.added
+    assert not diff.removed
+
+
+def test_snapshot_diff_with_symlinks(tree: Path) -> None:
+    (tree / "link.txt").symlink_to(tree / "folder" / "small.txt")
+    snapshot = tree.snapshot(follow_symlinks=True)
+    assert snapshot.follow_symlinks
+    diff = snapshot.diff()
+    assert diff == type(diff)()
+
+
+def test_snapshot_diff_without_move_detection(tree: Path) -> None:
+    snapshot = tree.snapshot()
+    (tree / "empty.txt").rename(tree / "renamed.txt")
+    diff = snapshot.diff(detect_moves=None)
+    assert diff.added == [tree / "renamed.txt"]
+    assert diff.removed == [tree / "empty.txt"]
+
+
+def test_snapshot_diff_content_moves(tree: Path) -> None:
+    snapshot = tree.snapshot(include_digests=True)
+    moved_path = tree / "folder" / "small.txt"
+    moved_path.copy_to(tree / "copy.txt")
+    moved_path.unlink()
+    diff = snapshot.diff(detect_moves="content")
+    assert diff.moved == [(moved_path, tree / "copy.txt")]
+
+
+def test_snapshot_diff_content_moves_requires_digests(tree: Path) -> None:
+    with pytest.raises(ValueError, match="digests"):
+        tree.snapshot().diff(detect_moves="content")
@@ -0,0 +1,67 @@
+import pytest
+
+from superpathlib import Path
+
+
+@pytest.fixture
+def tree(directory: Path) -> Path:
+    for name in ("first.txt", "folder/second.txt", "folder/untagged.txt"):
+        (directory / name).touch()
+    (directory / "first.txt").tag = "tag"
+    (directory / "folder" / "second.txt").tags = ["tag", "other"]
+    (directory / "broken_link").symlink_to(directory / "missing")
+    return directory
+
+
+def test_tag_index_find(tree: Path) -> None:
+    index = tree.tag_index(workers=1)
+    assert index.find("tag") == [tree / "first.txt", tree / "folder" / "second.txt"]
+    assert index.find("other") == [tree / "folder" / "second.txt"]
+    assert index.find("missing") == []
+    assert index.all_tags == ["other", "tag"]
+
+
+def test_tag_index_updates(tree: Path) -> None:
+    index = tree.tag_index()
+    (tree / "folder" / "untagged.txt").tag = "other"
+    (tree / "folder" / "second.txt").tags = []
+    Path.set_tags_many({tree / "first.txt": ["new"]})
+    assert index.find("tag") == []
+    assert index.find("other") == [tree / "folder" / "untagged.txt"]
+    assert index.find("new") == [tree / "first.txt"]
+
+    index.close()
+    (tree / "first.txt").tag = "tag"
+    assert index.find("tag") == []
+
+
+def test_tag_index_other_tree(tree: Path, path: Path) -> None:
+    index = tree.tag_index()
+    path.touch()
+    path.tag = "tag"
+    assert path not in index.find("tag")
+
+
+def test_tag_index_file(path: Path) -> None:
+    path.touch()
+    path.tag = "tag"
+    assert path.tag_index().find("tag") == [path]
+
+
+def test_tags_many(directory: Path) -> None:
+    paths = [directory / "first", directory / "second"]
+    for path in paths:
+        path.touch()
+    Path.set_tags_many({paths[0]: ["tag", 1], paths[1]: []}, workers=1)
+    assert Path.tags_many(paths) == [paths[0].tags, []]
+    assert sorted(paths[0].tags) == ["0001", "tag"]
+
+
+def test_tags_many_unreadable(path: Path) -> None:
+    path.touch()
+    path.chmod(0o200)
+    try:
+        Path.set_tags_many({path: ["tag"]})
+        assert Path.tags_many([path]) == [["tag"]]
+    finally:
+        path.chmod(0o600)
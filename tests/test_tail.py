@@ -0,0 +1,139 @@
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from superpathlib import Path
+from superpathlib.tail import read_tail_lines
+
+lines = [f"line {index}" for index in range(1000)]
+
+
+@pytest.fixture
+def log_path(path: Path) -> Path:
+    path.lines = lines
+    return path
+
+
+def test_head(log_path: Path) -> None:
+    assert log_path.head(3) == lines[:3]
+    assert log_path.head(0) == []
+    assert log_path.head_bytes(4) == b"line"
+
+
+def test_tail(log_path: Path) -> None:
+    assert log_path.tail(3) == lines[-3:]
+    assert log_path.tail(0) == []
+    assert log_path.tail(2000) == lines
+    assert log_path.tail_bytes(3) == b"999"
+    assert log_path.tail_bytes(0) == b""
+    with pytest.raises(ValueError, match="negative"):
+        log_path.tail_bytes(-2)
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 1 << 16])
+@pytest.mark.parametrize("trailing_newline", [False, True])
+def test_tail_blocks(
+    log_path: Path,
+    block_size: int,
+    *,
+    trailing_newline: bool,
+) -> None:
+    if trailing_newline:
+        log_path.text += "\n"
+    assert read_tail_lines(log_path, 5, block_size) == lines[-5:]
+
+
+def test_missing_file(path: Path) -> None:
+    path.unlink()
+    assert path.head() == []
+    assert path.tail() == []
+    assert path.tail_bytes(10) == b""
+
+
+def test_compressed(directory: Path) -> None:
+    path = directory / "log.gz"
+    path.lines = lines
+    assert path.head(2) == lines[:2]
+    assert path.tail(2) == lines[-2:]
+    assert path.tail_bytes(3) == b"999"
+    assert path.tail_bytes(10**6) == "\n".join(lines).encode()
+    assert path.tail_bytes(0) == b""
+
+
+def test_tails_many(log_path: Path, path2: Path) -> None:
+    path2.lines = ["other"]
+    assert Path.tails_many([log_path, path2], 1) == [lines[-1:], ["other"]]
+
+
+@pytest.fixture
+def followed_lines(log_path: Path) -> Iterator[Iterator[str]]:
+    log_path.text += "\n"
+    followed_lines = log_path.follow(2, interval=0.001)
+    yield followed_lines
+    followed_lines.close()  # type: ignore[attr-defined]
+
+
+def test_follow(log_path: Path, followed_lines: Iterator[str]) -> None:
+    assert [next(followed_lines), next(followed_lines)] == lines[-2:]
+    log_path.append_text("new")
+    timer = threading.Timer(0.01, log_path.append_text, args=(" line\r\nnext\n",))
+    timer.start()
+    assert next(followed_lines) == "new line"
+    assert next(followed_lines) == "next"
+
+
+def test_follow_partial_lines(path: Path) -> None:
+    path.byte_content = b"line1\nline2\npart"
+    followed_lines = path.follow(1, interval=0.001)
+    assert next(followed_lines) == "line2"
+    path.append_bytes(b"ial\n")
+    assert next(followed_lines) == "partial"
+    path.append_bytes(b"line4\nhal")
+    assert next(followed_lines) == "line4"
+    path.append_bytes(b"f\nline6\n")
+    assert [next(followed_lines), next(followed_lines)] == ["half", "line6"]
+    followed_lines.close()  # type: ignore[attr-defined]
+
+
+def test_follow_leading_separators(path: Path) -> None:
+    path.lines = ["first", "second"]
+    followed_lines = path.follow(1, interval=0.001, leading_separators=True)
+    assert next(followed_lines) == "second"
+    path.append_lines(["third"])
+    assert next(followed_lines) == "third"
+    path.append_lines(["fourth", "fifth"])
+    assert [next(followed_lines), next(followed_lines)] == ["fourth", "fifth"]
+    # content that continues a yielded line is not lost
+    path.append_text("continued")
+    assert next(followed_lines) == "continued"
+    followed_lines.close()  # type: ignore[attr-defined]
+
+
+def test_follow_rotation(log_path: Path, followed_lines: Iterator[str]) -> None:
+    assert next(followed_lines) == lines[-2]
+    assert next(followed_lines) == lines[-1]
+    log_path.append_text("partial")
+    rotated_path = log_path.with_suffix(".1")
+    timer = threading.Timer(0.01, log_path.rename, args=(rotated_path,))
+    timer.start()
+    threading.Timer(0.05, log_path.append_text, args=("rotated\n",)).start()
+    assert next(followed_lines) == "rotated"
+    # truncation is detected when the size is smaller than the read content
+    log_path.text = "new\n"
+    assert next(followed_lines) == "new"
+    rotated_path.unlink()
+
+
+def test_follow_missing_file(path: Path) -> None:
+    path.unlink()
+    followed_lines = path.follow(interval=0.001)
+    threading.Timer(0.01, path.append_text, args=("created\n",)).start()
+    assert next(followed_lines) == "created"
+
+
+def test_follow_empty_file_with_leading_separators(path: Path) -> None:
+    followed_lines = path.follow(leading_separators=True, interval=0.001)
+    threading.Timer(0.01, path.append_lines, args=(["first"],)).start()
+    assert next(followed_lines) == "first"
+    followed_lines.close()  # type: ignore[attr-defined]
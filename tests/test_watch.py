@@ -0,0 +1,316 @@
+import errno
+import gc
+import logging
+import sys
+import threading
+import time
+import typing
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from superpathlib import Path
+from superpathlib.watch import (
+    Change,
+    Dispatcher,
+    InotifyBackend,
+    Subscription,
+    Watcher,
+    coalesce,
+    dispatcher,
+)
+
+TIMEOUT = 5
+
+linux_only = pytest.mark.skipif(
+    sys.platform != "linux",
+    reason="inotify is only available on Linux",
+)
+
+
+@pytest.fixture(
+    params=[pytest.param(False, marks=linux_only), True],
+    ids=["inotify", "polling"],
+)
+def polling(request: pytest.FixtureRequest) -> bool:
+    return bool(request.param)
+
+
+@pytest.fixture
+def watcher(directory: Path, polling: bool) -> Iterator[Watcher[Path]]:  # noqa: FBT001
+    (directory / "folder").mkdir()
+    with Watcher[Path](polling=polling, poll_interval=0.01) as watcher:
+        watcher.add(directory)
+        yield watcher
+
+
+def read_changes(watcher: Watcher[Path]) -> set[Change[Path]]:
+    return set(watcher.read(timeout=TIMEOUT))
+
+
+def test_watch_added(directory: Path, watcher: Watcher[Path]) -> None:
+    path = directory / "folder" / "added.txt"
+    path.text = "content"
+    assert read_changes(watcher) == {Change(path, "added")}
+
+
+def test_watch_modified_and_removed(directory: Path, watcher: Watcher[Path]) -> None:
+    path = directory / "folder" / "file.txt"
+    path.byte_content = b""
+    read_changes(watcher)
+    path.text = "content"
+    assert read_changes(watcher) == {Change(path, "modified")}
+    path.unlink()
+    assert read_changes(watcher) == {Change(path, "removed")}
+
+
+def test_watch_new_directory(directory: Path, watcher: Watcher[Path]) -> None:
+    subdirectory = directory / "new"
+    subdirectory.mkdir()
+    read_changes(watcher)
+    path = subdirectory / "file.txt"
+    path.touch()
+    assert Change(path, "added") in read_changes(watcher)
+    subdirectory.rmtree()
+    assert Change(subdirectory, "removed") in read_changes(watcher)
+
+
+def test_watch_moved_directory(
+    directory: Path,
+    directory2: Path,
+    watcher: Watcher[Path],
+) -> None:
+    subdirectory = directory / "folder"
+    moved_directory = directory2 / "folder"
+    subdirectory.rename(moved_directory)
+    assert Change(subdirectory, "removed") in read_changes(watcher)
+    (moved_directory / "file.txt").touch()
+    assert watcher.read(timeout=0.05) == []
+
+
+def test_watch_no_changes(watcher: Watcher[Path]) -> None:
+    assert watcher.read(timeout=0.01) == []
+
+
+def test_watch_remove(directory: Path, watcher: Watcher[Path]) -> None:
+    watcher.remove(directory)
+    (directory / "file.txt").touch()
+    assert watcher.read(timeout=0.05) == []
+
+
+def test_watch_file(path: Path, polling: bool) -> None:  # noqa: FBT001
+    with path.watch(polling=polling) as watcher:
+        path.with_name(f"other_{path.name}").touch(exist_ok=True)
+        path.text = "content"
+        assert read_changes(watcher) == {Change(path, "modified")}
+        path.unlink()
+        assert read_changes(watcher) == {Change(path, "removed")}
+        path.touch()
+        assert read_changes(watcher) == {Change(path, "added")}
+        path.with_name(f"other_{path.name}").unlink()
+
+
+def test_watch_removed_root(directory: Path) -> None:
+    with directory.watch() as watcher:
+        directory.rmdir()
+        assert Change(directory, "removed") in read_changes(watcher)
+
+
+def test_watch_iteration(directory: Path) -> None:
+    with directory.watch(polling=True, recursive=False) as watcher:
+        (directory / "file.txt").touch()
+        assert next(iter(watcher)) == [Change(directory / "file.txt", "added")]
+
+
+@linux_only
+def test_watch_missing_parent(directory: Path) -> None:
+    with pytest.raises(OSError, match="Cannot watch"):
+        (directory / "missing" / "file.txt").watch()
+
+
+def test_watch_files_in_same_directory(
+    directory: Path,
+    polling: bool,  # noqa: FBT001
+) -> None:
+    paths = [directory / "first.txt", directory / "second.txt"]
+    with Watcher[Path](polling=polling, poll_interval=0.01) as watcher:
+        for path in paths:
+            watcher.add(path)
+        watcher.add(paths[0])
+        watcher.add(directory, recursive=False)
+        paths[0].text = "content"
+        changes = read_changes(watcher)
+        assert changes == {Change(paths[0], "added")}
+        watcher.remove(paths[0])
+        watcher.remove(directory)
+        paths[1].text = "content"
+        assert read_changes(watcher) == {Change(paths[1], "added")}
+        watcher.remove(paths[1])
+        paths[0].text = "new content"
+        assert watcher.read(timeout=0.05) == []
+
+
+def test_fallback_without_inotify(directory: Path) -> None:
+    with (
+        patch("ctypes.CDLL", side_effect=OSError("libc not found")),
+        Watcher[Path](polling=False, poll_interval=0.01) as watcher,
+    ):
+        assert watcher.polling
+        watcher.add(directory)
+        (directory / "file.txt").touch()
+        assert read_changes(watcher) == {Change(directory / "file.txt", "added")}
+
+
+@linux_only
+def test_fallback_at_watch_limit(directory: Path) -> None:
+    folder = directory / "folder"
+    folder.mkdir()
+    error = OSError(errno.ENOSPC, "Cannot watch")
+    with Watcher[Path](polling=False, poll_interval=0.01) as watcher:
+        watcher.add(directory / "file.txt")
+        with patch.object(InotifyBackend, "add", side_effect=error):
+            watcher.add(folder)
+        assert watcher.polling
+        (folder / "file.txt").touch()
+        (directory / "file.txt").touch()
+        assert read_changes(watcher) == {
+            Change(folder / "file.txt", "added"),
+            Change(directory / "file.txt", "added"),
+        }
+
+
+@linux_only
+def test_other_watch_errors_are_raised(directory: Path) -> None:
+    error = OSError(errno.EACCES, "Cannot watch")
+    with (
+        Watcher[Path](polling=False) as watcher,
+        patch.object(InotifyBackend, "add", side_effect=error),
+        pytest.raises(OSError, match="Cannot watch"),
+    ):
+        watcher.add(directory)
+
+
+def test_coalesce(path: Path) -> None:
+    changes = [
+        Change(path, "added"),
+        Change(path, "modified"),
+        Change(path, "removed"),
+        Change(path.parent, "removed"),
+        Change(path.parent, "added"),
+    ]
+    assert coalesce(changes) == [Change(path.parent, "modified")]
+
+
+def test_subscribe(directory: Path) -> None:
+    received: list[Change[Path]] = []
+    event = threading.Event()
+
+    def callback(changes: list[Change[Path]]) -> None:
+        received.extend(changes)
+        event.set()
+
+    subscription = directory.subscribe(callback)
+    path = directory / "file.txt"
+    path.touch()
+    assert event.wait(TIMEOUT)
+    subscription.cancel()
+    assert Change(path, "added") in received
+
+
+def test_failing_callback(directory: Path, caplog: pytest.LogCaptureFixture) -> None:
+    event = threading.Event()
+
+    def failing_callback(_: list[Change[Path]]) -> None:
+        raise RuntimeError
+
+    subscriptions = [
+        directory.subscribe(failing_callback),
+        directory.subscribe(lambda _: event.set()),
+    ]
+    with caplog.at_level(logging.ERROR, logger="superpathlib.watch"):
+        (directory / "file.txt").touch()
+        assert event.wait(TIMEOUT)
+    for subscription in subscriptions:
+        subscription.cancel()
+    assert "Subscription callback failed" in caplog.text
+
+
+def test_failing_watcher(path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    failing_dispatcher = Dispatcher()
+    subscription = Subscription(path, print)
+    failing_dispatcher.subscriptions.append(subscription)
+    watcher = MagicMock()
+    watcher.__iter__.side_effect = PermissionError
+    failing_dispatcher.watcher = watcher
+    with caplog.at_level(logging.ERROR, logger="superpathlib.watch"):
+        failing_dispatcher.run(watcher)
+    assert "Watcher failed" in caplog.text
+    assert subscription.failed
+    assert failing_dispatcher.watcher is None
+    watcher.close.assert_called_once()
+    failing_dispatcher.unsubscribe(subscription)
+    # failures of replaced watchers do not affect current subscriptions
+    failing_dispatcher.subscriptions.append(subscription := Subscription(path, print))
+    failing_dispatcher.fail(watcher)
+    assert not subscription.failed
+
+
+def test_watched_content_after_failed_subscription(path: Path) -> None:
+    watched_content = typing.cast("Any", path.create_watched_content({}))
+
+    class Storage:
+        content = watched_content
+
+    storage = Storage()
+    assert storage.content == {}
+    watched_content.subscription.failed = True
+    path.yaml = {"key": "value"}
+    path.mtime += 1
+    assert storage.content == {"key": "value"}
+    watched_content.subscription.cancel()
+
+
+def test_watched_content_is_unsubscribed(path: Path) -> None:
+    number_of_subscriptions = len(dispatcher.subscriptions)
+    watched_content = path.create_watched_content(default=0)
+    assert len(dispatcher.subscriptions) == number_of_subscriptions + 1
+    del watched_content
+    gc.collect()
+    assert len(dispatcher.subscriptions) == number_of_subscriptions
+
+
+def test_watched_content_of_files_in_same_directory(directory: Path) -> None:
+    paths = [directory / "first.yaml", directory / "second.yaml"]
+    contents = [typing.cast("Any", path.create_watched_content({})) for path in paths]
+
+    class Storage:
+        first = contents[0]
+        second = contents[1]
+
+    storage = Storage()
+    assert storage.first == storage.second == {}
+    for path in paths:
+        path.yaml = {"key": path.stem}
+    deadline = time.monotonic() + TIMEOUT
+    while not all(content.changed for content in contents):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert storage.first == {"key": "first"}
+    assert storage.second == {"key": "second"}
+
+
+def test_watched_content(path: Path) -> None:
+    watched_content = typing.cast("Any", path.watched_content)
+
+    class Storage:
+        content = watched_content
+
+    storage = Storage()
+    assert storage.content == {}
+    path.yaml = {"key": "value"}
+    deadline = time.monotonic() + TIMEOUT
+    while not watched_content.changed and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert storage.content == {"key": "value"}